@@ -7,7 +7,6 @@
 import logging
 import json
 import os
-import requests
 from urllib.parse import urlencode
 from typing import Optional, Union, Annotated
 from mcp.types import TextContent
@@ -19,8 +18,10 @@ logger = logging.getLogger(__name__)
 
 # 유틸리티 함수들 import
 from .law_tools import (
+    _clamp_pagination,
+    _SESSION,
+    _json_loads,
     _make_legislation_request,
-    _generate_api_url,
     _format_search_results
 )
 
@@ -31,15 +32,15 @@ from .law_tools import (
 @mcp.tool(name="search_administrative_rule", description="행정규칙을 검색합니다. 각 부처의 행정규칙과 예규를 제공합니다.")
 def search_administrative_rule(query: Optional[str] = None, search: int = 2, display: int = 20, page: int = 1) -> TextContent:
     """행정규칙 검색"""
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
-    params = {"target": "admrul", "query": search_query, "search": search, "display": min(display, 100), "page": page}
+    params = {"target": "admrul", "query": search_query, "search": search, "display": display, "page": page}
     try:
         data = _make_legislation_request("admrul", params)
-        url = _generate_api_url("admrul", params)
-        result = _format_search_results(data, "admrul", search_query, min(display, 100))
+        result = _format_search_results(data, "admrul", search_query, display)
         return TextContent(type="text", text=result)
     except Exception as e:
         return TextContent(type="text", text=f"행정규칙 검색 중 오류: {str(e)}")
@@ -185,15 +186,15 @@ def _format_administrative_rule_detail(data: dict, rule_id: str) -> str:
 @mcp.tool(name="search_administrative_rule_comparison", description="행정규칙 신구법 비교를 검색합니다. 행정규칙의 개정 전후 비교 정보를 제공합니다.")
 def search_administrative_rule_comparison(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """행정규칙 신구법 비교 목록 조회 (업데이트됨)"""
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
-    params = {"target": "admrulOldAndNew", "query": search_query, "display": min(display, 100), "page": page}
+    params = {"target": "admrulOldAndNew", "query": search_query, "display": display, "page": page}
     try:
         data = _make_legislation_request("admrulOldAndNew", params)
-        url = _generate_api_url("admrulOldAndNew", params)
-        result = _format_search_results(data, "admrulOldAndNew", search_query, min(display, 100))
+        result = _format_search_results(data, "admrulOldAndNew", search_query, display)
         return TextContent(type="text", text=result)
     except Exception as e:
         return TextContent(type="text", text=f"행정규칙 신구법 비교 검색 중 오류: {str(e)}")
@@ -204,7 +205,6 @@ def get_administrative_rule_comparison_detail(comparison_id: Union[str, int]) ->
     params = {"target": "admrulOldAndNew", "ID": str(comparison_id)}
     try:
         data = _make_legislation_request("admrulOldAndNew", params, is_detail=True)
-        url = _generate_api_url("admrulOldAndNew", params)
         result = _format_search_results(data, "admrulOldAndNew", f"비교ID:{comparison_id}", 50)
         return TextContent(type="text", text=result)
     except Exception as e:
@@ -217,15 +217,15 @@ def get_administrative_rule_comparison_detail(comparison_id: Union[str, int]) ->
 @mcp.tool(name="search_local_ordinance", description="자치법규(조례, 규칙)를 검색합니다. 지방자치단체의 조례와 규칙을 제공합니다.")
 def search_local_ordinance(query: Optional[str] = None, search: int = 2, display: int = 20, page: int = 1) -> TextContent:
     """자치법규 검색"""
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
-    params = {"target": "ordin", "query": search_query, "search": search, "display": min(display, 100), "page": page}
+    params = {"target": "ordin", "query": search_query, "search": search, "display": display, "page": page}
     try:
         data = _make_legislation_request("ordin", params)
-        url = _generate_api_url("ordin", params)
-        result = _format_search_results(data, "ordin", search_query, min(display, 100))
+        result = _format_search_results(data, "ordin", search_query, display)
         return TextContent(type="text", text=result)
     except Exception as e:
         return TextContent(type="text", text=f"자치법규 검색 중 오류: {str(e)}")
@@ -233,15 +233,15 @@ def search_local_ordinance(query: Optional[str] = None, search: int = 2, display
 @mcp.tool(name="search_ordinance_appendix", description="자치법규 별표서식을 검색합니다. 조례와 규칙의 별표 및 서식을 제공합니다.")
 def search_ordinance_appendix(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """자치법규 별표서식 검색"""
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
-    params = {"target": "ordinanceApp", "query": search_query, "display": min(display, 100), "page": page}
+    params = {"target": "ordinanceApp", "query": search_query, "display": display, "page": page}
     try:
         data = _make_legislation_request("ordinanceApp", params)
-        url = _generate_api_url("ordinanceApp", params)
-        result = _format_search_results(data, "ordinanceApp", search_query, min(display, 100))
+        result = _format_search_results(data, "ordinanceApp", search_query, display)
         return TextContent(type="text", text=result)
     except Exception as e:
         return TextContent(type="text", text=f"자치법규 별표서식 검색 중 오류: {str(e)}")
@@ -255,7 +255,8 @@ def search_linked_ordinance(
     page: int = 1
 ) -> TextContent:
     """연계 자치법규 검색"""
-    params = {"target": "lnkLsOrd", "display": min(display, 100), "page": page}
+    display, page = _clamp_pagination(display, page)
+    params = {"target": "lnkLsOrd", "display": display, "page": page}
     
     if query and query.strip():
         params["query"] = query.strip()
@@ -267,7 +268,7 @@ def search_linked_ordinance(
     try:
         data = _make_legislation_request("lnkLsOrd", params)
         search_term = query or f"법령ID:{law_id}" if law_id else f"자치법규ID:{ordinance_id}" if ordinance_id else "연계 자치법규"
-        result = _format_search_results(data, "lnkLsOrd", search_term, min(display, 100))
+        result = _format_search_results(data, "lnkLsOrd", search_term, display)
         return TextContent(type="text", text=result)
     except Exception as e:
         return TextContent(type="text", text=f"연계 자치법규 검색 중 오류: {str(e)}")
@@ -280,12 +281,12 @@ def get_local_ordinance_detail(ordinance_id: Union[str, int]) -> TextContent:
         oc = os.getenv("LEGISLATION_API_KEY", "lchangoo")
         url = f"http://www.law.go.kr/DRF/lawService.do?OC={oc}&target=ordin&ID={ordinance_id}&type=JSON"
         
-        # API 요청 - 직접 requests 사용 (Referer 헤더 필수)
+        # API 요청 - 공용 세션 사용 (Referer 헤더 필수)
         headers = {"Referer": "https://open.law.go.kr/"}
-        response = requests.get(url, headers=headers, timeout=15)
+        response = _SESSION.get(url, headers=headers, timeout=15)
         response.raise_for_status()
         
-        data = response.json()
+        data = _json_loads(response.content)
         
         # 결과 포맷팅 - 상세 조례 내용 제공
         result = f"**자치법규 상세 정보** (ID: {ordinance_id})\n"
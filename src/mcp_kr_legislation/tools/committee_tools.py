@@ -20,6 +20,7 @@ logger = logging.getLogger(__name__)
 
 # 유틸리티 함수들 import
 from .law_tools import (
+    _clamp_pagination,
     _make_legislation_request,
     _generate_api_url
 )
@@ -206,12 +207,13 @@ def search_privacy_committee(
         sort: 정렬 (lasc=의안명오름차순, ldes=의안명내림차순, dasc=개최일자오름차순, ddes=개최일자내림차순)
         alphabetical: 사전식 검색 (ga,na,da,ra,ma,ba,sa,a,ja,cha,ka,ta,pa,ha)
     """
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
     # search=2 (본문검색) 파라미터로 더 많은 결과 확보
-    params = {"query": search_query, "search": search, "display": min(display, 100), "page": page}
+    params = {"query": search_query, "search": search, "display": display, "page": page}
     
     # 고급 검색 파라미터 추가
     if sort:
@@ -221,7 +223,6 @@ def search_privacy_committee(
         
     try:
         data = _make_legislation_request("ppc", params)
-        url = _generate_api_url("ppc", params)
         result = _format_committee_search_results(data, "ppc", search_query, display)
         return TextContent(type="text", text=result)
     except Exception as e:
@@ -254,12 +255,13 @@ def search_financial_committee(
         sort: 정렬 (lasc=안건명오름차순, ldes=안건명내림차순, dasc=의결일자오름차순, ddes=의결일자내림차순)
         alphabetical: 사전식 검색 (ga,na,da,ra,ma,ba,sa,a,ja,cha,ka,ta,pa,ha)
     """
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
     # search=2 (본문검색) 파라미터로 더 많은 결과 확보
-    params = {"query": search_query, "search": search, "display": min(display, 100), "page": page}
+    params = {"query": search_query, "search": search, "display": display, "page": page}
     
     # 고급 검색 파라미터 추가
     if sort:
@@ -269,7 +271,6 @@ def search_financial_committee(
         
     try:
         data = _make_legislation_request("fsc", params)
-        url = _generate_api_url("fsc", params)
         result = _format_committee_search_results(data, "fsc", search_query, display)
         return TextContent(type="text", text=result)
     except Exception as e:
@@ -302,12 +303,13 @@ def search_monopoly_committee(
         sort: 정렬 (lasc=의결내용명오름차순, ldes=의결내용명내림차순, dasc=의결일자오름차순, ddes=의결일자내림차순)
         alphabetical: 사전식 검색 (ga,na,da,ra,ma,ba,sa,a,ja,cha,ka,ta,pa,ha)
     """
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
     # search=2 (본문검색) 파라미터로 더 많은 결과 확보
-    params = {"query": search_query, "search": search, "display": min(display, 100), "page": page}
+    params = {"query": search_query, "search": search, "display": display, "page": page}
     
     # 고급 검색 파라미터 추가
     if sort:
@@ -317,7 +319,6 @@ def search_monopoly_committee(
         
     try:
         data = _make_legislation_request("ftc", params)
-        url = _generate_api_url("ftc", params)
         result = _format_committee_search_results(data, "ftc", search_query, display)
         return TextContent(type="text", text=result)
     except Exception as e:
@@ -354,10 +355,11 @@ def search_anticorruption_committee(
         sort: 정렬 (lasc=안건명오름차순, ldes=안건명내림차순, dasc=의결일자오름차순, ddes=의결일자내림차순)
         alphabetical: 사전식 검색 (ga,na,da,ra,ma,ba,sa,a,ja,cha,ka,ta,pa,ha)
     """
+    display, page = _clamp_pagination(display, page)
     search_query = query.strip() if query else ""
     
     # 파라미터 구성 - 검색어 없으면 전체 목록 조회
-    params = {"display": min(display, 100), "page": page}
+    params = {"display": display, "page": page}
     if search_query:
         params["query"] = search_query
         params["search"] = search
@@ -370,7 +372,6 @@ def search_anticorruption_committee(
         
     try:
         data = _make_legislation_request("acr", params)
-        url = _generate_api_url("acr", params)
         display_query = search_query if search_query else "전체 목록"
         result = _format_committee_search_results(data, "acr", display_query, display)
         return TextContent(type="text", text=result)
@@ -404,12 +405,13 @@ def search_labor_committee(
         sort: 정렬 (lasc=사건명오름차순, ldes=사건명내림차순, dasc=재정일자오름차순, ddes=재정일자내림차순)
         alphabetical: 사전식 검색 (ga,na,da,ra,ma,ba,sa,a,ja,cha,ka,ta,pa,ha)
     """
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
     # search=2 (본문검색) 파라미터로 더 많은 결과 확보
-    params = {"query": search_query, "search": search, "display": min(display, 100), "page": page}
+    params = {"query": search_query, "search": search, "display": display, "page": page}
     
     # 고급 검색 파라미터 추가
     if sort:
@@ -419,7 +421,6 @@ def search_labor_committee(
         
     try:
         data = _make_legislation_request("nlrc", params)
-        url = _generate_api_url("nlrc", params)
         result = _format_committee_search_results(data, "nlrc", search_query, display)
         return TextContent(type="text", text=result)
     except Exception as e:
@@ -452,12 +453,13 @@ def search_environment_committee(
         sort: 정렬 (lasc=사건명오름차순, ldes=사건명내림차순, nasc=의결번호오름차순, ndes=의결번호내림차순)
         alphabetical: 사전식 검색 (ga,na,da,ra,ma,ba,sa,a,ja,cha,ka,ta,pa,ha)
     """
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
     # search=2 (본문검색) 파라미터로 더 많은 결과 확보
-    params = {"query": search_query, "search": search, "display": min(display, 100), "page": page}
+    params = {"query": search_query, "search": search, "display": display, "page": page}
     
     # 고급 검색 파라미터 추가
     if sort:
@@ -467,7 +469,6 @@ def search_environment_committee(
         
     try:
         data = _make_legislation_request("ecc", params)
-        url = _generate_api_url("ecc", params)
         result = _format_committee_search_results(data, "ecc", search_query, display)
         return TextContent(type="text", text=result)
     except Exception as e:
@@ -500,12 +501,13 @@ def search_securities_committee(
         sort: 정렬 (lasc=사건명오름차순, ldes=사건명내림차순, dasc=의결일자오름차순, ddes=의결일자내림차순, nasc=사건번호오름차순, ndes=사건번호내림차순)
         alphabetical: 사전식 검색 (ga,na,da,ra,ma,ba,sa,a,ja,cha,ka,ta,pa,ha)
     """
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
     # search=2 (본문검색) 파라미터로 더 많은 결과 확보
-    params = {"query": search_query, "search": search, "display": min(display, 100), "page": page}
+    params = {"query": search_query, "search": search, "display": display, "page": page}
     
     # 고급 검색 파라미터 추가
     if sort:
@@ -515,7 +517,6 @@ def search_securities_committee(
         
     try:
         data = _make_legislation_request("sfc", params)
-        url = _generate_api_url("sfc", params)
         result = _format_committee_search_results(data, "sfc", search_query, display)
         return TextContent(type="text", text=result)
     except Exception as e:
@@ -548,12 +549,13 @@ def search_human_rights_committee(
         sort: 정렬 (lasc=사건명오름차순, ldes=사건명내림차순, dasc=의결일자오름차순, ddes=의결일자내림차순, nasc=사건번호오름차순, ndes=사건번호내림차순)
         alphabetical: 사전식 검색 (ga,na,da,ra,ma,ba,sa,a,ja,cha,ka,ta,pa,ha)
     """
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
     # search=2 (본문검색) 파라미터로 더 많은 결과 확보
-    params = {"query": search_query, "search": search, "display": min(display, 100), "page": page}
+    params = {"query": search_query, "search": search, "display": display, "page": page}
     
     # 고급 검색 파라미터 추가
     if sort:
@@ -563,7 +565,6 @@ def search_human_rights_committee(
         
     try:
         data = _make_legislation_request("nhrck", params)
-        url = _generate_api_url("nhrck", params)
         result = _format_committee_search_results(data, "nhrck", search_query, display)
         return TextContent(type="text", text=result)
     except Exception as e:
@@ -596,12 +597,13 @@ def search_broadcasting_committee(
         sort: 정렬 (lasc=안건명오름차순, ldes=안건명내림차순, dasc=의결일자오름차순, ddes=의결일자내림차순, nasc=안건번호오름차순, ndes=안건번호내림차순)
         alphabetical: 사전식 검색 (ga,na,da,ra,ma,ba,sa,a,ja,cha,ka,ta,pa,ha)
     """
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
     # search=2 (본문검색) 파라미터로 더 많은 결과 확보
-    params = {"query": search_query, "search": search, "display": min(display, 100), "page": page}
+    params = {"query": search_query, "search": search, "display": display, "page": page}
     
     # 고급 검색 파라미터 추가
     if sort:
@@ -611,7 +613,6 @@ def search_broadcasting_committee(
         
     try:
         data = _make_legislation_request("kcc", params)
-        url = _generate_api_url("kcc", params)
         result = _format_committee_search_results(data, "kcc", search_query, display)
         return TextContent(type="text", text=result)
     except Exception as e:
@@ -644,12 +645,13 @@ def search_industrial_accident_committee(
         sort: 정렬 (lasc=사건오름차순, ldes=사건내림차순, dasc=의결일자오름차순, ddes=의결일자내림차순, nasc=사건번호오름차순, ndes=사건번호내림차순)
         alphabetical: 사전식 검색 (ga,na,da,ra,ma,ba,sa,a,ja,cha,ka,ta,pa,ha)
     """
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
     # search=2 (본문검색) 파라미터로 더 많은 결과 확보
-    params = {"query": search_query, "search": search, "display": min(display, 100), "page": page}
+    params = {"query": search_query, "search": search, "display": display, "page": page}
     
     # 고급 검색 파라미터 추가
     if sort:
@@ -659,7 +661,6 @@ def search_industrial_accident_committee(
         
     try:
         data = _make_legislation_request("iaciac", params)
-        url = _generate_api_url("iaciac", params)
         result = _format_committee_search_results(data, "iaciac", search_query, display)
         return TextContent(type="text", text=result)
     except Exception as e:
@@ -692,12 +693,13 @@ def search_land_tribunal(
         sort: 정렬 (lasc=제목오름차순, ldes=제목내림차순)
         alphabetical: 사전식 검색 (ga,na,da,ra,ma,ba,sa,a,ja,cha,ka,ta,pa,ha)
     """
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
     # search=2 (본문검색) 파라미터로 더 많은 결과 확보
-    params = {"query": search_query, "search": search, "display": min(display, 100), "page": page}
+    params = {"query": search_query, "search": search, "display": display, "page": page}
     
     # 고급 검색 파라미터 추가
     if sort:
@@ -707,7 +709,6 @@ def search_land_tribunal(
         
     try:
         data = _make_legislation_request("oclt", params)
-        url = _generate_api_url("oclt", params)
         result = _format_committee_search_results(data, "oclt", search_query, display)
         return TextContent(type="text", text=result)
     except Exception as e:
@@ -740,12 +741,13 @@ def search_employment_insurance_committee(
         sort: 정렬 (lasc=사건명오름차순, ldes=사건명내림차순, dasc=의결일자오름차순, ddes=의결일자내림차순, nasc=사건번호오름차순, ndes=사건번호내림차순)
         alphabetical: 사전식 검색 (ga,na,da,ra,ma,ba,sa,a,ja,cha,ka,ta,pa,ha)
     """
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
     # search=2 (본문검색) 파라미터로 더 많은 결과 확보
-    params = {"query": search_query, "search": search, "display": min(display, 100), "page": page}
+    params = {"query": search_query, "search": search, "display": display, "page": page}
     
     # 고급 검색 파라미터 추가
     if sort:
@@ -755,7 +757,6 @@ def search_employment_insurance_committee(
         
     try:
         data = _make_legislation_request("eiac", params)
-        url = _generate_api_url("eiac", params)
         result = _format_committee_search_results(data, "eiac", search_query, display)
         return TextContent(type="text", text=result)
     except Exception as e:
@@ -21,6 +21,7 @@ logger = logging.getLogger(__name__)
 
 # 유틸리티 함수들 import (law_tools로 변경)
 from .law_tools import (
+    _clamp_pagination,
     _make_legislation_request,
     _generate_api_url,
     _format_search_results
@@ -45,10 +46,11 @@ from .law_tools import (
 참고: vcode(분류코드)는 공식 가이드에서 확인 가능합니다.""")
 def search_custom_law(vcode: Optional[str] = None, query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """맞춤형 법령 검색"""
+    display, page = _clamp_pagination(display, page)
     if not vcode:
         return TextContent(type="text", text="vcode(분류코드)를 입력해주세요.\n\n예시: search_custom_law(vcode=\"L0000000003384\")\n\n분류코드는 https://open.law.go.kr/LSO/openApi/guideResult.do 에서 확인 가능합니다.")
     
-    params = {"vcode": vcode, "display": min(display, 100), "page": page}
+    params = {"vcode": vcode, "display": display, "page": page}
     
     if query and query.strip():
         search_query = query.strip()
@@ -78,10 +80,11 @@ def search_custom_law(vcode: Optional[str] = None, query: Optional[str] = None,
 참고: 조문 조회를 위해 lj=jo 파라미터가 자동으로 추가됩니다.""")
 def search_custom_law_articles(vcode: Optional[str] = None, query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """맞춤형 법령 조문 검색"""
+    display, page = _clamp_pagination(display, page)
     if not vcode:
         return TextContent(type="text", text="vcode(분류코드)를 입력해주세요.")
     
-    params = {"vcode": vcode, "display": min(display, 100), "page": page, "lj": "jo"}
+    params = {"vcode": vcode, "display": display, "page": page, "lj": "jo"}
     
     if query and query.strip():
         search_query = query.strip()
@@ -112,10 +115,11 @@ def search_custom_law_articles(vcode: Optional[str] = None, query: Optional[str]
 사용 예시: search_custom_ordinance(vcode="O0000000000001", query="환경보호")""")
 def search_custom_ordinance(vcode: Optional[str] = None, query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """맞춤형 자치법규 검색"""
+    display, page = _clamp_pagination(display, page)
     if not vcode:
         return TextContent(type="text", text="vcode(분류코드)를 입력해주세요.")
     
-    params = {"vcode": vcode, "display": min(display, 100), "page": page}
+    params = {"vcode": vcode, "display": display, "page": page}
     
     if query and query.strip():
         search_query = query.strip()
@@ -142,10 +146,11 @@ def search_custom_ordinance(vcode: Optional[str] = None, query: Optional[str] =
 사용 예시: search_custom_ordinance_articles(vcode="O0000000000001", query="제1조")""")
 def search_custom_ordinance_articles(vcode: Optional[str] = None, query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """맞춤형 자치법규 조문 검색"""
+    display, page = _clamp_pagination(display, page)
     if not vcode:
         return TextContent(type="text", text="vcode(분류코드)를 입력해주세요.")
     
-    params = {"vcode": vcode, "display": min(display, 100), "page": page, "lj": "jo"}
+    params = {"vcode": vcode, "display": display, "page": page, "lj": "jo"}
     
     if query and query.strip():
         search_query = query.strip()
@@ -176,10 +181,11 @@ def search_custom_ordinance_articles(vcode: Optional[str] = None, query: Optiona
 사용 예시: search_custom_administrative_rule(vcode="A0000000000001", query="훈령")""")
 def search_custom_administrative_rule(vcode: Optional[str] = None, query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """맞춤형 행정규칙 검색"""
+    display, page = _clamp_pagination(display, page)
     if not vcode:
         return TextContent(type="text", text="vcode(분류코드)를 입력해주세요.")
     
-    params = {"vcode": vcode, "display": min(display, 100), "page": page}
+    params = {"vcode": vcode, "display": display, "page": page}
     
     if query and query.strip():
         search_query = query.strip()
@@ -210,10 +216,11 @@ def search_custom_administrative_rule(vcode: Optional[str] = None, query: Option
 사용 예시: search_custom_precedent(vcode="P0000000000001", query="손해배상")""")
 def search_custom_precedent(vcode: Optional[str] = None, query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """맞춤형 판례 검색"""
+    display, page = _clamp_pagination(display, page)
     if not vcode:
         return TextContent(type="text", text="vcode(분류코드)를 입력해주세요.")
     
-    params = {"vcode": vcode, "display": min(display, 100), "page": page}
+    params = {"vcode": vcode, "display": display, "page": page}
     
     if query and query.strip():
         search_query = query.strip()
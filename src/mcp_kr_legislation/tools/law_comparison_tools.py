@@ -21,6 +21,7 @@ from ..config import legislation_config
 
 # law_tools에서 공통 함수들 import
 from .law_tools import (
+    _clamp_pagination,
     _make_legislation_request,
     _format_search_results,
     get_cache_key,
@@ -67,6 +68,7 @@ def search_law_change_history(change_date: str, org: Optional[str] = None, displ
         display: 결과 개수
         page: 페이지 번호
     """
+    display, page = _clamp_pagination(display, page)
     try:
         # 변경일자 유효성 검사
         if not change_date or len(change_date) != 8 or not change_date.isdigit():
@@ -78,7 +80,7 @@ def search_law_change_history(change_date: str, org: Optional[str] = None, displ
             "type": "JSON",               # 필수: 출력형태
             "target": "lsHstInf",         # 필수: 서비스 대상 (올바른 target)
             "regDt": change_date,         # 필수: 법령 변경일
-            "display": min(display, 100),
+            "display": display,
             "page": page
         }
         
@@ -157,6 +159,7 @@ def search_article_change_history(mst: str, article_no: str, display: int = 20,
         display: 결과 개수
         page: 페이지 번호
     """
+    display, page = _clamp_pagination(display, page)
     try:
         # 필수 파라미터 유효성 검사
         if not mst or not mst.strip():
@@ -205,7 +208,7 @@ def search_article_change_history(mst: str, article_no: str, display: int = 20,
             "target": "lsJoHstInf",       # 필수: 서비스 대상 (올바른 target)
             "ID": actual_law_id,          # 필수: 법령ID (MST에서 변환된 값)
             "JO": normalized_article_no,  # 필수: 조번호 (정규화됨)
-            "display": min(display, 100),
+            "display": display,
             "page": page
         }
         
@@ -341,10 +344,11 @@ def search_ordinance_law_link(query: Optional[str] = None, display: int = 20, pa
         display: 결과 개수
         page: 페이지 번호
     """
+    display, page = _clamp_pagination(display, page)
     try:
         # 기본 파라미터 설정
         params = {
-            "display": min(display, 100),
+            "display": display,
             "page": page
         }
         
@@ -389,6 +393,7 @@ def search_related_law(query: str, display: int = 20, page: int = 1) -> TextCont
         display: 결과 개수
         page: 페이지 번호
     """
+    display, page = _clamp_pagination(display, page)
     try:
         # 검색어 필수 체크
         if not query or not query.strip():
@@ -423,7 +428,7 @@ def search_related_law(query: str, display: int = 20, page: int = 1) -> TextCont
         # 기본 파라미터 설정
         params = {
             "query": search_query,
-            "display": min(display, 100),
+            "display": display,
             "page": page
         }
         
@@ -502,11 +507,12 @@ def search_law_appendix(
         local_gov_code: 지자체 코드
         sort: 정렬 (name_asc=명칭오름차순, name_desc=명칭내림차순, date_asc=일자오름차순, date_desc=일자내림차순)
     """
+    display, page = _clamp_pagination(display, page)
     try:
         # 기본 파라미터 설정
         params = {
             "search": search,
-            "display": min(display, 100),
+            "display": display,
             "page": page
         }
         
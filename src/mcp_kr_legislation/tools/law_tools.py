@@ -5,17 +5,22 @@
 모든 법령 관련 도구들을 통합 제공합니다. (총 29개 도구)
 """
 
+import asyncio
 import logging
 import json
 import os
 import requests  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
+from urllib3.util.retry import Retry  # type: ignore
 from urllib.parse import urlencode
-from typing import Optional, Union, Dict, Any, List, Annotated
+from typing import Optional, Union, Dict, Any, List, Annotated, Callable, Tuple
 from mcp.types import TextContent
 from datetime import datetime, timedelta
 from pathlib import Path
 import hashlib
+import inspect
 import re
+from functools import lru_cache, wraps
 
 try:
     from bs4 import BeautifulSoup
@@ -24,9 +29,19 @@ except ImportError:
     BeautifulSoup = None  # type: ignore
     HAS_BEAUTIFULSOUP = False
 
+try:
+    import orjson  # type: ignore
+    _json_loads = orjson.loads
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore
+    _json_loads = json.loads
+    HAS_ORJSON = False
+
 from ..server import mcp
 from ..config import legislation_config
 from ..apis.client import LegislationClient
+from ..utils.request_cache import cached_request, DiskCache, TTLCache
 from ..utils.law_tools_utils import (
     # search_law 도구 관련
     format_search_law_results, normalize_search_query, create_search_variants,
@@ -71,6 +86,28 @@ from .law_formatters import (
 
 logger = logging.getLogger(__name__)
 
+# ===========================================
+# HTTP 세션 (커넥션 풀 재사용)
+# ===========================================
+
+def _create_session() -> requests.Session:
+    """법제처 API 공용 세션 생성 (keep-alive 커넥션 풀 + 재시도)"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        # 읽기 타임아웃은 재시도하지 않음 (60초 API가 몇 배로 지연되는 것 방지)
+        # raise_on_status=False: 재시도 소진 시 RetryError 대신 응답을 돌려받아 raise_for_status()에서 HTTPError 발생
+        max_retries=Retry(total=2, connect=2, read=0, backoff_factor=0.3,
+                          status_forcelist=[502, 503, 504], raise_on_status=False)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+_SESSION = _create_session()
+
 # ===========================================
 # 캐시 시스템 (최적화용)
 # ===========================================
@@ -175,8 +212,90 @@ def extract_article_number(article_key: str) -> int:
     except:
         return 999999
 
+def _normalize_query(query: Optional[str]) -> Optional[str]:
+    """검색어 정규화 - 비어 있거나 공백뿐이면 None 반환"""
+    if not query or query.isspace():
+        return None
+    return query.strip()
+
+def _clamp_pagination(display: Optional[int], page: Optional[int]) -> Tuple[int, int]:
+    """display/page를 API 허용 범위로 보정
+    
+    - display: 1 미만(0·음수·None)이면 기본값 20, 100 초과면 100
+    - page: 1 미만(0·음수·None)이면 1
+    
+    API가 거부하는 값은 오류로 돌려보내는 대신 요청 전에 보정하여 불필요한 왕복을 막습니다.
+    검색 도구(_build_search_params, legislation_search, 각 search_* 도구)에서만 사용합니다.
+    """
+    clamped_display = 20 if display is None or display < 1 else min(display, 100)
+    clamped_page = 1 if page is None or page < 1 else page
+    if (clamped_display, clamped_page) != (display, page):
+        logger.debug("display/page 보정: (%s, %s) -> (%s, %s)", display, page, clamped_display, clamped_page)
+    return clamped_display, clamped_page
+
+def _build_search_params(query: str, display: int, page: int) -> dict:
+    """검색 API 공통 파라미터 생성 (display/page는 _clamp_pagination으로 보정)"""
+    display, page = _clamp_pagination(display, page)
+    return {
+        "query": query,
+        "display": display,
+        "page": page
+    }
+
+# legislation_search로 데코레이트되는 함수의 매개변수 (wrapper가 처리하는 인자)
+_SEARCH_TOOL_PARAMS = ("query", "display", "page")
+
+def legislation_search(target: str, label: str, formatter: Optional[Callable] = None,
+                       query_required: bool = True):
+    """검색 도구 공통 처리 데코레이터
+    
+    검색어 검증, 파라미터 생성, API 요청, 결과 포맷팅, 오류 처리를 일괄 수행합니다.
+    데코레이트되는 함수는 도구 시그니처/설명만 제공하며 본문은 실행되지 않습니다.
+    MCP 스키마는 이 시그니처로 생성되므로 매개변수는 (query, display, page)여야 하며,
+    호출 인자와 기본값도 이 시그니처 기준으로 해석합니다.
+    생성되는 도구는 비동기 함수이므로 API 요청 중에도 이벤트 루프가 막히지 않습니다.
+    
+    Args:
+        target: API target 값
+        label: 오류 메시지에 사용할 검색 대상명
+        formatter: (data, target, search_query, max_results) 포맷팅 함수 (기본: _format_search_results)
+        query_required: False면 검색어 없이 전체 조회 허용
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        if tuple(signature.parameters) != _SEARCH_TOOL_PARAMS:
+            raise TypeError(
+                f"{func.__name__}: legislation_search 도구의 매개변수는 "
+                f"{_SEARCH_TOOL_PARAMS}이어야 합니다 (현재: {tuple(signature.parameters)})"
+            )
+        
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> TextContent:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            query, display, page = (bound.arguments[name] for name in _SEARCH_TOOL_PARAMS)
+            search_query = _normalize_query(query)
+            if search_query is None:
+                if query_required:
+                    return TextContent(type="text", text="검색어를 입력해주세요.")
+                display, page = _clamp_pagination(display, page)
+                params = {"display": display, "page": page}
+                search_query = "전체"
+            else:
+                params = _build_search_params(search_query, display, page)
+            
+            try:
+                data = await _make_legislation_request_async(target, params)
+                result = (formatter or _format_search_results)(data, target, search_query, params["display"])
+                return TextContent(type="text", text=result)
+            except Exception as e:
+                return TextContent(type="text", text=f"{label} 검색 중 오류: {str(e)}")
+        return wrapper
+    return decorator
+
 # 유틸리티 함수들은 utils/law_tools_utils.py로 이동됨
 
+@cached_request(ttl=300, detail_ttl=3600, maxsize=512)
 def _make_legislation_request(target: str, params: dict, is_detail: bool = False, timeout: int = 10) -> dict:
     """법제처 API 요청 공통 함수"""
     try:
@@ -197,7 +316,7 @@ def _make_legislation_request(target: str, params: dict, is_detail: bool = False
         
         # 요청 실행 - Referer 헤더 필수 (일부 API에서 404 방지)
         headers = {"Referer": "https://open.law.go.kr/"}
-        response = requests.get(url, headers=headers, timeout=timeout)
+        response = _SESSION.get(url, headers=headers, timeout=timeout)
         response.raise_for_status()
         
         # 응답 내용 확인 (영문 법령의 경우)
@@ -225,7 +344,8 @@ def _make_legislation_request(target: str, params: dict, is_detail: bool = False
                 logger.warning(f"{target} API가 빈 응답을 반환했습니다")
                 return {"error": f"{target} API가 빈 응답을 반환했습니다"}
             
-            data = response.json()
+            # orjson이 있으면 C 파서 사용 (JSONDecodeError는 json.JSONDecodeError 하위 클래스)
+            data = _json_loads(response.content)
         except json.JSONDecodeError as e:
             # 특정 타겟들에 대한 상세한 오류 처리
             if target in ["elaw", "ordinance", "ordinanceApp"]:
@@ -269,8 +389,112 @@ def _make_legislation_request(target: str, params: dict, is_detail: bool = False
         logger.error(f"데이터 처리 실패: {e}")
         raise
 
+async def _make_legislation_request_async(target: str, params: dict, is_detail: bool = False,
+                                          timeout: int = 10) -> dict:
+    """_make_legislation_request의 비동기 버전
+    
+    HTTP 왕복 동안 이벤트 루프를 막지 않도록 공유 세션 요청을 워커 스레드에서 실행합니다.
+    캐시/재시도/연결 풀은 동기 버전과 그대로 공유됩니다.
+    """
+    return await asyncio.to_thread(_make_legislation_request, target, params, is_detail, timeout)
+
+def _detail_cache_ttl() -> Optional[float]:
+    """LEGISLATION_DETAIL_TTL 환경변수(초) - 미설정 시 만료 없음"""
+    value = os.getenv("LEGISLATION_DETAIL_TTL", "").strip()
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"LEGISLATION_DETAIL_TTL 값이 올바르지 않습니다: {value} (만료 없음으로 처리)")
+        return None
+
+# 선고/결정이 끝난 판례·결정례 본문은 변하지 않으므로 디스크에 저장해 재시작 후에도 재사용
+_DETAIL_CACHE = DiskCache(CACHE_DIR / "detail", ttl=_detail_cache_ttl())
+
+# 존재하지 않는 ID(404 또는 "일치하는 ... 없습니다" 응답) - 같은 잘못된 ID의 반복 요청을 HTTP 없이 처리
+# 값은 최초 응답 그대로("데이터 없음" 응답 dict 또는 404 오류 메시지)를 저장해 같은 결과를 돌려줌
+_MISSING_DETAIL_IDS = TTLCache(maxsize=100_000)
+_MISSING_DETAIL_TTL = 3600
+
+def _is_not_found_response(data: Any) -> bool:
+    """{"Law": "일치하는 ...가 없습니다"} 형태의 '데이터 없음' 응답 여부"""
+    law_data = data.get("Law") if isinstance(data, dict) else None
+    return isinstance(law_data, str) and "일치하는" in law_data
+
+# 상세조회 응답의 본문 키 (목록에 없는 target은 '...Service' 형태의 키로 판단)
+_DETAIL_SERVICE_KEYS = {
+    "prec": "PrecService",
+    "detc": "DetcService",
+    "expc": "ExpcService",
+}
+
+def _is_cacheable_detail(target: str, data: Any) -> bool:
+    """디스크 캐시에 저장할 만한 정상 상세조회 응답인지 확인
+    
+    예상한 본문 키(PrecService 등)가 있고 내용이 비어 있지 않은 응답만 저장합니다.
+    예상과 다른 응답이 LEGISLATION_DETAIL_TTL 동안 디스크에서 재사용되는 것을 방지합니다.
+    """
+    if not isinstance(data, dict):
+        return False
+    service_key = _DETAIL_SERVICE_KEYS.get(target)
+    if service_key is not None:
+        return bool(data.get(service_key))
+    return any(key.endswith("Service") and value for key, value in data.items())
+
+def _get_cached_case_detail(target: str, params: dict) -> Optional[dict]:
+    """판례·결정례 상세조회 결과를 캐시에서만 확인 (HTTP 요청 없음)
+    
+    이전에 존재하지 않는 것으로 확인된 ID는 최초 조회와 같은 결과("데이터 없음" 응답
+    또는 같은 HTTPError)를 돌려주고, 디스크 캐시에 없으면 None을 반환합니다.
+    """
+    key = f"{target}:{params.get('ID')}"
+    known_missing, missing = _MISSING_DETAIL_IDS.get(key)
+    if known_missing:
+        if isinstance(missing, str):
+            raise requests.exceptions.HTTPError(missing)
+        return missing
+    return _DETAIL_CACHE.get(key)
+
+def _make_case_detail_request(target: str, params: dict) -> dict:
+    """판례·결정례 상세조회 - (target, ID) 기준 디스크 캐시 우선 사용
+    
+    이전에 존재하지 않는 것으로 확인된 ID는 요청 없이 최초 조회와 같은 결과를 돌려줍니다.
+    """
+    data = _get_cached_case_detail(target, params)
+    if data is not None:
+        return data
+    
+    key = f"{target}:{params.get('ID')}"
+    try:
+        data = _make_legislation_request(target, params, is_detail=True)
+    except requests.exceptions.HTTPError as e:
+        if e.response is not None and e.response.status_code == 404:
+            _MISSING_DETAIL_IDS.set(key, str(e), _MISSING_DETAIL_TTL)
+        raise
+    
+    if _is_not_found_response(data):
+        _MISSING_DETAIL_IDS.set(key, data, _MISSING_DETAIL_TTL)
+    elif _is_cacheable_detail(target, data):
+        _DETAIL_CACHE.set(key, data)
+    return data
+
 def _generate_api_url(target: str, params: dict, is_detail: bool = False) -> str:
-    """올바른 법제처 API URL 생성"""
+    """올바른 법제처 API URL 생성 (동일 target/params 조합은 캐시된 URL 재사용)"""
+    try:
+        # 파라미터 순서를 유지해야 URL 문자열이 기존과 동일하므로 정렬하지 않음
+        return _generate_api_url_cached(target, tuple(params.items()), is_detail)
+    except TypeError:
+        # 해시 불가능한 파라미터 값이 있으면 캐시 없이 생성
+        return _build_api_url(target, params, is_detail)
+
+@lru_cache(maxsize=4096)
+def _generate_api_url_cached(target: str, params_items: tuple, is_detail: bool) -> str:
+    """_generate_api_url 캐시 래퍼"""
+    return _build_api_url(target, dict(params_items), is_detail)
+
+def _build_api_url(target: str, params: dict, is_detail: bool = False) -> str:
+    """법제처 API URL 조립 (urlencode)"""
     try:
         # 기본 파라미터 설정
         base_params = {
@@ -1504,6 +1728,7 @@ def search_law(
         law_chapter: 법령분류 (01=제1편...44=제44편)
         alphabetical: 사전식 검색 (ga,na,da,ra,ma,ba,sa,a,ja,cha,ka,ta,pa,ha)
     """
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요. 예: '은행법', '소득세법', '개인정보보호법' 등")
     
@@ -1588,7 +1813,7 @@ def search_law(
             params.update({
                 "query": attempt_query,
                 "search": search_mode,
-                "display": min(display, 100),
+                "display": display,
                 "page": page
             })
             
@@ -1720,6 +1945,7 @@ def search_english_law(
         promulgate_date: 공포일자 (YYYYMMDD)
         enforce_date: 시행일자 (YYYYMMDD)
     """
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요. 예: 'Civil Act', 'Commercial Act' 등")
     
@@ -1733,7 +1959,7 @@ def search_english_law(
             "target": "elaw",            # 영문법령은 target이 'elaw'
             "query": search_query,
             "search": search,
-            "display": min(display, 100),
+            "display": display,
             "page": page
         }
         
@@ -1852,8 +2078,6 @@ def _fetch_english_law_with_extended_timeout(mst: str, timeout: int = 90) -> dic
     
     대용량 법령(민법 등)도 조회할 수 있도록 90초 타임아웃 적용
     """
-    import requests
-    
     url = f"{legislation_config.service_base_url}"
     params = {
         "OC": legislation_config.oc,
@@ -1863,7 +2087,7 @@ def _fetch_english_law_with_extended_timeout(mst: str, timeout: int = 90) -> dic
     }
     
     try:
-        response = requests.get(
+        response = _SESSION.get(
             url, 
             params=params, 
             timeout=timeout,
@@ -1872,7 +2096,7 @@ def _fetch_english_law_with_extended_timeout(mst: str, timeout: int = 90) -> dic
         response.raise_for_status()
         
         # JSON 파싱
-        data = response.json()
+        data = _json_loads(response.content)
         return data
         
     except requests.exceptions.Timeout:
@@ -2055,6 +2279,7 @@ def search_effective_law(
         law_type_code: 법령종류 코드
         alphabetical: 사전식 검색
     """
+    display, page = _clamp_pagination(display, page)
     try:
         # OC(기관코드) 확인
         if not legislation_config.oc:
@@ -2065,7 +2290,7 @@ def search_effective_law(
             "OC": legislation_config.oc,  # 필수: 기관코드
             "type": "JSON",               # 필수: 출력형태
             "target": "eflaw",           # 필수: 서비스 대상
-            "display": min(display, 100),
+            "display": display,
             "page": page,
             "search": search
         }
@@ -2208,10 +2433,11 @@ def search_deleted_law_data(
         display: 결과 개수
         page: 페이지 번호
     """
+    display, page = _clamp_pagination(display, page)
     try:
         # 기본 파라미터 설정 (target은 _make_legislation_request에서 자동 추가됨)
         params = {
-            "display": min(display, 100),
+            "display": display,
             "page": page
         }
         
@@ -2269,6 +2495,7 @@ def search_law_articles(
         display: 결과 개수
         page: 페이지 번호
     """
+    display, page = _clamp_pagination(display, page)
     if not mst:
         return TextContent(type="text", text="법령일련번호(MST)를 입력해주세요.")
     
@@ -2338,17 +2565,17 @@ def search_law_articles(
                 "OC": legislation_config.oc,
                 "target": "lawjosub",
                 "ID": mst_str,
-                "display": min(display, 100),
+                "display": display,
                 "page": page,
                 "type": "JSON"
             }
             
             url = f"{legislation_config.search_base_url}?{urlencode(params)}"
             headers = {"Referer": "https://open.law.go.kr/"}
-            response = requests.get(url, headers=headers, timeout=30)
+            response = _SESSION.get(url, headers=headers, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             if _has_meaningful_content(data):
                 return TextContent(type="text", text=_format_law_articles(data, mst_str, url))
         except Exception as e:
@@ -2775,11 +3002,12 @@ def search_old_and_new_law(
         display: 결과 개수
         page: 페이지 번호
     """
+    display, page = _clamp_pagination(display, page)
     try:
         # 기본 파라미터 설정
         params = {
             "target": "oldAndNew",
-            "display": min(display, 100),
+            "display": display,
             "page": page
         }
         
@@ -2900,10 +3128,11 @@ def search_three_way_comparison(
         display: 결과 개수
         page: 페이지 번호
     """
+    display, page = _clamp_pagination(display, page)
     try:
         # 기본 파라미터 설정
         params = {
-            "display": min(display, 100),
+            "display": display,
             "page": page
         }
         
@@ -3146,10 +3375,11 @@ def search_one_view(query: Optional[str] = None, display: int = 20, page: int =
         display: 결과 개수
         page: 페이지 번호
     """
+    display, page = _clamp_pagination(display, page)
     try:
         # 기본 파라미터 설정
         params = {
-            "display": min(display, 100),
+            "display": display,
             "page": page
         }
         
@@ -3271,10 +3501,11 @@ def search_law_system_diagram(query: Optional[str] = None, display: int = 20, pa
         display: 결과 개수
         page: 페이지 번호
     """
+    display, page = _clamp_pagination(display, page)
     try:
         # 기본 파라미터 설정
         params = {
-            "display": min(display, 100),
+            "display": display,
             "page": page,
             "type": "JSON"
         }
@@ -4149,13 +4380,14 @@ def search_law_unified(
     law_type_code: Optional[str] = None
 ) -> TextContent:
     """통합 법령 검색"""
+    display, page = _clamp_pagination(display, page)
     if not query:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     try:
         params = {
             "query": query,
-            "display": min(display, 100),
+            "display": display,
             "page": page,
             "search": search
         }
@@ -22,8 +22,8 @@ logger = logging.getLogger(__name__)
 
 # 유틸리티 함수들 import
 from .law_tools import (
+    _clamp_pagination,
     _make_legislation_request,
-    _generate_api_url,
     _format_search_results
 )
 
@@ -41,11 +41,12 @@ from .law_tools import (
 사용 예시: search_legal_term("계약"), search_legal_term("소유권", display=50)""")
 def search_legal_term(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """법령용어 검색"""
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = {"query": search_query, "display": display, "page": page}
     try:
         data = _make_legislation_request("lstrm", params)
         result = _format_search_results(data, "lstrm", search_query)
@@ -63,11 +64,12 @@ def search_legal_term(query: Optional[str] = None, display: int = 20, page: int
 사용 예시: search_legal_term_ai("계약"), search_legal_term_ai("채권", display=50)""")
 def search_legal_term_ai(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """법령용어 AI 검색"""
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = {"query": search_query, "display": display, "page": page}
     try:
         data = _make_legislation_request("lstrmAI", params)
         result = _format_search_results(data, "lstrmAI", search_query)
@@ -85,11 +87,12 @@ def search_legal_term_ai(query: Optional[str] = None, display: int = 20, page: i
 사용 예시: search_daily_legal_term_link("약속")""")
 def search_daily_legal_term_link(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """일상용어-법령용어 연계 검색 (HTML만 지원)"""
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = {"query": search_query, "display": display, "page": page}
     try:
         data = _make_legislation_request("dlytrmRlt", params)
         # HTML 응답 처리
@@ -177,7 +180,6 @@ def get_legal_term_detail(term_id: Union[str, int]) -> TextContent:
     params = {"ID": str(term_id)}
     try:
         data = _make_legislation_request("lstrm", params, is_detail=True)
-        url = _generate_api_url("lstrm", params, is_detail=True)
         result = _format_search_results(data, "lstrm", str(term_id), 50)
         return TextContent(type="text", text=result)
     except Exception as e:
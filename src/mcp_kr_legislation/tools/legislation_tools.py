@@ -16,6 +16,7 @@ from mcp.types import TextContent
 
 from ..server import mcp
 from ..config import legislation_config
+from .law_tools import _SESSION, _json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -207,8 +208,6 @@ def _make_legislation_request(target: str, params: dict, is_detail: bool = False
         is_detail: True면 상세조회(lawService.do), False면 검색(lawSearch.do)
     """
     try:
-        import requests
-        
         # API 키 설정
         oc = os.getenv("LEGISLATION_API_KEY", "lchangoo")
         
@@ -233,10 +232,10 @@ def _make_legislation_request(target: str, params: dict, is_detail: bool = False
         
         # Referer 헤더 필수 (일부 API에서 404 방지)
         headers = {"Referer": "https://open.law.go.kr/"}
-        response = requests.get(url, params=base_params, headers=headers, timeout=15)
+        response = _SESSION.get(url, params=base_params, headers=headers, timeout=15)
         response.raise_for_status()
         
-        data = response.json()
+        data = _json_loads(response.content)
         return data
         
     except Exception as e:
@@ -19,6 +19,7 @@ logger = logging.getLogger(__name__)
 
 # 유틸리티 함수들 import (law_tools로 변경)
 from .law_tools import (
+    _clamp_pagination,
     _make_legislation_request,
     _generate_api_url,
     _format_search_results
@@ -44,11 +45,12 @@ def search_daily_term(query: Optional[str] = None, display: int = 20, page: int
         display: 결과 개수
         page: 페이지 번호
     """
+    display, page = _clamp_pagination(display, page)
     try:
         # 기본 파라미터 설정
         params = {
             "target": "dailyTerm",
-            "display": min(display, 100),
+            "display": display,
             "page": page
         }
         
@@ -85,11 +87,12 @@ def search_legal_daily_term_link(query: Optional[str] = None, display: int = 20,
         display: 결과 개수
         page: 페이지 번호
     """
+    display, page = _clamp_pagination(display, page)
     try:
         # 기본 파라미터 설정
         params = {
             "target": "legalDailyTermLink",
-            "display": min(display, 100),
+            "display": display,
             "page": page
         }
         
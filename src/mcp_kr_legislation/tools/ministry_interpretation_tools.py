@@ -21,7 +21,8 @@ logger = logging.getLogger(__name__)
 # 유틸리티 함수들 import
 from .law_tools import (
     _make_legislation_request,
-    _generate_api_url,
+    _normalize_query,
+    _build_search_params,
     _format_search_results
 )
 
@@ -39,11 +40,11 @@ from .law_tools import (
 사용 예시: search_moef_interpretation("예산"), search_moef_interpretation("재정", display=50)""")
 def search_moef_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """기획재정부 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("moefCgmExpc", params)
         result = _format_search_results(data, "moefCgmExpc", search_query)
@@ -61,11 +62,11 @@ def search_moef_interpretation(query: Optional[str] = None, display: int = 20, p
 사용 예시: search_molit_interpretation("건축"), search_molit_interpretation("도로", display=50)""")
 def search_molit_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """국토교통부 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("molitCgmExpc", params)
         result = _format_search_results(data, "molitCgmExpc", search_query)
@@ -83,11 +84,11 @@ def search_molit_interpretation(query: Optional[str] = None, display: int = 20,
 사용 예시: search_moel_interpretation("근로시간"), search_moel_interpretation("임금", display=50)""")
 def search_moel_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """고용노동부 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("moelCgmExpc", params)
         result = _format_search_results(data, "moelCgmExpc", search_query)
@@ -105,11 +106,11 @@ def search_moel_interpretation(query: Optional[str] = None, display: int = 20, p
 사용 예시: search_mof_interpretation("어업"), search_mof_interpretation("항만", display=50)""")
 def search_mof_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """해양수산부 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("mofCgmExpc", params)
         result = _format_search_results(data, "mofCgmExpc", search_query)
@@ -127,11 +128,11 @@ def search_mof_interpretation(query: Optional[str] = None, display: int = 20, pa
 사용 예시: search_mohw_interpretation("복지"), search_mohw_interpretation("의료", display=50)""")
 def search_mohw_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """보건복지부 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("mohwCgmExpc", params)
         result = _format_search_results(data, "mohwCgmExpc", search_query)
@@ -149,11 +150,11 @@ def search_mohw_interpretation(query: Optional[str] = None, display: int = 20, p
 사용 예시: search_moe_interpretation("교육"), search_moe_interpretation("학교", display=50)""")
 def search_moe_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """교육부 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("moeCgmExpc", params)
         result = _format_search_results(data, "moeCgmExpc", search_query)
@@ -171,11 +172,11 @@ def search_moe_interpretation(query: Optional[str] = None, display: int = 20, pa
 사용 예시: search_korea_interpretation("행정"), search_korea_interpretation("정책", display=50)""")
 def search_korea_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """한국 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("koreaCgmExpc", params)
         result = _format_search_results(data, "koreaCgmExpc", search_query)
@@ -193,11 +194,11 @@ def search_korea_interpretation(query: Optional[str] = None, display: int = 20,
 사용 예시: search_mssp_interpretation("보훈"), search_mssp_interpretation("유공자", display=50)""")
 def search_mssp_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """보훈처 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("msspCgmExpc", params)
         result = _format_search_results(data, "msspCgmExpc", search_query)
@@ -215,11 +216,11 @@ def search_mssp_interpretation(query: Optional[str] = None, display: int = 20, p
 사용 예시: search_mote_interpretation("공장"), search_mote_interpretation("면적", display=50)""")
 def search_mote_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """산업통상자원부 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("motieCgmExpc", params)
         result = _format_search_results(data, "motieCgmExpc", search_query)
@@ -237,11 +238,11 @@ def search_mote_interpretation(query: Optional[str] = None, display: int = 20, p
 사용 예시: search_maf_interpretation("농업"), search_maf_interpretation("축산", display=50)""")
 def search_maf_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """농림축산식품부 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("mafraCgmExpc", params)
         result = _format_search_results(data, "mafraCgmExpc", search_query)
@@ -259,11 +260,11 @@ def search_maf_interpretation(query: Optional[str] = None, display: int = 20, pa
 사용 예시: search_moms_interpretation("국방"), search_moms_interpretation("군사", display=50)""")
 def search_moms_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """국방부 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("mndCgmExpc", params)
         result = _format_search_results(data, "mndCgmExpc", search_query)
@@ -281,11 +282,11 @@ def search_moms_interpretation(query: Optional[str] = None, display: int = 20, p
 사용 예시: search_sme_interpretation("창업"), search_sme_interpretation("중소기업", display=50)""")
 def search_sme_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """중소벤처기업부 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("mssCgmExpc", params)
         result = _format_search_results(data, "mssCgmExpc", search_query)
@@ -303,11 +304,11 @@ def search_sme_interpretation(query: Optional[str] = None, display: int = 20, pa
 사용 예시: search_nfa_interpretation("산림"), search_nfa_interpretation("임업", display=50)""")
 def search_nfa_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """산림청 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("kfsCgmExpc", params)
         result = _format_search_results(data, "kfsCgmExpc", search_query)
@@ -325,11 +326,11 @@ def search_nfa_interpretation(query: Optional[str] = None, display: int = 20, pa
 사용 예시: search_korail_interpretation("철도"), search_korail_interpretation("운송", display=50)""")
 def search_korail_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """한국철도공사 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("korailCgmExpc", params)
         result = _format_search_results(data, "korailCgmExpc", search_query)
@@ -347,11 +348,11 @@ def search_korail_interpretation(query: Optional[str] = None, display: int = 20,
 사용 예시: search_nts_interpretation("소득세"), search_nts_interpretation("부가가치세", display=50)""")
 def search_nts_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """국세청 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("ntsCgmExpc", params)
         result = _format_search_results(data, "ntsCgmExpc", search_query)
@@ -369,11 +370,11 @@ def search_nts_interpretation(query: Optional[str] = None, display: int = 20, pa
 사용 예시: search_kcs_interpretation("관세"), search_kcs_interpretation("수입", display=50)""")
 def search_kcs_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """관세청 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("kcsCgmExpc", params)
         result = _format_search_results(data, "kcsCgmExpc", search_query)
@@ -396,7 +397,6 @@ def get_moef_interpretation_detail(interpretation_id: Union[str, int]) -> TextCo
     params = {"ID": str(interpretation_id)}
     try:
         data = _make_legislation_request("moefCgmExpc", params, is_detail=True)
-        url = _generate_api_url("moefCgmExpc", params, is_detail=True)
         result = _format_search_results(data, "moefCgmExpc", str(interpretation_id))
         return TextContent(type="text", text=result)
     except Exception as e:
@@ -413,7 +413,6 @@ def get_nts_interpretation_detail(interpretation_id: Union[str, int]) -> TextCon
     params = {"ID": str(interpretation_id)}
     try:
         data = _make_legislation_request("ntsCgmExpc", params, is_detail=True)
-        url = _generate_api_url("ntsCgmExpc", params, is_detail=True)
         result = _format_search_results(data, "ntsCgmExpc", str(interpretation_id))
         return TextContent(type="text", text=result)
     except Exception as e:
@@ -430,7 +429,6 @@ def get_kcs_interpretation_detail(interpretation_id: Union[str, int]) -> TextCon
     params = {"ID": str(interpretation_id)}
     try:
         data = _make_legislation_request("kcsCgmExpc", params, is_detail=True)
-        url = _generate_api_url("kcsCgmExpc", params, is_detail=True)
         result = _format_search_results(data, "kcsCgmExpc", str(interpretation_id))
         return TextContent(type="text", text=result)
     except Exception as e:
@@ -17,8 +17,9 @@ https://open.law.go.kr/LSO/openApi/guideList.do#
   ministry_interpretation_tools.py에 이미 존재하므로 중복 방지를 위해 제외
 """
 
+import asyncio
 import logging
-from typing import Optional, Union
+from typing import List, Optional, Union
 from mcp.types import TextContent
 
 from ..server import mcp
@@ -28,30 +29,44 @@ logger = logging.getLogger(__name__)
 
 from .law_tools import (
     _make_legislation_request,
+    _make_legislation_request_async,
+    _normalize_query,
+    _build_search_params,
     _generate_api_url,
     _format_search_results
 )
 
-# ===========================================
-# 중앙부처해석 확장 도구들 (올바른 target 값 적용)
-# ===========================================
-
-# --- 행정안전부 (moisCgmExpc) - 4,039건 ---
-@mcp.tool(name="search_mois_interpretation", description="""행정안전부 법령해석을 검색합니다.
+# 도구 설명 템플릿 (부처별로 label/slug/examples만 다름)
+_SEARCH_DESC = """{label} 법령해석을 검색합니다.
 
 매개변수:
 - query: 검색어 (필수)
 - display: 결과 개수 (최대 100)
 - page: 페이지 번호
 
-사용 예시: search_mois_interpretation("지방자치"), search_mois_interpretation("재난", display=50)""")
+사용 예시: search_{slug}_interpretation("{examples[0]}"), search_{slug}_interpretation("{examples[1]}", display=50)"""
+
+_DETAIL_DESC = """{label} 법령해석 상세내용을 조회합니다.
+
+매개변수:
+- interpretation_id: 해석례ID
+
+사용 예시: get_{slug}_interpretation_detail(interpretation_id="123456")"""
+
+# ===========================================
+# 중앙부처해석 확장 도구들 (올바른 target 값 적용)
+# ===========================================
+
+# --- 행정안전부 (moisCgmExpc) - 4,039건 ---
+@mcp.tool(name="search_mois_interpretation", description=_SEARCH_DESC.format(
+    label="행정안전부", slug="mois", examples=("지방자치", "재난")))
 def search_mois_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """행정안전부 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("moisCgmExpc", params)
         result = _format_search_results(data, "moisCgmExpc", search_query)
@@ -59,12 +74,7 @@ def search_mois_interpretation(query: Optional[str] = None, display: int = 20, p
     except Exception as e:
         return TextContent(type="text", text=f"행정안전부 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_mois_interpretation_detail", description="""행정안전부 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_mois_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_mois_interpretation_detail", description=_DETAIL_DESC.format(label="행정안전부", slug="mois"))
 def get_mois_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """행정안전부 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -76,21 +86,15 @@ def get_mois_interpretation_detail(interpretation_id: Union[str, int]) -> TextCo
         return TextContent(type="text", text=f"행정안전부 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 환경부 (meCgmExpc) - 2,291건 ---
-@mcp.tool(name="search_me_interpretation", description="""환경부(기후에너지환경부) 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_me_interpretation("환경영향평가"), search_me_interpretation("폐기물", display=50)""")
+@mcp.tool(name="search_me_interpretation", description=_SEARCH_DESC.format(
+    label="환경부(기후에너지환경부)", slug="me", examples=("환경영향평가", "폐기물")))
 def search_me_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """환경부 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("meCgmExpc", params)
         result = _format_search_results(data, "meCgmExpc", search_query)
@@ -98,12 +102,7 @@ def search_me_interpretation(query: Optional[str] = None, display: int = 20, pag
     except Exception as e:
         return TextContent(type="text", text=f"환경부 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_me_interpretation_detail", description="""환경부 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_me_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_me_interpretation_detail", description=_DETAIL_DESC.format(label="환경부", slug="me"))
 def get_me_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """환경부 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -115,21 +114,15 @@ def get_me_interpretation_detail(interpretation_id: Union[str, int]) -> TextCont
         return TextContent(type="text", text=f"환경부 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 문화체육관광부 (mcstCgmExpc) - 44건 ---
-@mcp.tool(name="search_mcst_interpretation", description="""문화체육관광부 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_mcst_interpretation("저작권"), search_mcst_interpretation("관광", display=50)""")
+@mcp.tool(name="search_mcst_interpretation", description=_SEARCH_DESC.format(
+    label="문화체육관광부", slug="mcst", examples=("저작권", "관광")))
 def search_mcst_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """문화체육관광부 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("mcstCgmExpc", params)
         result = _format_search_results(data, "mcstCgmExpc", search_query)
@@ -137,12 +130,7 @@ def search_mcst_interpretation(query: Optional[str] = None, display: int = 20, p
     except Exception as e:
         return TextContent(type="text", text=f"문화체육관광부 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_mcst_interpretation_detail", description="""문화체육관광부 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_mcst_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_mcst_interpretation_detail", description=_DETAIL_DESC.format(label="문화체육관광부", slug="mcst"))
 def get_mcst_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """문화체육관광부 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -154,21 +142,15 @@ def get_mcst_interpretation_detail(interpretation_id: Union[str, int]) -> TextCo
         return TextContent(type="text", text=f"문화체육관광부 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 법무부 (mojCgmExpc) ---
-@mcp.tool(name="search_moj_interpretation", description="""법무부 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_moj_interpretation("출입국"), search_moj_interpretation("형사", display=50)""")
+@mcp.tool(name="search_moj_interpretation", description=_SEARCH_DESC.format(
+    label="법무부", slug="moj", examples=("출입국", "형사")))
 def search_moj_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """법무부 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("mojCgmExpc", params)
         result = _format_search_results(data, "mojCgmExpc", search_query)
@@ -176,12 +158,7 @@ def search_moj_interpretation(query: Optional[str] = None, display: int = 20, pa
     except Exception as e:
         return TextContent(type="text", text=f"법무부 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_moj_interpretation_detail", description="""법무부 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_moj_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_moj_interpretation_detail", description=_DETAIL_DESC.format(label="법무부", slug="moj"))
 def get_moj_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """법무부 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -193,21 +170,15 @@ def get_moj_interpretation_detail(interpretation_id: Union[str, int]) -> TextCon
         return TextContent(type="text", text=f"법무부 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 성평등가족부 (mogefCgmExpc) - 구 여성가족부 ---
-@mcp.tool(name="search_mogef_interpretation", description="""성평등가족부(구 여성가족부) 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_mogef_interpretation("양육"), search_mogef_interpretation("가정폭력", display=50)""")
+@mcp.tool(name="search_mogef_interpretation", description=_SEARCH_DESC.format(
+    label="성평등가족부(구 여성가족부)", slug="mogef", examples=("양육", "가정폭력")))
 def search_mogef_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """성평등가족부 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("mogefCgmExpc", params)
         result = _format_search_results(data, "mogefCgmExpc", search_query)
@@ -215,12 +186,7 @@ def search_mogef_interpretation(query: Optional[str] = None, display: int = 20,
     except Exception as e:
         return TextContent(type="text", text=f"성평등가족부 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_mogef_interpretation_detail", description="""성평등가족부 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_mogef_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_mogef_interpretation_detail", description=_DETAIL_DESC.format(label="성평등가족부", slug="mogef"))
 def get_mogef_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """성평등가족부 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -232,21 +198,15 @@ def get_mogef_interpretation_detail(interpretation_id: Union[str, int]) -> TextC
         return TextContent(type="text", text=f"성평등가족부 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 외교부 (mofaCgmExpc) - 17건 ---
-@mcp.tool(name="search_mofa_interpretation", description="""외교부 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_mofa_interpretation("비자"), search_mofa_interpretation("외교", display=50)""")
+@mcp.tool(name="search_mofa_interpretation", description=_SEARCH_DESC.format(
+    label="외교부", slug="mofa", examples=("비자", "외교")))
 def search_mofa_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """외교부 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("mofaCgmExpc", params)
         result = _format_search_results(data, "mofaCgmExpc", search_query)
@@ -254,12 +214,7 @@ def search_mofa_interpretation(query: Optional[str] = None, display: int = 20, p
     except Exception as e:
         return TextContent(type="text", text=f"외교부 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_mofa_interpretation_detail", description="""외교부 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_mofa_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_mofa_interpretation_detail", description=_DETAIL_DESC.format(label="외교부", slug="mofa"))
 def get_mofa_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """외교부 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -271,21 +226,15 @@ def get_mofa_interpretation_detail(interpretation_id: Union[str, int]) -> TextCo
         return TextContent(type="text", text=f"외교부 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 통일부 (mouCgmExpc) - 6건 ---
-@mcp.tool(name="search_unikorea_interpretation", description="""통일부 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_unikorea_interpretation("북한"), search_unikorea_interpretation("통일", display=50)""")
+@mcp.tool(name="search_unikorea_interpretation", description=_SEARCH_DESC.format(
+    label="통일부", slug="unikorea", examples=("북한", "통일")))
 def search_unikorea_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """통일부 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("mouCgmExpc", params)
         result = _format_search_results(data, "mouCgmExpc", search_query)
@@ -293,12 +242,7 @@ def search_unikorea_interpretation(query: Optional[str] = None, display: int = 2
     except Exception as e:
         return TextContent(type="text", text=f"통일부 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_unikorea_interpretation_detail", description="""통일부 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_unikorea_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_unikorea_interpretation_detail", description=_DETAIL_DESC.format(label="통일부", slug="unikorea"))
 def get_unikorea_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """통일부 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -310,21 +254,15 @@ def get_unikorea_interpretation_detail(interpretation_id: Union[str, int]) -> Te
         return TextContent(type="text", text=f"통일부 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 법제처 (molegCgmExpc) - 17건 ---
-@mcp.tool(name="search_moleg_interpretation", description="""법제처 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_moleg_interpretation("법령"), search_moleg_interpretation("해석", display=50)""")
+@mcp.tool(name="search_moleg_interpretation", description=_SEARCH_DESC.format(
+    label="법제처", slug="moleg", examples=("법령", "해석")))
 def search_moleg_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """법제처 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("molegCgmExpc", params)
         result = _format_search_results(data, "molegCgmExpc", search_query)
@@ -332,12 +270,7 @@ def search_moleg_interpretation(query: Optional[str] = None, display: int = 20,
     except Exception as e:
         return TextContent(type="text", text=f"법제처 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_moleg_interpretation_detail", description="""법제처 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_moleg_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_moleg_interpretation_detail", description=_DETAIL_DESC.format(label="법제처", slug="moleg"))
 def get_moleg_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """법제처 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -349,21 +282,15 @@ def get_moleg_interpretation_detail(interpretation_id: Union[str, int]) -> TextC
         return TextContent(type="text", text=f"법제처 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 식품의약품안전처 (mfdsCgmExpc) - 1,216건 ---
-@mcp.tool(name="search_mfds_interpretation", description="""식품의약품안전처 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_mfds_interpretation("식품"), search_mfds_interpretation("의약품", display=50)""")
+@mcp.tool(name="search_mfds_interpretation", description=_SEARCH_DESC.format(
+    label="식품의약품안전처", slug="mfds", examples=("식품", "의약품")))
 def search_mfds_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """식품의약품안전처 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("mfdsCgmExpc", params)
         result = _format_search_results(data, "mfdsCgmExpc", search_query)
@@ -371,12 +298,7 @@ def search_mfds_interpretation(query: Optional[str] = None, display: int = 20, p
     except Exception as e:
         return TextContent(type="text", text=f"식품의약품안전처 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_mfds_interpretation_detail", description="""식품의약품안전처 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_mfds_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_mfds_interpretation_detail", description=_DETAIL_DESC.format(label="식품의약품안전처", slug="mfds"))
 def get_mfds_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """식품의약품안전처 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -388,21 +310,15 @@ def get_mfds_interpretation_detail(interpretation_id: Union[str, int]) -> TextCo
         return TextContent(type="text", text=f"식품의약품안전처 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 인사혁신처 (mpmCgmExpc) - 10건 ---
-@mcp.tool(name="search_mpm_interpretation", description="""인사혁신처 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_mpm_interpretation("인사"), search_mpm_interpretation("공무원", display=50)""")
+@mcp.tool(name="search_mpm_interpretation", description=_SEARCH_DESC.format(
+    label="인사혁신처", slug="mpm", examples=("인사", "공무원")))
 def search_mpm_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """인사혁신처 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("mpmCgmExpc", params)
         result = _format_search_results(data, "mpmCgmExpc", search_query)
@@ -410,12 +326,7 @@ def search_mpm_interpretation(query: Optional[str] = None, display: int = 20, pa
     except Exception as e:
         return TextContent(type="text", text=f"인사혁신처 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_mpm_interpretation_detail", description="""인사혁신처 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_mpm_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_mpm_interpretation_detail", description=_DETAIL_DESC.format(label="인사혁신처", slug="mpm"))
 def get_mpm_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """인사혁신처 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -427,21 +338,15 @@ def get_mpm_interpretation_detail(interpretation_id: Union[str, int]) -> TextCon
         return TextContent(type="text", text=f"인사혁신처 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 기상청 (kmaCgmExpc) - 21건 ---
-@mcp.tool(name="search_kma_interpretation", description="""기상청 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_kma_interpretation("기상"), search_kma_interpretation("예보", display=50)""")
+@mcp.tool(name="search_kma_interpretation", description=_SEARCH_DESC.format(
+    label="기상청", slug="kma", examples=("기상", "예보")))
 def search_kma_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """기상청 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("kmaCgmExpc", params)
         result = _format_search_results(data, "kmaCgmExpc", search_query)
@@ -449,12 +354,7 @@ def search_kma_interpretation(query: Optional[str] = None, display: int = 20, pa
     except Exception as e:
         return TextContent(type="text", text=f"기상청 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_kma_interpretation_detail", description="""기상청 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_kma_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_kma_interpretation_detail", description=_DETAIL_DESC.format(label="기상청", slug="kma"))
 def get_kma_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """기상청 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -466,21 +366,15 @@ def get_kma_interpretation_detail(interpretation_id: Union[str, int]) -> TextCon
         return TextContent(type="text", text=f"기상청 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 국가유산청 (khaCgmExpc) ---
-@mcp.tool(name="search_cha_interpretation", description="""국가유산청 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_cha_interpretation("유산"), search_cha_interpretation("문화재", display=50)""")
+@mcp.tool(name="search_cha_interpretation", description=_SEARCH_DESC.format(
+    label="국가유산청", slug="cha", examples=("유산", "문화재")))
 def search_cha_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """국가유산청 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("khaCgmExpc", params)
         result = _format_search_results(data, "khaCgmExpc", search_query)
@@ -488,12 +382,7 @@ def search_cha_interpretation(query: Optional[str] = None, display: int = 20, pa
     except Exception as e:
         return TextContent(type="text", text=f"국가유산청 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_cha_interpretation_detail", description="""국가유산청 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_cha_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_cha_interpretation_detail", description=_DETAIL_DESC.format(label="국가유산청", slug="cha"))
 def get_cha_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """국가유산청 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -505,21 +394,15 @@ def get_cha_interpretation_detail(interpretation_id: Union[str, int]) -> TextCon
         return TextContent(type="text", text=f"국가유산청 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 농촌진흥청 (rdaCgmExpc) - 6건 ---
-@mcp.tool(name="search_rda_interpretation", description="""농촌진흥청 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_rda_interpretation("농업"), search_rda_interpretation("진흥", display=50)""")
+@mcp.tool(name="search_rda_interpretation", description=_SEARCH_DESC.format(
+    label="농촌진흥청", slug="rda", examples=("농업", "진흥")))
 def search_rda_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """농촌진흥청 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("rdaCgmExpc", params)
         result = _format_search_results(data, "rdaCgmExpc", search_query)
@@ -527,12 +410,7 @@ def search_rda_interpretation(query: Optional[str] = None, display: int = 20, pa
     except Exception as e:
         return TextContent(type="text", text=f"농촌진흥청 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_rda_interpretation_detail", description="""농촌진흥청 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_rda_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_rda_interpretation_detail", description=_DETAIL_DESC.format(label="농촌진흥청", slug="rda"))
 def get_rda_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """농촌진흥청 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -544,21 +422,15 @@ def get_rda_interpretation_detail(interpretation_id: Union[str, int]) -> TextCon
         return TextContent(type="text", text=f"농촌진흥청 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 경찰청 (knpaCgmExpc) ---
-@mcp.tool(name="search_police_interpretation", description="""경찰청 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_police_interpretation("경찰"), search_police_interpretation("치안", display=50)""")
+@mcp.tool(name="search_police_interpretation", description=_SEARCH_DESC.format(
+    label="경찰청", slug="police", examples=("경찰", "치안")))
 def search_police_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """경찰청 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("knpaCgmExpc", params)
         result = _format_search_results(data, "knpaCgmExpc", search_query)
@@ -566,12 +438,7 @@ def search_police_interpretation(query: Optional[str] = None, display: int = 20,
     except Exception as e:
         return TextContent(type="text", text=f"경찰청 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_police_interpretation_detail", description="""경찰청 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_police_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_police_interpretation_detail", description=_DETAIL_DESC.format(label="경찰청", slug="police"))
 def get_police_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """경찰청 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -583,21 +450,15 @@ def get_police_interpretation_detail(interpretation_id: Union[str, int]) -> Text
         return TextContent(type="text", text=f"경찰청 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 방위사업청 (dapaCgmExpc) - 46건 ---
-@mcp.tool(name="search_dapa_interpretation", description="""방위사업청 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_dapa_interpretation("방위"), search_dapa_interpretation("무기", display=50)""")
+@mcp.tool(name="search_dapa_interpretation", description=_SEARCH_DESC.format(
+    label="방위사업청", slug="dapa", examples=("방위", "무기")))
 def search_dapa_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """방위사업청 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("dapaCgmExpc", params)
         result = _format_search_results(data, "dapaCgmExpc", search_query)
@@ -605,12 +466,7 @@ def search_dapa_interpretation(query: Optional[str] = None, display: int = 20, p
     except Exception as e:
         return TextContent(type="text", text=f"방위사업청 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_dapa_interpretation_detail", description="""방위사업청 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_dapa_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_dapa_interpretation_detail", description=_DETAIL_DESC.format(label="방위사업청", slug="dapa"))
 def get_dapa_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """방위사업청 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -622,21 +478,15 @@ def get_dapa_interpretation_detail(interpretation_id: Union[str, int]) -> TextCo
         return TextContent(type="text", text=f"방위사업청 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 병무청 (mmaCgmExpc) ---
-@mcp.tool(name="search_mma_interpretation", description="""병무청 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_mma_interpretation("병역"), search_mma_interpretation("입영", display=50)""")
+@mcp.tool(name="search_mma_interpretation", description=_SEARCH_DESC.format(
+    label="병무청", slug="mma", examples=("병역", "입영")))
 def search_mma_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """병무청 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("mmaCgmExpc", params)
         result = _format_search_results(data, "mmaCgmExpc", search_query)
@@ -644,12 +494,7 @@ def search_mma_interpretation(query: Optional[str] = None, display: int = 20, pa
     except Exception as e:
         return TextContent(type="text", text=f"병무청 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_mma_interpretation_detail", description="""병무청 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_mma_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_mma_interpretation_detail", description=_DETAIL_DESC.format(label="병무청", slug="mma"))
 def get_mma_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """병무청 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -661,21 +506,15 @@ def get_mma_interpretation_detail(interpretation_id: Union[str, int]) -> TextCon
         return TextContent(type="text", text=f"병무청 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 소방청 (nfaCgmExpc) - 328건 ---
-@mcp.tool(name="search_fire_agency_interpretation", description="""소방청 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_fire_agency_interpretation("소방"), search_fire_agency_interpretation("화재", display=50)""")
+@mcp.tool(name="search_fire_agency_interpretation", description=_SEARCH_DESC.format(
+    label="소방청", slug="fire_agency", examples=("소방", "화재")))
 def search_fire_agency_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """소방청 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("nfaCgmExpc", params)
         result = _format_search_results(data, "nfaCgmExpc", search_query)
@@ -683,12 +522,7 @@ def search_fire_agency_interpretation(query: Optional[str] = None, display: int
     except Exception as e:
         return TextContent(type="text", text=f"소방청 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_fire_agency_interpretation_detail", description="""소방청 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_fire_agency_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_fire_agency_interpretation_detail", description=_DETAIL_DESC.format(label="소방청", slug="fire_agency"))
 def get_fire_agency_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """소방청 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -700,21 +534,15 @@ def get_fire_agency_interpretation_detail(interpretation_id: Union[str, int]) ->
         return TextContent(type="text", text=f"소방청 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 조달청 (ppsCgmExpc) - 23건 ---
-@mcp.tool(name="search_pps_interpretation", description="""조달청 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_pps_interpretation("조달"), search_pps_interpretation("계약", display=50)""")
+@mcp.tool(name="search_pps_interpretation", description=_SEARCH_DESC.format(
+    label="조달청", slug="pps", examples=("조달", "계약")))
 def search_pps_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """조달청 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("ppsCgmExpc", params)
         result = _format_search_results(data, "ppsCgmExpc", search_query)
@@ -722,12 +550,7 @@ def search_pps_interpretation(query: Optional[str] = None, display: int = 20, pa
     except Exception as e:
         return TextContent(type="text", text=f"조달청 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_pps_interpretation_detail", description="""조달청 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_pps_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_pps_interpretation_detail", description=_DETAIL_DESC.format(label="조달청", slug="pps"))
 def get_pps_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """조달청 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -739,21 +562,15 @@ def get_pps_interpretation_detail(interpretation_id: Union[str, int]) -> TextCon
         return TextContent(type="text", text=f"조달청 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 질병관리청 (kdcaCgmExpc) ---
-@mcp.tool(name="search_kdca_interpretation", description="""질병관리청 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_kdca_interpretation("질병"), search_kdca_interpretation("감염", display=50)""")
+@mcp.tool(name="search_kdca_interpretation", description=_SEARCH_DESC.format(
+    label="질병관리청", slug="kdca", examples=("질병", "감염")))
 def search_kdca_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """질병관리청 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("kdcaCgmExpc", params)
         result = _format_search_results(data, "kdcaCgmExpc", search_query)
@@ -761,12 +578,7 @@ def search_kdca_interpretation(query: Optional[str] = None, display: int = 20, p
     except Exception as e:
         return TextContent(type="text", text=f"질병관리청 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_kdca_interpretation_detail", description="""질병관리청 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_kdca_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_kdca_interpretation_detail", description=_DETAIL_DESC.format(label="질병관리청", slug="kdca"))
 def get_kdca_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """질병관리청 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -778,21 +590,15 @@ def get_kdca_interpretation_detail(interpretation_id: Union[str, int]) -> TextCo
         return TextContent(type="text", text=f"질병관리청 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 해양경찰청 (kcgCgmExpc) ---
-@mcp.tool(name="search_kcg_interpretation", description="""해양경찰청 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_kcg_interpretation("해양"), search_kcg_interpretation("경찰", display=50)""")
+@mcp.tool(name="search_kcg_interpretation", description=_SEARCH_DESC.format(
+    label="해양경찰청", slug="kcg", examples=("해양", "경찰")))
 def search_kcg_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """해양경찰청 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("kcgCgmExpc", params)
         result = _format_search_results(data, "kcgCgmExpc", search_query)
@@ -800,12 +606,7 @@ def search_kcg_interpretation(query: Optional[str] = None, display: int = 20, pa
     except Exception as e:
         return TextContent(type="text", text=f"해양경찰청 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_kcg_interpretation_detail", description="""해양경찰청 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_kcg_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_kcg_interpretation_detail", description=_DETAIL_DESC.format(label="해양경찰청", slug="kcg"))
 def get_kcg_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """해양경찰청 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -817,21 +618,15 @@ def get_kcg_interpretation_detail(interpretation_id: Union[str, int]) -> TextCon
         return TextContent(type="text", text=f"해양경찰청 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 국가보훈부 (mpvaCgmExpc) - 116건 ---
-@mcp.tool(name="search_mpva_interpretation", description="""국가보훈부 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_mpva_interpretation("보훈"), search_mpva_interpretation("유공자", display=50)""")
+@mcp.tool(name="search_mpva_interpretation", description=_SEARCH_DESC.format(
+    label="국가보훈부", slug="mpva", examples=("보훈", "유공자")))
 def search_mpva_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """국가보훈부 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("mpvaCgmExpc", params)
         result = _format_search_results(data, "mpvaCgmExpc", search_query)
@@ -839,12 +634,7 @@ def search_mpva_interpretation(query: Optional[str] = None, display: int = 20, p
     except Exception as e:
         return TextContent(type="text", text=f"국가보훈부 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_mpva_interpretation_detail", description="""국가보훈부 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_mpva_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_mpva_interpretation_detail", description=_DETAIL_DESC.format(label="국가보훈부", slug="mpva"))
 def get_mpva_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """국가보훈부 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -856,21 +646,15 @@ def get_mpva_interpretation_detail(interpretation_id: Union[str, int]) -> TextCo
         return TextContent(type="text", text=f"국가보훈부 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 국가데이터처 (kostatCgmExpc) ---
-@mcp.tool(name="search_kostat_interpretation", description="""국가데이터처 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_kostat_interpretation("통계"), search_kostat_interpretation("데이터", display=50)""")
+@mcp.tool(name="search_kostat_interpretation", description=_SEARCH_DESC.format(
+    label="국가데이터처", slug="kostat", examples=("통계", "데이터")))
 def search_kostat_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """국가데이터처 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("kostatCgmExpc", params)
         result = _format_search_results(data, "kostatCgmExpc", search_query)
@@ -878,12 +662,7 @@ def search_kostat_interpretation(query: Optional[str] = None, display: int = 20,
     except Exception as e:
         return TextContent(type="text", text=f"국가데이터처 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_kostat_interpretation_detail", description="""국가데이터처 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_kostat_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_kostat_interpretation_detail", description=_DETAIL_DESC.format(label="국가데이터처", slug="kostat"))
 def get_kostat_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """국가데이터처 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -895,21 +674,15 @@ def get_kostat_interpretation_detail(interpretation_id: Union[str, int]) -> Text
         return TextContent(type="text", text=f"국가데이터처 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 지식재산처 (kipoCgmExpc) ---
-@mcp.tool(name="search_kipo_interpretation", description="""지식재산처 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_kipo_interpretation("특허"), search_kipo_interpretation("상표", display=50)""")
+@mcp.tool(name="search_kipo_interpretation", description=_SEARCH_DESC.format(
+    label="지식재산처", slug="kipo", examples=("특허", "상표")))
 def search_kipo_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """지식재산처 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("kipoCgmExpc", params)
         result = _format_search_results(data, "kipoCgmExpc", search_query)
@@ -917,12 +690,7 @@ def search_kipo_interpretation(query: Optional[str] = None, display: int = 20, p
     except Exception as e:
         return TextContent(type="text", text=f"지식재산처 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_kipo_interpretation_detail", description="""지식재산처 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_kipo_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_kipo_interpretation_detail", description=_DETAIL_DESC.format(label="지식재산처", slug="kipo"))
 def get_kipo_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """지식재산처 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -934,21 +702,15 @@ def get_kipo_interpretation_detail(interpretation_id: Union[str, int]) -> TextCo
         return TextContent(type="text", text=f"지식재산처 법령해석 상세조회 중 오류: {str(e)}")
 
 # --- 행정중심복합도시건설청 (naaccCgmExpc) ---
-@mcp.tool(name="search_naacc_interpretation", description="""행정중심복합도시건설청 법령해석을 검색합니다.
-
-매개변수:
-- query: 검색어 (필수)
-- display: 결과 개수 (최대 100)
-- page: 페이지 번호
-
-사용 예시: search_naacc_interpretation("도시"), search_naacc_interpretation("건설", display=50)""")
+@mcp.tool(name="search_naacc_interpretation", description=_SEARCH_DESC.format(
+    label="행정중심복합도시건설청", slug="naacc", examples=("도시", "건설")))
 def search_naacc_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """행정중심복합도시건설청 법령해석 검색"""
-    if not query or not query.strip():
+    search_query = _normalize_query(query)
+    if search_query is None:
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
+    params = _build_search_params(search_query, display, page)
     try:
         data = _make_legislation_request("naaccCgmExpc", params)
         result = _format_search_results(data, "naaccCgmExpc", search_query)
@@ -956,12 +718,7 @@ def search_naacc_interpretation(query: Optional[str] = None, display: int = 20,
     except Exception as e:
         return TextContent(type="text", text=f"행정중심복합도시건설청 법령해석 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_naacc_interpretation_detail", description="""행정중심복합도시건설청 법령해석 상세내용을 조회합니다.
-
-매개변수:
-- interpretation_id: 해석례ID
-
-사용 예시: get_naacc_interpretation_detail(interpretation_id="123456")""")
+@mcp.tool(name="get_naacc_interpretation_detail", description=_DETAIL_DESC.format(label="행정중심복합도시건설청", slug="naacc"))
 def get_naacc_interpretation_detail(interpretation_id: Union[str, int]) -> TextContent:
     """행정중심복합도시건설청 법령해석 상세 조회"""
     params = {"ID": str(interpretation_id)}
@@ -972,6 +729,109 @@ def get_naacc_interpretation_detail(interpretation_id: Union[str, int]) -> TextC
     except Exception as e:
         return TextContent(type="text", text=f"행정중심복합도시건설청 법령해석 상세조회 중 오류: {str(e)}")
 
+# ===========================================
+# 다부처 동시 검색
+# ===========================================
+
+# 부처 slug → (부처명, API target) - search_{slug}_interpretation 도구와 동일한 target
+MINISTRY_ENDPOINTS = {
+    "moef": ("기획재정부", "moefCgmExpc"),
+    "molit": ("국토교통부", "molitCgmExpc"),
+    "moel": ("고용노동부", "moelCgmExpc"),
+    "mof": ("해양수산부", "mofCgmExpc"),
+    "mohw": ("보건복지부", "mohwCgmExpc"),
+    "moe": ("교육부", "moeCgmExpc"),
+    "korea": ("한국", "koreaCgmExpc"),
+    "mssp": ("보훈처", "msspCgmExpc"),
+    "mote": ("산업통상자원부", "motieCgmExpc"),
+    "maf": ("농림축산식품부", "mafraCgmExpc"),
+    "moms": ("국방부", "mndCgmExpc"),
+    "sme": ("중소벤처기업부", "mssCgmExpc"),
+    "nfa": ("산림청", "kfsCgmExpc"),
+    "korail": ("한국철도공사", "korailCgmExpc"),
+    "nts": ("국세청", "ntsCgmExpc"),
+    "kcs": ("관세청", "kcsCgmExpc"),
+    "mois": ("행정안전부", "moisCgmExpc"),
+    "me": ("환경부", "meCgmExpc"),
+    "mcst": ("문화체육관광부", "mcstCgmExpc"),
+    "moj": ("법무부", "mojCgmExpc"),
+    "mogef": ("성평등가족부", "mogefCgmExpc"),
+    "mofa": ("외교부", "mofaCgmExpc"),
+    "unikorea": ("통일부", "mouCgmExpc"),
+    "moleg": ("법제처", "molegCgmExpc"),
+    "mfds": ("식품의약품안전처", "mfdsCgmExpc"),
+    "mpm": ("인사혁신처", "mpmCgmExpc"),
+    "kma": ("기상청", "kmaCgmExpc"),
+    "cha": ("국가유산청", "khaCgmExpc"),
+    "rda": ("농촌진흥청", "rdaCgmExpc"),
+    "police": ("경찰청", "knpaCgmExpc"),
+    "dapa": ("방위사업청", "dapaCgmExpc"),
+    "mma": ("병무청", "mmaCgmExpc"),
+    "fire_agency": ("소방청", "nfaCgmExpc"),
+    "pps": ("조달청", "ppsCgmExpc"),
+    "kdca": ("질병관리청", "kdcaCgmExpc"),
+    "kcg": ("해양경찰청", "kcgCgmExpc"),
+    "mpva": ("국가보훈부", "mpvaCgmExpc"),
+    "kostat": ("국가데이터처", "kostatCgmExpc"),
+    "kipo": ("지식재산처", "kipoCgmExpc"),
+    "naacc": ("행정중심복합도시건설청", "naaccCgmExpc"),
+}
+
+_HR = "=" * 50
+
+# 부처별 동시 요청 수 상한 (공유 세션 연결 풀과 to_thread 워커를 독점하지 않도록)
+_MULTI_CONCURRENCY = 8
+
+@mcp.tool(name="search_interpretations_multi", description="""여러 중앙부처의 법령해석을 동시에 검색합니다.
+
+매개변수:
+- query: 검색어 (필수)
+- ministries: 검색할 부처 목록 (필수, search_{부처}_interpretation의 부처 부분, 예: ["kdca", "kcg", "mpva"])
+- display: 부처별 결과 개수 (최대 100)
+
+사용 예시: search_interpretations_multi("감염병", ministries=["kdca", "kcg", "mpva"])""")
+async def search_interpretations_multi(
+    query: Optional[str] = None,
+    ministries: Optional[List[str]] = None,
+    display: int = 20
+) -> TextContent:
+    """여러 부처 법령해석 동시 검색 - 부처별 요청을 병렬로 실행하여 전체 대기시간을 최대 1회 왕복 수준으로 단축"""
+    search_query = _normalize_query(query)
+    if search_query is None:
+        return TextContent(type="text", text="검색어를 입력해주세요.")
+    
+    if not ministries:
+        return TextContent(type="text", text=f"검색할 부처 목록(ministries)을 입력해주세요.\n\n"
+                                             f"사용 가능한 부처: {', '.join(MINISTRY_ENDPOINTS)}")
+    
+    # 같은 부처가 여러 번 주어져도 한 번만 요청/출력
+    slugs = list(dict.fromkeys(ministries))
+    unknown = [slug for slug in slugs if slug not in MINISTRY_ENDPOINTS]
+    if unknown:
+        return TextContent(type="text", text=f"지원하지 않는 부처입니다: {', '.join(unknown)}\n\n"
+                                             f"사용 가능한 부처: {', '.join(MINISTRY_ENDPOINTS)}")
+    
+    params = _build_search_params(search_query, display, 1)
+    semaphore = asyncio.Semaphore(_MULTI_CONCURRENCY)
+    
+    async def _search(slug: str) -> str:
+        target = MINISTRY_ENDPOINTS[slug][1]
+        async with semaphore:
+            data = await _make_legislation_request_async(target, params)
+        return _format_search_results(data, target, search_query)
+    
+    # 한 부처의 실패가 나머지 결과에 영향을 주지 않도록 예외도 결과로 수집
+    results = await asyncio.gather(*(_search(slug) for slug in slugs), return_exceptions=True)
+    
+    sections = []
+    for slug, result in zip(slugs, results):
+        label = MINISTRY_ENDPOINTS[slug][0]
+        if isinstance(result, BaseException):
+            result = f"{label} 법령해석 검색 중 오류: {str(result)}"
+        sections.append(f"## {label} ({slug})\n\n{result}")
+    
+    return TextContent(type="text", text=f"\n\n{_HR}\n\n".join(sections))
+
 # ===========================================
 # 로깅
 # ===========================================
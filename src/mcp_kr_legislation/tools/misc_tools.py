@@ -5,11 +5,7 @@
 """
 
 import logging
-import json
-import os
-import requests
-from urllib.parse import urlencode
-from typing import Optional, Union, Annotated
+from typing import Union
 from mcp.types import TextContent
 
 from ..server import mcp
@@ -19,11 +15,20 @@ logger = logging.getLogger(__name__)
 
 # 유틸리티 함수들 import (law_tools로 변경)
 from .law_tools import (
+    _SESSION,
+    _json_loads,
     _make_legislation_request,
     _generate_api_url,
     _format_search_results
 )
 
+# 구분선 (매 호출마다 문자열을 새로 만들지 않도록 모듈 상수로 유지)
+_HR = "=" * 50
+_HR_NL = _HR + "\n"
+
+# 별표서식 본문 후보 필드 (우선순위 순)
+_APPENDIX_CONTENT_FIELDS = ('내용', 'content', 'text', '별표내용', 'body')
+
 # ===========================================
 # 기타 도구들 (자치법규, 조약 등)
 # ===========================================
@@ -48,27 +53,26 @@ def get_ordinance_detail(ordinance_id: Union[str, int]) -> TextContent:
         params = {"target": "ordin", "ID": str(ordinance_id)}
         
         # 올바른 API 엔드포인트 사용 (lawService.do)
-        oc = os.getenv("LEGISLATION_API_KEY", "lchangoo")
+        oc = legislation_config.oc
         url = f"http://www.law.go.kr/DRF/lawService.do?OC={oc}&target=ordin&ID={ordinance_id}&type=JSON"
         
-        # API 요청 - 직접 requests 사용 (Referer 헤더 필수)
+        # API 요청 - 공용 세션 사용 (Referer 헤더 필수)
         headers = {"Referer": "https://open.law.go.kr/"}
-        response = requests.get(url, headers=headers, timeout=15)
+        response = _SESSION.get(url, headers=headers, timeout=15)
         response.raise_for_status()
         
-        data = response.json()
+        data = _json_loads(response.content)
         
         # 결과 포맷팅
         result = f"**자치법규 상세 정보** (ID: {ordinance_id})\n"
-        result += "=" * 50 + "\n\n"
+        result += _HR_NL + "\n"
         
-        if 'LawService' in data and data['LawService']:
-            law_service = data['LawService']
-            
+        # 각 항목은 dict가 아닐 수 있으므로(문자열·목록) dict인 경우에만 .get 사용
+        law_service = data.get('LawService')
+        if isinstance(law_service, dict) and law_service:
             # 자치법규 기본정보 확인
-            if '자치법규기본정보' in law_service:
-                basic_info = law_service['자치법규기본정보']
-                
+            basic_info = law_service.get('자치법규기본정보')
+            if isinstance(basic_info, dict) and basic_info:
                 # 기본 정보 출력
                 basic_fields = {
                     '자치법규명': '자치법규명',
@@ -81,17 +85,19 @@ def get_ordinance_detail(ordinance_id: Union[str, int]) -> TextContent:
                 }
                 
                 for field_name, field_key in basic_fields.items():
-                    if field_key in basic_info and basic_info[field_key]:
-                        result += f"**{field_name}**: {basic_info[field_key]}\n"
+                    value = basic_info.get(field_key)
+                    if value:
+                        result += f"**{field_name}**: {value}\n"
                 
-                result += "\n" + "=" * 50 + "\n\n"
+                result += "\n" + _HR_NL + "\n"
                 
                 # 조문 내용 출력
-                if '조문' in law_service and law_service['조문']:
-                    조문_data = law_service['조문']
-                    if '조' in 조문_data and 조문_data['조']:
+                조문_data = law_service.get('조문')
+                if 조문_data:
+                    조_list = 조문_data.get('조') if isinstance(조문_data, dict) else None
+                    if 조_list:
                         result += "**조문 내용:**\n\n"
-                        for 조 in 조문_data['조']:
+                        for 조 in 조_list:
                             if '조제목' in 조 and '조내용' in 조:
                                 result += f"**{조['조제목']}**\n"
                                 result += f"{조['조내용']}\n\n"
@@ -101,23 +107,24 @@ def get_ordinance_detail(ordinance_id: Union[str, int]) -> TextContent:
                     result += "조문 내용을 찾을 수 없습니다.\n\n"
                 
                 # 부칙 정보 출력
-                if '부칙' in law_service and law_service['부칙']:
-                    부칙_data = law_service['부칙']
-                    if '부칙내용' in 부칙_data and 부칙_data['부칙내용']:
+                부칙_data = law_service.get('부칙')
+                if isinstance(부칙_data, dict):
+                    부칙내용 = 부칙_data.get('부칙내용')
+                    if 부칙내용:
                         result += "**부칙:**\n"
-                        result += f"{부칙_data['부칙내용']}\n\n"
+                        result += f"{부칙내용}\n\n"
             else:
                 result += "자치법규 기본정보를 찾을 수 없습니다.\n\n"
         else:
             result += "자치법규 정보를 찾을 수 없습니다.\n\n"
         
-        result += "=" * 50 + "\n"
+        result += _HR_NL
         result += f"**API URL**: {url}\n"
         
         return TextContent(type="text", text=result)
         
     except Exception as e:
-        logger.error(f"자치법규 상세조회 중 오류: {e}")
+        logger.error("자치법규 상세조회 중 오류: %s", e)
         return TextContent(type="text", text=f"자치법규 상세조회 중 오류가 발생했습니다: {str(e)}")
 
 @mcp.tool(name="get_treaty_detail", description="""조약의 상세내용을 조회합니다.
@@ -144,14 +151,14 @@ def get_treaty_detail(treaty_id: Union[str, int]) -> TextContent:
         
         # 결과 포맷팅
         result = f"**조약 상세 정보** (ID: {treaty_id})\n"
-        result += "=" * 50 + "\n\n"
+        result += _HR_NL + "\n"
         
-        if 'BothTrtyService' in data:
-            treaty_service = data['BothTrtyService']
-            
+        # 각 항목은 dict가 아닐 수 있으므로(문자열·목록) dict인 경우에만 .get 사용
+        treaty_service = data.get('BothTrtyService')
+        if isinstance(treaty_service, dict) and treaty_service:
             # 조약 기본정보
-            if '조약기본정보' in treaty_service:
-                basic_info = treaty_service['조약기본정보']
+            basic_info = treaty_service.get('조약기본정보')
+            if isinstance(basic_info, dict) and basic_info:
                 result += "**📋 기본정보**\n"
                 
                 info_fields = {
@@ -167,40 +174,45 @@ def get_treaty_detail(treaty_id: Union[str, int]) -> TextContent:
                 }
                 
                 for display_name, field_key in info_fields.items():
-                    if field_key in basic_info and basic_info[field_key]:
-                        result += f"- **{display_name}**: {basic_info[field_key]}\n"
+                    value = basic_info.get(field_key)
+                    if value:
+                        result += f"- **{display_name}**: {value}\n"
             
             # 추가정보
-            if '추가정보' in treaty_service:
-                add_info = treaty_service['추가정보']
+            add_info = treaty_service.get('추가정보')
+            if isinstance(add_info, dict) and add_info:
                 result += "\n**🌏 체결 상대국**\n"
                 
-                if '체결대상국가한글' in add_info and add_info['체결대상국가한글']:
-                    result += f"- **상대국**: {add_info['체결대상국가한글']}\n"
-                if '양자조약분야명' in add_info and add_info['양자조약분야명']:
-                    result += f"- **분야**: {add_info['양자조약분야명']}\n"
+                country = add_info.get('체결대상국가한글')
+                if country:
+                    result += f"- **상대국**: {country}\n"
+                field = add_info.get('양자조약분야명')
+                if field:
+                    result += f"- **분야**: {field}\n"
             
             # 조약 내용
-            if '조약내용' in treaty_service and '조약내용' in treaty_service['조약내용']:
-                content = treaty_service['조약내용']['조약내용']
-                if content:
-                    result += f"\n**📄 조약 전문**\n{content[:500]}{'...' if len(content) > 500 else ''}\n"
+            content_info = treaty_service.get('조약내용')
+            content = content_info.get('조약내용') if isinstance(content_info, dict) else None
+            if content:
+                body = content if len(content) <= 500 else content[:500] + "..."
+                result += f"\n**📄 조약 전문**\n{body}\n"
             
             # 첨부파일
-            if '첨부파일' in treaty_service:
-                file_info = treaty_service['첨부파일']
-                if file_info.get('첨부파일명'):
-                    result += f"\n**📎 첨부파일**: {file_info['첨부파일명']}\n"
+            file_info = treaty_service.get('첨부파일')
+            if isinstance(file_info, dict):
+                file_name = file_info.get('첨부파일명')
+                if file_name:
+                    result += f"\n**📎 첨부파일**: {file_name}\n"
                     
         else:
             result += "조약 정보를 찾을 수 없습니다.\n\n"
         
-        result += "\n" + "=" * 50 + "\n"
+        result += "\n" + _HR_NL
         
         return TextContent(type="text", text=result)
         
     except Exception as e:
-        logger.error(f"조약 상세조회 중 오류: {e}")
+        logger.error("조약 상세조회 중 오류: %s", e)
         return TextContent(type="text", text=f"조약 상세조회 중 오류가 발생했습니다: {str(e)}")
 
 @mcp.tool(name="get_ordinance_appendix_detail", description="""자치법규 별표서식 상세내용을 조회합니다.
@@ -228,7 +240,7 @@ def get_ordinance_appendix_detail(appendix_id: Union[str, int]) -> TextContent:
         
         # 결과 포맷팅
         result = f"**자치법규 별표서식 상세 정보** (ID: {appendix_id})\n"
-        result += "=" * 50 + "\n\n"
+        result += _HR_NL + "\n"
         
         if data:
             # 데이터 구조에 따라 처리
@@ -252,25 +264,14 @@ def get_ordinance_appendix_detail(appendix_id: Union[str, int]) -> TextContent:
                 }
                 
                 for field_name, field_keys in basic_fields.items():
-                    value = None
-                    for key in field_keys:
-                        if key in appendix_info and appendix_info[key]:
-                            value = appendix_info[key]
-                            break
-                    
+                    value = next(filter(None, map(appendix_info.get, field_keys)), None)
                     if value:
                         result += f"**{field_name}**: {value}\n"
                 
-                result += "\n" + "=" * 50 + "\n\n"
-                
-                # 별표서식 내용 출력
-                content_fields = ['내용', 'content', 'text', '별표내용', 'body']
-                content = None
+                result += "\n" + _HR_NL + "\n"
                 
-                for field in content_fields:
-                    if field in appendix_info and appendix_info[field]:
-                        content = appendix_info[field]
-                        break
+                # 별표서식 내용 출력 (우선순위 순서대로 첫 번째 값 사용)
+                content = next(filter(None, map(appendix_info.get, _APPENDIX_CONTENT_FIELDS)), None)
                 
                 if content:
                     result += "**별표서식 내용:**\n\n"
@@ -283,11 +284,11 @@ def get_ordinance_appendix_detail(appendix_id: Union[str, int]) -> TextContent:
         else:
             result += "별표서식 정보를 찾을 수 없습니다.\n\n"
         
-        result += "=" * 50 + "\n"
+        result += _HR_NL
         result += f"**API URL**: {url}\n"
         
         return TextContent(type="text", text=result)
         
     except Exception as e:
-        logger.error(f"자치법규 별표서식 상세조회 중 오류: {e}")
+        logger.error("자치법규 별표서식 상세조회 중 오류: %s", e)
         return TextContent(type="text", text=f"자치법규 별표서식 상세조회 중 오류가 발생했습니다: {str(e)}") 
\ No newline at end of file
@@ -5,23 +5,73 @@
 판례 관련 검색 및 조회 기능을 제공합니다.
 """
 
-import logging
+import asyncio
+import io
 import json
-import os
-import requests  # type: ignore
+import logging
+import re
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple, Union
 from urllib.parse import urlencode
-from typing import Optional, Union, Annotated
 from mcp.types import TextContent
 
+try:
+    from selectolax.parser import HTMLParser  # type: ignore
+    HAS_SELECTOLAX = True
+except ImportError:
+    HTMLParser = None  # type: ignore
+    HAS_SELECTOLAX = False
+
 from ..server import mcp
 from ..config import legislation_config
+from ..utils.pagination import paginate
 
 logger = logging.getLogger(__name__)
 
+# HTML 판례 응답 정리용 정규식 (모듈 로드 시 1회 컴파일)
+_SCRIPT_STYLE_RE = re.compile(r'<(script|style)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# HTML 폴백 최대 수신 크기 - 비정상적으로 큰 응답에 대한 메모리 상한일 뿐,
+# 요약 길이는 태그/스크립트를 제거한 본문 텍스트 기준(_HTML_SUMMARY_MAX_CHARS)으로 자름
+_HTML_FALLBACK_MAX_BYTES = 1024 * 1024
+_HTML_SUMMARY_MAX_CHARS = 2000
+
+def _fmt_date8(value) -> str:
+    """YYYYMMDD 형식 날짜를 YYYY.MM.DD로 변환 (다른 형식은 그대로 반환)"""
+    text = str(value)
+    return f"{text[:4]}.{text[4:6]}.{text[6:8]}" if len(text) == 8 else text
+
+# 헌법재판소 결정례 상세 출력 필드 - 출력 순서대로 (표시명, 응답 키, 값 포맷터)
+_DETC_BASIC: Tuple[Tuple[str, str, Callable[[Any], str]], ...] = (
+    ('사건명', '사건명', str),
+    ('사건번호', '사건번호', str),
+    ('종국일자', '종국일자', _fmt_date8),
+    ('사건종류명', '사건종류명', str),
+    ('재판부구분', '재판부구분코드', str),
+    ('헌재결정례일련번호', '헌재결정례일련번호', str),
+)
+_DETC_DETAIL: Tuple[Tuple[str, str], ...] = (
+    ('심판대상조문', '심판대상조문'),
+    ('참조조문', '참조조문'),
+    ('참조판례', '참조판례'),
+    ('판시사항', '판시사항'),
+    ('결정요지', '결정요지'),
+)
+
 # 유틸리티 함수들 import
 from .law_tools import (
+    _SESSION,
     _make_legislation_request,
-    _generate_api_url
+    _make_case_detail_request,
+    _get_cached_case_detail,
+    _make_legislation_request_async,
+    _normalize_query,
+    _clamp_pagination,
+    _generate_api_url,
+    _format_search_results,
+    legislation_search
 )
 
 def _format_precedent_search_results(data: dict, target: str, search_query: str, max_results: int = 50) -> str:
@@ -231,7 +281,7 @@ def _format_constitutional_search_results(data: dict, target: str, search_query:
 - date_range: 선고일자 범위 (20090101~20090130)
 - case_number: 판례 사건번호
 - data_source: 데이터출처명 (국세법령정보시스템, 근로복지공단산재판례, 대법원)""")
-def search_precedent(
+async def search_precedent(
     query: Optional[str] = None,
     search: int = 2,  # 본문검색이 제목검색보다 더 풍부한 결과 제공
     display: int = 20,
@@ -267,7 +317,8 @@ def search_precedent(
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
-    params = {"query": search_query, "search": search, "display": min(display, 100), "page": page}
+    display, page = _clamp_pagination(display, page)
+    params = {"query": search_query, "search": search, "display": display, "page": page}
     
     # 고급 검색 파라미터 추가
     if court_type:
@@ -290,44 +341,21 @@ def search_precedent(
         params["datSrcNm"] = data_source
     
     try:
-        data = _make_legislation_request("prec", params)
-        url = _generate_api_url("prec", params)
+        data = await _make_legislation_request_async("prec", params)
         result = _format_precedent_search_results(data, "prec", search_query, display)
         return TextContent(type="text", text=result)
     except Exception as e:
         return TextContent(type="text", text=f"판례 검색 중 오류: {str(e)}")
 
 @mcp.tool(name="search_constitutional_court", description="헌법재판소 결정례를 검색합니다. 매개변수: query(필수), display, page")
-def search_constitutional_court(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
+@legislation_search("detc", "헌법재판소 결정례", formatter=_format_constitutional_search_results)
+async def search_constitutional_court(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """헌법재판소 결정례 검색"""
-    if not query or not query.strip():
-        return TextContent(type="text", text="검색어를 입력해주세요.")
-    
-    search_query = query.strip()
-    params = {"target": "detc", "query": search_query, "display": min(display, 100), "page": page}
-    try:
-        data = _make_legislation_request("detc", params)
-        url = _generate_api_url("detc", params)
-        result = _format_constitutional_search_results(data, "detc", search_query, display)
-        return TextContent(type="text", text=result)
-    except Exception as e:
-        return TextContent(type="text", text=f"헌법재판소 결정례 검색 중 오류: {str(e)}")
 
 @mcp.tool(name="search_legal_interpretation", description="법제처 법령해석례를 검색합니다. 매개변수: query(필수), display, page")
-def search_legal_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
+@legislation_search("expc", "법령해석례", formatter=_format_precedent_search_results)
+async def search_legal_interpretation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """법령해석례 검색"""
-    if not query or not query.strip():
-        return TextContent(type="text", text="검색어를 입력해주세요.")
-    
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
-    try:
-        data = _make_legislation_request("expc", params)
-        url = _generate_api_url("expc", params)
-        result = _format_precedent_search_results(data, "expc", search_query, display)
-        return TextContent(type="text", text=result)
-    except Exception as e:
-        return TextContent(type="text", text=f"법령해석례 검색 중 오류: {str(e)}")
 
 @mcp.tool(name="search_administrative_trial", description="행정심판례를 검색합니다. 매개변수: query(필수), search(1=사건명, 2=본문검색), display, page")
 def search_administrative_trial(query: Optional[str] = None, search: int = 1, display: int = 20, page: int = 1) -> TextContent:
@@ -336,10 +364,10 @@ def search_administrative_trial(query: Optional[str] = None, search: int = 1, di
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
-    params = {"target": "decc", "query": search_query, "search": search, "display": min(display, 100), "page": page}
+    display, page = _clamp_pagination(display, page)
+    params = {"target": "decc", "query": search_query, "search": search, "display": display, "page": page}
     try:
         data = _make_legislation_request("decc", params)
-        url = _generate_api_url("decc", params)
         result = _format_precedent_search_results(data, "decc", search_query, display)
         return TextContent(type="text", text=result)
     except Exception as e:
@@ -355,8 +383,7 @@ def get_administrative_trial_detail(trial_id: Union[str, int]) -> TextContent:
     """행정심판례 본문 조회"""
     params = {"target": "decc", "ID": str(trial_id)}
     try:
-        data = _make_legislation_request("decc", params, is_detail=True)
-        url = _generate_api_url("decc", params)
+        data = _make_case_detail_request("decc", params)
         result = _format_precedent_search_results(data, "decc", f"행정심판례ID:{trial_id}", 1)
         return TextContent(type="text", text=result)
     except Exception as e:
@@ -369,50 +396,57 @@ def get_administrative_trial_detail(trial_id: Union[str, int]) -> TextContent:
 
 사용 예시: get_precedent_detail(case_id="123456")
 참고: 국세청 판례는 HTML 형태로만 제공됩니다.""")
-def get_precedent_detail(case_id: Union[str, int]) -> TextContent:
-    """판례 본문 조회 - 개선된 JSON/HTML 지원"""
+async def get_precedent_detail(case_id: Union[str, int]) -> TextContent:
+    """판례 본문 조회 - 개선된 JSON/HTML 지원
+    
+    캐시(디스크 캐시, 존재하지 않는 ID 기록)를 먼저 확인하고, 캐시에 없을 때만
+    JSON 상세조회를 요청합니다. HTML 조회(국세청 판례 등)는 왕복 시간을 줄이기 위해
+    함께 시작하지만 JSON 결과를 먼저 기다리며, JSON 응답이 비어 있거나 JSON 파싱에
+    실패한 경우에만 HTML 결과를 사용하고 그 외에는 취소합니다.
+    """
     params = {"ID": str(case_id)}
+    html_url = _build_html_url(str(case_id), legislation_config.oc)
+    
+    # 캐시 적중 또는 존재하지 않는 ID는 HTTP 요청 없이 바로 응답
+    try:
+        data = await asyncio.to_thread(_get_cached_case_detail, "prec", params)
+    except Exception as e:
+        return TextContent(type="text", text=f"판례 상세 조회 중 오류: {str(e)}")
+    if data:
+        result = _format_precedent_search_results(data, "prec", f"판례ID:{case_id}", 1)
+        return TextContent(type="text", text=result)
     
+    # 캐시에 없을 때만: HTML은 미리 시작해 두고 JSON 결과를 먼저 확인 (JSON 성공 시 HTML은 기다리지 않음)
+    json_task = asyncio.create_task(asyncio.to_thread(_make_case_detail_request, "prec", params))
+    html_task = asyncio.create_task(asyncio.to_thread(_fetch_precedent_html, html_url))
     try:
-        # 기본 JSON 시도 (is_detail=True로 lawService.do 사용)
-        data = _make_legislation_request("prec", params, is_detail=True)
-        url = _generate_api_url("prec", params, is_detail=True)
+        try:
+            data = await json_task
+        except json.JSONDecodeError as e:
+            # JSON 파싱 실패 - HTML 폴백
+            try:
+                html_content = await html_task
+            except Exception:
+                return TextContent(type="text", text=f"JSON 파싱 오류 (HTML 폴백 실패): {str(e)}\n\nsearch_precedent 도구로 올바른 판례 ID를 먼저 확인해보세요.\n\nAPI URL: {html_url}")
+            return _format_html_precedent_response(html_content, str(case_id), html_url)
+        except Exception as e:
+            # 그 밖의 오류(존재하지 않는 ID, HTTP 오류 등)는 HTML로 덮어쓰지 않음
+            return TextContent(type="text", text=f"판례 상세 조회 중 오류: {str(e)}")
         
         # JSON 응답 확인
         if isinstance(data, dict) and data:
             result = _format_precedent_search_results(data, "prec", f"판례ID:{case_id}", 1)
             return TextContent(type="text", text=result)
-        else:
-            # HTML 폴백 (국세청 판례 등)
-            oc = os.getenv("LEGISLATION_API_KEY", "lchangoo")
-            html_params = {"OC": oc, "target": "prec", "ID": str(case_id)}
-            
-            url = f"{legislation_config.service_base_url}?{urlencode(html_params)}"
-            headers = {"Referer": "https://open.law.go.kr/"}
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            
-            # HTML 응답 포맷팅
-            return _format_html_precedent_response(response.text, str(case_id), url)
-            
-    except json.JSONDecodeError as je:
-        # JSON 파싱 실패시 HTML 폴백
+        
+        # 빈 JSON 응답 - HTML 폴백 (국세청 판례 등)
         try:
-            oc = os.getenv("LEGISLATION_API_KEY", "lchangoo") 
-            html_params = {"OC": oc, "target": "prec", "ID": str(case_id)}
-            
-            url = f"{legislation_config.service_base_url}?{urlencode(html_params)}"
-            headers = {"Referer": "https://open.law.go.kr/"}
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            
-            return _format_html_precedent_response(response.text, str(case_id), url)
-            
-        except Exception as he:
-            return TextContent(type="text", text=f"JSON 파싱 오류 (HTML 폴백 실패): {str(je)}\n\nsearch_precedent 도구로 올바른 판례 ID를 먼저 확인해보세요.\n\nAPI URL: {url}")
-            
-    except Exception as e:
-        return TextContent(type="text", text=f"판례 상세 조회 중 오류: {str(e)}")
+            html_content = await html_task
+        except Exception as e:
+            return TextContent(type="text", text=f"판례 상세 조회 중 오류: {str(e)}")
+        return _format_html_precedent_response(html_content, str(case_id), html_url)
+    finally:
+        # HTML 결과가 필요 없으면 취소 (이미 끝난 작업이면 아무 효과 없음)
+        html_task.cancel()
 
 @mcp.tool(name="get_constitutional_court_detail", description="""헌법재판소 결정례 상세내용을 조회합니다.
 
@@ -425,7 +459,7 @@ def get_constitutional_court_detail(decision_id: Union[str, int]) -> TextContent
     params = {"target": "detc", "ID": str(decision_id)}
     try:
         # 상세조회이므로 is_detail=True로 lawService.do 사용
-        data = _make_legislation_request("detc", params, is_detail=True)
+        data = _make_case_detail_request("detc", params)
         url = _generate_api_url("detc", params, is_detail=True)
         result = _format_constitutional_court_detail(data, str(decision_id), url)
         return TextContent(type="text", text=result)
@@ -443,86 +477,204 @@ def get_legal_interpretation_detail(interpretation_id: Union[str, int]) -> TextC
     """법령해석례 본문 조회"""
     params = {"ID": str(interpretation_id)}
     try:
-        data = _make_legislation_request("expc", params, is_detail=True)
-        url = _generate_api_url("expc", params)
+        data = _make_case_detail_request("expc", params)
         result = _format_precedent_search_results(data, "expc", f"법령해석례ID:{interpretation_id}", 1)
         return TextContent(type="text", text=result)
     except Exception as e:
         return TextContent(type="text", text=f"법령해석례 상세 조회 중 오류: {str(e)}")
 
+# 대량 검색 설정 - API의 페이지당 최대 건수(100) 단위로 요청
+_BULK_PAGE_SIZE = 100
+_BULK_MAX_ITEMS = 1000
+
+@mcp.tool(name="search_precedent_bulk", description="""대법원 판례를 여러 페이지에 걸쳐 한 번에 검색합니다.
+
+100건 단위 페이지를 동시에 요청하여 search_precedent를 여러 번 호출하는 것보다 빠릅니다.
+
+매개변수:
+- query: 검색어 (필수)
+- max_items: 최대 결과 개수 (기본 500, 최대 1000)
+- search: 검색범위 (1=판례명, 2=본문검색)
+
+사용 예시: search_precedent_bulk("부당해고"), search_precedent_bulk("명예훼손", max_items=300)""")
+async def search_precedent_bulk(query: Optional[str] = None, max_items: int = 500, search: int = 2) -> TextContent:
+    """판례 다중 페이지 검색"""
+    search_query = _normalize_query(query)
+    if search_query is None:
+        return TextContent(type="text", text="검색어를 입력해주세요.")
+    
+    max_items = max(1, min(max_items, _BULK_MAX_ITEMS))
+    total_count = 0
+    
+    async def _fetch_page(page: int):
+        nonlocal total_count
+        params = {"query": search_query, "search": search, "display": _BULK_PAGE_SIZE, "page": page}
+        data = await _make_legislation_request_async("prec", params)
+        items, page_total = _extract_precedent_items(data)
+        if page == 1:
+            total_count = page_total
+        return items, page_total
+    
+    try:
+        items = []
+        async for page_items in paginate(_fetch_page, max_items, _BULK_PAGE_SIZE):
+            items.extend(page_items)
+        
+        data = {"PrecSearch": {"prec": items, "totalCnt": total_count or len(items)}}
+        result = _format_precedent_search_results(data, "prec", search_query, max_items)
+        return TextContent(type="text", text=result)
+    except Exception as e:
+        return TextContent(type="text", text=f"판례 대량 검색 중 오류: {str(e)}")
+
+def _extract_precedent_items(data: dict) -> tuple:
+    """판례 검색 응답에서 (항목 목록, 전체 건수) 추출"""
+    search_data = data.get("PrecSearch") or {}
+    items = search_data.get("prec", [])
+    if isinstance(items, dict):
+        items = [items]
+    elif not isinstance(items, list):
+        items = []
+    try:
+        total_count = int(search_data.get("totalCnt") or 0)
+    except (TypeError, ValueError):
+        total_count = 0
+    return items, total_count
+
+# 통합 판례 검색 대상: (target, 구분명, 추가 파라미터) - 개별 search_* 도구와 동일한 기본값 사용
+_CASE_LAW_TARGETS = (
+    ("prec", "대법원 판례", {"search": 2}),
+    ("detc", "헌법재판소 결정례", {}),
+    ("expc", "법령해석례", {}),
+    ("decc", "행정심판례", {"search": 1}),
+    ("ttSpecialDecc", "조세심판원 특별행정심판례", {}),
+)
+_CASE_LAW_CONCURRENCY = 10
+
+@mcp.tool(name="search_all_case_law", description="""판례·결정례·해석례·심판례를 한 번에 동시 검색합니다.
+
+대법원 판례, 헌법재판소 결정례, 법령해석례, 행정심판례, 조세심판원 심판례를
+병렬로 조회하여 구분별로 정리해 반환합니다.
+
+매개변수:
+- query: 검색어 (필수)
+- display: 구분별 결과 개수 (최대 100)
+
+사용 예시: search_all_case_law("부당해고"), search_all_case_law("양도소득세", display=10)""")
+async def search_all_case_law(query: Optional[str] = None, display: int = 20) -> TextContent:
+    """판례 관련 5개 API 동시 검색"""
+    search_query = _normalize_query(query)
+    if search_query is None:
+        return TextContent(type="text", text="검색어를 입력해주세요.")
+    
+    display, _ = _clamp_pagination(display, 1)
+    semaphore = asyncio.Semaphore(_CASE_LAW_CONCURRENCY)
+    
+    async def _search(target: str, extra_params: dict) -> str:
+        params = {"query": search_query, **extra_params, "display": display, "page": 1}
+        async with semaphore:
+            data = await _make_legislation_request_async(target, params)
+        return _format_case_law_results(data, target, search_query, display)
+    
+    # 한 API의 실패가 나머지 결과에 영향을 주지 않도록 예외도 결과로 수집
+    results = await asyncio.gather(
+        *(_search(target, extra_params) for target, _, extra_params in _CASE_LAW_TARGETS),
+        return_exceptions=True
+    )
+    labels = [label for _, label, _ in _CASE_LAW_TARGETS]
+    return TextContent(type="text", text=_format_multi_target_results(search_query, labels, results))
+
+def _format_case_law_results(data: dict, target: str, search_query: str, max_results: int) -> str:
+    """target별 검색 결과 포맷터 선택"""
+    if target == "detc":
+        return _format_constitutional_search_results(data, target, search_query, max_results)
+    if target in ("prec", "expc", "decc"):
+        return _format_precedent_search_results(data, target, search_query, max_results)
+    return _format_search_results(data, target, search_query, max_results)
+
+def _format_multi_target_results(search_query: str, labels: list, results: list) -> str:
+    """여러 API 검색 결과를 구분별 섹션으로 병합"""
+    sections = [f"**'{search_query}' 통합 판례 검색 결과**"]
+    for label, result in zip(labels, results):
+        if isinstance(result, BaseException):
+            result = f"{label} 검색 중 오류: {str(result)}"
+        sections.append(f"## {label}\n\n{result}")
+    return "\n\n".join(sections)
+
 def _format_constitutional_court_detail(data: dict, decision_id: str, url: str) -> str:
     """헌법재판소 결정례 상세조회 결과 포맷팅"""
     if not data:
         return f"헌법재판소 결정례 상세 정보를 찾을 수 없습니다.\n\nAPI URL: {url}"
     
     # DetcService 구조 확인
-    if 'DetcService' in data:
-        detc_info = data['DetcService']
-        
-        result = f"**헌법재판소 결정례 상세정보** (ID: {decision_id})\n"
-        result += "=" * 50 + "\n\n"
-        
-        # 기본 정보
-        basic_fields = {
-            '사건명': '사건명',
-            '사건번호': '사건번호', 
-            '종국일자': '종국일자',
-            '사건종류명': '사건종류명',
-            '재판부구분': '재판부구분코드',
-            '헌재결정례일련번호': '헌재결정례일련번호'
-        }
-        
-        for display_name, field_key in basic_fields.items():
-            if field_key in detc_info and detc_info[field_key]:
-                value = detc_info[field_key]
-                # 날짜 포맷팅
-                if '일자' in display_name and len(str(value)) == 8:
-                    value = f"{value[:4]}.{value[4:6]}.{value[6:8]}"
-                result += f"**{display_name}**: {value}\n"
-        
-        result += "\n" + "=" * 50 + "\n\n"
-        
-        # 상세 내용
-        detail_fields = {
-            '심판대상조문': '심판대상조문',
-            '참조조문': '참조조문', 
-            '참조판례': '참조판례',
-            '판시사항': '판시사항',
-            '결정요지': '결정요지'
-        }
-        
-        for display_name, field_key in detail_fields.items():
-            if field_key in detc_info and detc_info[field_key]:
-                content = detc_info[field_key].strip()
-                if content:
-                    result += f"## {display_name}\n{content}\n\n"
-        
-        # 전문 (일부만 표시)
-        if '전문' in detc_info and detc_info['전문']:
-            full_text = detc_info['전문'].strip()
-            if full_text:
-                # 전문이 너무 길면 요약
-                if len(full_text) > 2000:
-                    result += f"## 전문 (요약)\n{full_text[:2000]}...\n\n"
-                    result += f"💡 **전체 전문 보기**: 헌재결정례일련번호 {detc_info.get('헌재결정례일련번호', decision_id)}로 별도 조회\n\n"
-                else:
-                    result += f"## 전문\n{full_text}\n\n"
-        
-        return result
-    else:
+    detc_info = data.get('DetcService')
+    if detc_info is None:
         return f"예상과 다른 응답 구조입니다: {list(data.keys())}\n\nAPI URL: {url}"
+    
+    parts = [f"**헌법재판소 결정례 상세정보** (ID: {decision_id})\n", "=" * 50, "\n\n"]
+    append = parts.append
+    
+    # 기본 정보
+    for display_name, field_key, formatter in _DETC_BASIC:
+        value = detc_info.get(field_key)
+        if value:
+            append(f"**{display_name}**: {formatter(value)}\n")
+    
+    append("\n" + "=" * 50 + "\n\n")
+    
+    # 상세 내용
+    for display_name, field_key in _DETC_DETAIL:
+        value = detc_info.get(field_key)
+        content = value.strip() if value else ""
+        if content:
+            append(f"## {display_name}\n{content}\n\n")
+    
+    # 전문 (일부만 표시)
+    full_text = (detc_info.get('전문') or "").strip()
+    if full_text:
+        # 전문이 너무 길면 요약
+        if len(full_text) > 2000:
+            append(f"## 전문 (요약)\n{full_text[:2000]}...\n\n")
+            append(f"💡 **전체 전문 보기**: 헌재결정례일련번호 {detc_info.get('헌재결정례일련번호', decision_id)}로 별도 조회\n\n")
+        else:
+            append(f"## 전문\n{full_text}\n\n")
+    
+    return ''.join(parts)
+
+@lru_cache(maxsize=1024)
+def _build_html_url(case_id: str, oc: str) -> str:
+    """HTML 판례 조회 URL 생성 (같은 판례 재조회 시 인코딩 생략)"""
+    return f"{legislation_config.service_base_url}?{urlencode({'OC': oc, 'target': 'prec', 'ID': case_id})}"
+
+def _fetch_precedent_html(url: str, max_bytes: int = _HTML_FALLBACK_MAX_BYTES) -> str:
+    """HTML 판례 응답을 스트리밍으로 수신 (max_bytes를 넘는 부분은 읽지 않음)"""
+    headers = {"Referer": "https://open.law.go.kr/"}
+    with _SESSION.get(url, headers=headers, timeout=(3.05, 15), stream=True) as response:
+        response.raise_for_status()
+        buffer = io.BytesIO()
+        for chunk in response.iter_content(chunk_size=8192):
+            buffer.write(chunk)
+            if buffer.tell() >= max_bytes:
+                break
+        encoding = response.encoding or 'utf-8'
+    # 중간에서 잘린 멀티바이트 문자는 대체 문자로 처리
+    return buffer.getvalue().decode(encoding, errors='replace')
 
 def _format_html_precedent_response(html_content: str, case_id: str, url: str) -> TextContent:
     """HTML 판례 응답 포맷팅"""
     try:
-        # HTML 태그 제거 (간단한 처리)
-        import re
-        text_content = re.sub(r'<[^>]+>', '', html_content)
-        text_content = re.sub(r'\s+', ' ', text_content).strip()
+        # HTML 태그 제거 - selectolax(C 파서)가 있으면 사용, 없으면 정규식으로 처리
+        # script/style 내용은 본문이 아니므로 텍스트 추출 전에 제거
+        if HAS_SELECTOLAX:
+            tree = HTMLParser(html_content)
+            tree.strip_tags(['script', 'style'])
+            text_content = tree.text(separator=' ')
+        else:
+            text_content = _TAG_RE.sub('', _SCRIPT_STYLE_RE.sub('', html_content))
+        text_content = _WS_RE.sub(' ', text_content).strip()
         
-        # 길이 제한
-        if len(text_content) > 2000:
-            text_content = text_content[:2000] + "..."
+        # 길이 제한 (추출된 본문 텍스트 기준)
+        if len(text_content) > _HTML_SUMMARY_MAX_CHARS:
+            text_content = text_content[:_HTML_SUMMARY_MAX_CHARS] + "..."
         
         formatted_result = f"""판례 상세내용 (사건번호: {case_id})
 
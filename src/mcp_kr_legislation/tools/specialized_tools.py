@@ -20,9 +20,11 @@ logger = logging.getLogger(__name__)
 
 # 유틸리티 함수들 import (law_tools로 변경)
 from .law_tools import (
+    _clamp_pagination,
     _make_legislation_request,
-    _generate_api_url,
-    _format_search_results
+    _make_case_detail_request,
+    _format_search_results,
+    legislation_search
 )
 
 # ===========================================
@@ -67,11 +69,12 @@ def search_treaty(
         sort: 정렬 (lasc=조약명오름차순, ldes=조약명내림차순, dasc=체결일자오름차순, ddes=체결일자내림차순, efasc=발효일자오름차순, efdes=발효일자내림차순)
         alphabetical: 사전식 검색 (ga,na,da,ra,ma,ba,sa,a,ja,cha,ka,ta,pa,ha)
     """
+    display, page = _clamp_pagination(display, page)
     if not query or not query.strip():
         return TextContent(type="text", text="검색어를 입력해주세요.")
     
     search_query = query.strip()
-    params = {"query": search_query, "search": search, "display": min(display, 100), "page": page}
+    params = {"query": search_query, "search": search, "display": display, "page": page}
     
     # 고급 검색 파라미터 추가
     if treaty_type:
@@ -87,8 +90,7 @@ def search_treaty(
         
     try:
         data = _make_legislation_request("trty", params)
-        url = _generate_api_url("trty", params)
-        result = _format_search_results(data, "trty", search_query, min(display, 100))
+        result = _format_search_results(data, "trty", search_query, display)
         return TextContent(type="text", text=result)
     except Exception as e:
         return TextContent(type="text", text=f"조약 검색 중 오류: {str(e)}")
@@ -100,20 +102,9 @@ def search_treaty(
 - page: 페이지 번호
 
 사용 예시: search_university_regulation("서울대"), search_university_regulation("학점", display=50)""")
-def search_university_regulation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
+@legislation_search("schreg", "대학 학칙")
+async def search_university_regulation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """대학 학칙 검색"""
-    if not query or not query.strip():
-        return TextContent(type="text", text="검색어를 입력해주세요.")
-    
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
-    try:
-        data = _make_legislation_request("schreg", params)
-        url = _generate_api_url("schreg", params)
-        result = _format_search_results(data, "schreg", search_query, min(display, 100))
-        return TextContent(type="text", text=result)
-    except Exception as e:
-        return TextContent(type="text", text=f"대학 학칙 검색 중 오류: {str(e)}")
 
 @mcp.tool(name="search_public_corporation_regulation", description="""지방공사공단 규정을 검색합니다.
 
@@ -123,20 +114,9 @@ def search_university_regulation(query: Optional[str] = None, display: int = 20,
 - page: 페이지 번호
 
 사용 예시: search_public_corporation_regulation("시설공단"), search_public_corporation_regulation("인사규정")""")
-def search_public_corporation_regulation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
+@legislation_search("locgongreg", "지방공사공단 규정")
+async def search_public_corporation_regulation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """지방공사공단 규정 검색"""
-    if not query or not query.strip():
-        return TextContent(type="text", text="검색어를 입력해주세요.")
-    
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
-    try:
-        data = _make_legislation_request("locgongreg", params)
-        url = _generate_api_url("locgongreg", params)
-        result = _format_search_results(data, "locgongreg", search_query, min(display, 100))
-        return TextContent(type="text", text=result)
-    except Exception as e:
-        return TextContent(type="text", text=f"지방공사공단 규정 검색 중 오류: {str(e)}")
 
 @mcp.tool(name="search_public_institution_regulation", description="""공공기관 규정을 검색합니다.
 
@@ -146,20 +126,9 @@ def search_public_corporation_regulation(query: Optional[str] = None, display: i
 - page: 페이지 번호
 
 사용 예시: search_public_institution_regulation("한국전력"), search_public_institution_regulation("복무규정")""")
-def search_public_institution_regulation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
+@legislation_search("pubitreg", "공공기관 규정")
+async def search_public_institution_regulation(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """공공기관 규정 검색"""
-    if not query or not query.strip():
-        return TextContent(type="text", text="검색어를 입력해주세요.")
-    
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
-    try:
-        data = _make_legislation_request("pubitreg", params)
-        url = _generate_api_url("pubitreg", params)
-        result = _format_search_results(data, "pubitreg", search_query, min(display, 100))
-        return TextContent(type="text", text=result)
-    except Exception as e:
-        return TextContent(type="text", text=f"공공기관 규정 검색 중 오류: {str(e)}")
 
 @mcp.tool(name="search_tax_tribunal", description="""조세심판원 특별행정심판례를 검색합니다.
 
@@ -169,20 +138,9 @@ def search_public_institution_regulation(query: Optional[str] = None, display: i
 - page: 페이지 번호
 
 사용 예시: search_tax_tribunal("양도소득세"), search_tax_tribunal("부가가치세")""")
-def search_tax_tribunal(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
+@legislation_search("ttSpecialDecc", "조세심판원")
+async def search_tax_tribunal(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """조세심판원 특별행정심판례 검색"""
-    if not query or not query.strip():
-        return TextContent(type="text", text="검색어를 입력해주세요.")
-    
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
-    try:
-        data = _make_legislation_request("ttSpecialDecc", params)
-        url = _generate_api_url("ttSpecialDecc", params)
-        result = _format_search_results(data, "ttSpecialDecc", search_query, min(display, 100))
-        return TextContent(type="text", text=result)
-    except Exception as e:
-        return TextContent(type="text", text=f"조세심판원 검색 중 오류: {str(e)}")
 
 @mcp.tool(name="search_maritime_safety_tribunal", description="""해양안전심판원 특별행정심판례를 검색합니다.
 
@@ -192,52 +150,9 @@ def search_tax_tribunal(query: Optional[str] = None, display: int = 20, page: in
 - page: 페이지 번호
 
 사용 예시: search_maritime_safety_tribunal("충돌"), search_maritime_safety_tribunal("선박사고")""")
-def search_maritime_safety_tribunal(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
+@legislation_search("kmstSpecialDecc", "해양안전심판원")
+async def search_maritime_safety_tribunal(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """해양안전심판원 특별행정심판례 검색"""
-    if not query or not query.strip():
-        return TextContent(type="text", text="검색어를 입력해주세요.")
-    
-    search_query = query.strip()
-    params = {"query": search_query, "display": min(display, 100), "page": page}
-    try:
-        data = _make_legislation_request("kmstSpecialDecc", params)
-        url = _generate_api_url("kmstSpecialDecc", params)
-        result = _format_search_results(data, "kmstSpecialDecc", search_query, min(display, 100))
-        return TextContent(type="text", text=result)
-    except Exception as e:
-        return TextContent(type="text", text=f"해양안전심판원 검색 중 오류: {str(e)}")
-
-@mcp.tool(name="get_tax_tribunal_detail", description="""조세심판원 특별행정심판례 상세내용을 조회합니다.
-
-매개변수:
-- tribunal_id: 심판례ID
-
-사용 예시: get_tax_tribunal_detail(tribunal_id="1018160")""")
-def get_tax_tribunal_detail(tribunal_id: Union[str, int]) -> TextContent:
-    """조세심판원 특별행정심판례 상세 조회"""
-    params = {"ID": str(tribunal_id)}
-    try:
-        data = _make_legislation_request("ttSpecialDecc", params, is_detail=True)
-        result = _format_search_results(data, "ttSpecialDecc", str(tribunal_id))
-        return TextContent(type="text", text=result)
-    except Exception as e:
-        return TextContent(type="text", text=f"조세심판원 상세조회 중 오류: {str(e)}")
-
-@mcp.tool(name="get_maritime_safety_tribunal_detail", description="""해양안전심판원 특별행정심판례 상세내용을 조회합니다.
-
-매개변수:
-- tribunal_id: 심판례ID
-
-사용 예시: get_maritime_safety_tribunal_detail(tribunal_id="2")""")
-def get_maritime_safety_tribunal_detail(tribunal_id: Union[str, int]) -> TextContent:
-    """해양안전심판원 특별행정심판례 상세 조회"""
-    params = {"ID": str(tribunal_id)}
-    try:
-        data = _make_legislation_request("kmstSpecialDecc", params, is_detail=True)
-        result = _format_search_results(data, "kmstSpecialDecc", str(tribunal_id))
-        return TextContent(type="text", text=result)
-    except Exception as e:
-        return TextContent(type="text", text=f"해양안전심판원 상세조회 중 오류: {str(e)}")
 
 # ===========================================
 # 추가 특별행정심판 도구들 (2026-01-21 추가)
@@ -251,37 +166,9 @@ def get_maritime_safety_tribunal_detail(tribunal_id: Union[str, int]) -> TextCon
 - page: 페이지 번호
 
 사용 예시: search_acrc_special_tribunal("자동차"), search_acrc_special_tribunal("면허", display=50)""")
-def search_acrc_special_tribunal(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
+@legislation_search("acrSpecialDecc", "국민권익위원회 특별행정심판", query_required=False)
+async def search_acrc_special_tribunal(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """국민권익위원회 특별행정심판재결례 검색"""
-    params = {"display": min(display, 100), "page": page}
-    if query and query.strip():
-        params["query"] = query.strip()
-        search_query = query.strip()
-    else:
-        search_query = "전체"
-    
-    try:
-        data = _make_legislation_request("acrSpecialDecc", params)
-        result = _format_search_results(data, "acrSpecialDecc", search_query, min(display, 100))
-        return TextContent(type="text", text=result)
-    except Exception as e:
-        return TextContent(type="text", text=f"국민권익위원회 특별행정심판 검색 중 오류: {str(e)}")
-
-@mcp.tool(name="get_acrc_special_tribunal_detail", description="""국민권익위원회 특별행정심판재결례 상세내용을 조회합니다.
-
-매개변수:
-- tribunal_id: 재결례ID
-
-사용 예시: get_acrc_special_tribunal_detail(tribunal_id="123456")""")
-def get_acrc_special_tribunal_detail(tribunal_id: Union[str, int]) -> TextContent:
-    """국민권익위원회 특별행정심판재결례 상세 조회"""
-    params = {"ID": str(tribunal_id)}
-    try:
-        data = _make_legislation_request("acrSpecialDecc", params, is_detail=True)
-        result = _format_search_results(data, "acrSpecialDecc", str(tribunal_id))
-        return TextContent(type="text", text=result)
-    except Exception as e:
-        return TextContent(type="text", text=f"국민권익위원회 특별행정심판 상세조회 중 오류: {str(e)}")
 
 @mcp.tool(name="search_mpm_appeal_tribunal", description="""인사혁신처 소청심사위원회 특별행정심판재결례를 검색합니다.
 
@@ -291,34 +178,56 @@ def get_acrc_special_tribunal_detail(tribunal_id: Union[str, int]) -> TextConten
 - page: 페이지 번호
 
 사용 예시: search_mpm_appeal_tribunal("징계"), search_mpm_appeal_tribunal("해임", display=50)""")
-def search_mpm_appeal_tribunal(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
+@legislation_search("adapSpecialDecc", "인사혁신처 소청심사위원회", query_required=False)
+async def search_mpm_appeal_tribunal(query: Optional[str] = None, display: int = 20, page: int = 1) -> TextContent:
     """인사혁신처 소청심사위원회 특별행정심판재결례 검색"""
-    params = {"display": min(display, 100), "page": page}
-    if query and query.strip():
-        params["query"] = query.strip()
-        search_query = query.strip()
-    else:
-        search_query = "전체"
-    
-    try:
-        data = _make_legislation_request("adapSpecialDecc", params)
-        result = _format_search_results(data, "adapSpecialDecc", search_query, min(display, 100))
-        return TextContent(type="text", text=result)
-    except Exception as e:
-        return TextContent(type="text", text=f"인사혁신처 소청심사위원회 검색 중 오류: {str(e)}")
 
-@mcp.tool(name="get_mpm_appeal_tribunal_detail", description="""인사혁신처 소청심사위원회 특별행정심판재결례 상세내용을 조회합니다.
+# ===========================================
+# 특별행정심판 상세조회 도구 (_make_tribunal_detail_tool 팩토리로 생성)
+# ===========================================
 
-매개변수:
-- tribunal_id: 재결례ID
+def _make_tribunal_detail_tool(name: str, target: str, label: str, title: str,
+                               id_desc: str, example_id: str):
+    """get_{name}_detail 도구를 생성하여 MCP에 등록
+    
+    Args:
+        name: 도구명 (get_{name}_detail)
+        target: API target 값
+        label: 오류 메시지용 기관명
+        title: 설명 제목
+        id_desc: ID 매개변수 설명
+        example_id: 사용 예시 ID
+    """
+    tool_name = f"get_{name}_detail"
+    
+    def detail_tool(tribunal_id: Union[str, int]) -> TextContent:
+        params = {"ID": str(tribunal_id)}
+        try:
+            data = _make_case_detail_request(target, params)
+            result = _format_search_results(data, target, str(tribunal_id))
+            return TextContent(type="text", text=result)
+        except Exception as e:
+            return TextContent(type="text", text=f"{label} 상세조회 중 오류: {str(e)}")
+    
+    detail_tool.__name__ = detail_tool.__qualname__ = tool_name
+    detail_tool.__doc__ = f"{title} 상세 조회"
+    description = f"""{title} 상세내용을 조회합니다.
 
-사용 예시: get_mpm_appeal_tribunal_detail(tribunal_id="123456")""")
-def get_mpm_appeal_tribunal_detail(tribunal_id: Union[str, int]) -> TextContent:
-    """인사혁신처 소청심사위원회 특별행정심판재결례 상세 조회"""
-    params = {"ID": str(tribunal_id)}
-    try:
-        data = _make_legislation_request("adapSpecialDecc", params, is_detail=True)
-        result = _format_search_results(data, "adapSpecialDecc", str(tribunal_id))
-        return TextContent(type="text", text=result)
-    except Exception as e:
-        return TextContent(type="text", text=f"인사혁신처 소청심사위원회 상세조회 중 오류: {str(e)}") 
\ No newline at end of file
+매개변수:
+- tribunal_id: {id_desc}
+
+사용 예시: {tool_name}(tribunal_id="{example_id}")"""
+    return mcp.tool(name=tool_name, description=description)(detail_tool)
+
+get_tax_tribunal_detail = _make_tribunal_detail_tool(
+    "tax_tribunal", "ttSpecialDecc", "조세심판원",
+    "조세심판원 특별행정심판례", "심판례ID", "1018160")
+get_maritime_safety_tribunal_detail = _make_tribunal_detail_tool(
+    "maritime_safety_tribunal", "kmstSpecialDecc", "해양안전심판원",
+    "해양안전심판원 특별행정심판례", "심판례ID", "2")
+get_acrc_special_tribunal_detail = _make_tribunal_detail_tool(
+    "acrc_special_tribunal", "acrSpecialDecc", "국민권익위원회 특별행정심판",
+    "국민권익위원회 특별행정심판재결례", "재결례ID", "123456")
+get_mpm_appeal_tribunal_detail = _make_tribunal_detail_tool(
+    "mpm_appeal_tribunal", "adapSpecialDecc", "인사혁신처 소청심사위원회",
+    "인사혁신처 소청심사위원회 특별행정심판재결례", "재결례ID", "123456")
@@ -10,6 +10,7 @@ Playwright 기반으로 guideList.do에서 전체 API를 클릭/방문하여 정
 사용법:
     # 의존성 설치
     uv pip install playwright beautifulsoup4 lxml
+    uv pip install orjson  # 선택: JSON 저장 가속
     playwright install chromium
     
     # 실행
@@ -17,6 +18,9 @@ Playwright 기반으로 guideList.do에서 전체 API를 클릭/방문하여 정
     
     # 디버그 (브라우저 보이게)
     HEADLESS=0 python src/mcp_kr_legislation/utils/api_crawler.py
+    
+    # 동시 수집 페이지 수 조정 (기본 8) / HTTP 직접 요청 동시 수 (기본 32)
+    CRAWL_CONCURRENCY=4 DETAIL_HTTP_CONCURRENCY=16 python src/mcp_kr_legislation/utils/api_crawler.py
 
 출력:
     - src/mcp_kr_legislation/utils/api_layout/*.json (18개 구분별 파일)
@@ -26,7 +30,7 @@ Playwright 기반으로 guideList.do에서 전체 API를 클릭/방문하여 정
 알려진 문제:
     1. HTML 테이블의 rowspan으로 인해 물리적 td 개수가 행마다 다름
        -> parse_table_with_rowspan()으로 논리적 2D 테이블 변환
-    2. 일부 API 셀은 텍스트 매칭 실패로 클릭 불가
+    2. 일부 API 셀은 클릭해도 상세 페이지가 열리지 않음
        -> _failed_apis.log 확인 후 수동 보완 필요
     3. 문서에 없는 API는 target 값을 패턴으로 추정
        - 중앙부처 법령해석: {부처영문약어}CgmExpc
@@ -34,22 +38,70 @@ Playwright 기반으로 guideList.do에서 전체 API를 클릭/방문하여 정
 """
 from __future__ import annotations
 
+import asyncio
 import json
+from array import array
 import os
 import re
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from urllib.parse import urlparse, parse_qs
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse, parse_qs
+
+import lxml.html
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from playwright.async_api import async_playwright, TimeoutError as PwTimeoutError
 
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright, TimeoutError as PwTimeoutError
+try:
+    import orjson  # type: ignore
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore
+    HAS_ORJSON = False
 
 
 GUIDE_LIST_URL = "https://open.law.go.kr/LSO/openApi/guideList.do"
+GUIDE_RESULT_URL = "https://open.law.go.kr/LSO/openApi/guideResult.do"
 OUTPUT_DIR = Path(__file__).resolve().parent / "api_layout"
 
+# 상세 페이지 파싱 범위 제한 - <head>(스크립트/스타일) 제외
+# "요청 URL" 문구는 표 밖에 있을 수 있어 body 전체를 유지
+_BODY_STRAINER = SoupStrainer("body")
+
+# 파싱 hot path 정규식 (모듈 로드 시 1회 컴파일)
+_WS_RE = re.compile(r"\s+")
+_REQ_URL_RE = re.compile(r"요청\s*URL\s*:\s*(https?://[^\s]+)")
+_ABS_URL_RE = re.compile(r"(https?://[^\s]+)")
+_GUIDE_RESULT_RE = re.compile(r"(?:https?://[^\s'\"]+)?/?[\w/]*guideResult\.do\?[^\s'\"]+")
+_JS_CALL_ARG_RE = re.compile(r"\w+\(\s*['\"]([^'\"]+)['\"]")
+
+# 제공API 칸에서 API가 없음을 뜻하는 표기
+_EMPTY_SENTINELS = frozenset({"-", "—", "–", ""})
+
+# guideResult 동시 수집 페이지 수 (하나의 브라우저 컨텍스트 공유)
+CRAWL_CONCURRENCY = int(os.environ.get("CRAWL_CONCURRENCY", "8"))
+
+# guideResult HTTP 직접 요청 동시 수 (브라우저 없이 requests 세션 커넥션 풀 공유)
+DETAIL_HTTP_CONCURRENCY = int(os.environ.get("DETAIL_HTTP_CONCURRENCY", "32"))
+DETAIL_HTTP_TIMEOUT = (3.05, 10)
+
+# guideResult 페이지 대기 시간(ms) - 이동은 commit까지, 이후 표 요소 등장까지
+DETAIL_NAV_TIMEOUT_MS = 3000
+DETAIL_SELECTOR_TIMEOUT_MS = 4000
+
+# 크롤링에 불필요한 리소스 유형 (요청 자체를 차단)
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "stylesheet", "font", "media"})
+
+# 브라우저 프로필 경로 - 쿠키/HTTP 캐시를 실행 간 유지
+CRAWL_USER_DATA_DIR = Path(os.environ.get(
+    "CRAWL_USER_DATA_DIR", Path.home() / ".cache" / "mcp-kr-legislation" / "playwright"
+))
+
 # 원본 구분(모바일 제외) 18개를 그대로 파일로 분리
 CATEGORY_CONFIG: Dict[str, Dict[str, str]] = {
     "법령": {"en": "law", "file": "law.json"},
@@ -79,8 +131,14 @@ CATEGORY_CONFIG: Dict[str, Dict[str, str]] = {
 
 SKIP_CATEGORY_EN = {"mobile"}
 
+# category_en -> (대표 구분명, 파일명) - 줄바꿈 변형 키는 첫 항목을 따름
+CATEGORY_FILES: Dict[str, Tuple[str, str]] = {}
+for _ko, _cfg in CATEGORY_CONFIG.items():
+    if _cfg["en"] not in SKIP_CATEGORY_EN:
+        CATEGORY_FILES.setdefault(_cfg["en"], (_ko.replace("\n", " "), _cfg["file"]))
+
 # 크롤링 실패 시 자동 보완할 API 목록
-# 원인: 셀 텍스트 매칭 실패, 클릭/네비게이션 실패 등
+# 원인: 셀 찾기 실패, 클릭/네비게이션 실패 등
 SUPPLEMENT_APIS: Dict[str, List[dict]] = {
     "law": [
         {
@@ -226,85 +284,175 @@ SUPPLEMENT_APIS: Dict[str, List[dict]] = {
 }
 
 
-def parse_table_with_rowspan(html: str) -> List[List[dict]]:
+@dataclass(slots=True)
+class LogicalTable:
+    """
+    rowspan/colspan을 펼친 논리적 2D 테이블.
+    셀 dict는 물리적 셀(원본)마다 하나만 만들고, 각 칸에는 owner 배열로 원본 셀 번호만 기록 (-1은 빈 칸).
+    """
+    n_rows: int
+    n_cols: int
+    cells: List[dict]
+    owner: array
+
+    def cell(self, row: int, col: int) -> Optional[dict]:
+        """(row, col) 칸을 덮는 원본 셀 (빈 칸이면 None)"""
+        idx = self.owner[row * self.n_cols + col]
+        return self.cells[idx] if idx >= 0 else None
+
+    def text(self, row: int, col: int) -> str:
+        """(row, col) 칸의 텍스트 (병합된 칸은 원본 셀 텍스트)"""
+        cell = self.cell(row, col)
+        return cell["text"] if cell is not None else ""
+
+    def origin(self, row: int, col: int) -> Optional[dict]:
+        """(row, col)에서 시작하는 원본 셀 (병합으로 덮인 칸이나 빈 칸이면 None)"""
+        cell = self.cell(row, col)
+        if cell is not None and cell["row"] == row and cell["col"] == col:
+            return cell
+        return None
+
+
+def parse_table_with_rowspan(html: str) -> LogicalTable:
     """
     rowspan/colspan을 처리하여 논리적 2D 테이블로 변환.
-    각 셀은 {"text": str, "element": Tag or None} 형태.
+    원본 셀은 {"text": str, "element": HtmlElement, "guide_url": str or None, "row": int, "col": int,
+    "rowspan": int, "colspan": int, "physical_row": int, "physical_col": int, "is_api": bool} 형태.
+    is_api는 텍스트가 비어 있거나 "-" 같은 빈 칸 표기가 아닌지 여부 (파싱 시 한 번만 판정).
+    guide_url은 원본 셀의 onclick/href에서 추출한 guideResult 주소 (없으면 None).
+    row/col은 논리적 위치, physical_row/physical_col(0부터)은 부모 요소 안에서의 tr 위치와
+    tr 안에서의 셀 위치로, 브라우저에서 텍스트 매칭 없이 nth-child로 바로 찾을 수 있게 함.
+
+    가장 큰 문서이므로 BeautifulSoup 래퍼 없이 lxml.html + XPath로 직접 순회하고,
+    병합 영역은 칸마다 dict를 만드는 대신 정수 배열에 원본 셀 번호만 기록.
     """
-    soup = BeautifulSoup(html, "lxml")
-    table = soup.find("table")
-    if not table:
-        return []
+    empty = LogicalTable(0, 0, [], array("i"))
+    if not html or not html.strip():
+        return empty
+    tables = lxml.html.fromstring(html).xpath("//table")
+    if not tables:
+        return empty
     
-    rows = table.find_all("tr")
+    rows = tables[0].xpath(".//tr")
     if not rows:
-        return []
+        return empty
+    row_cells = [tr.xpath("./td | ./th") for tr in rows]
+    
+    # tr:nth-child 기준 위치 - thead/tbody마다 다시 1부터 셈
+    physical_rows: List[int] = []
+    tr_counts: Dict[object, int] = {}
+    for tr in rows:
+        parent = tr.getparent()
+        physical_rows.append(tr_counts.get(parent, 0))
+        tr_counts[parent] = physical_rows[-1] + 1
     
     # 최대 컬럼 수 계산
     max_cols = 0
-    for tr in rows:
+    for cells in row_cells:
         cols = 0
-        for cell in tr.find_all(["td", "th"]):
+        for cell in cells:
             colspan = int(cell.get("colspan", 1))
             cols += colspan
         max_cols = max(max_cols, cols)
     
-    # 논리적 테이블 초기화 (None으로 채움)
-    logical_table: List[List[Optional[dict]]] = [
-        [None for _ in range(max_cols)] for _ in range(len(rows))
-    ]
+    n_rows = len(rows)
+    owner = array("i", [-1]) * (n_rows * max_cols)
+    origins: List[dict] = []
     
-    for row_idx, tr in enumerate(rows):
+    for row_idx, (physical_row, cells) in enumerate(zip(physical_rows, row_cells)):
+        base = row_idx * max_cols
         col_idx = 0
-        for cell in tr.find_all(["td", "th"]):
-            # 이미 채워진 셀 건너뛰기 (이전 rowspan에 의해)
-            while col_idx < max_cols and logical_table[row_idx][col_idx] is not None:
+        for physical_col, cell in enumerate(cells):
+            # 이미 채워진 칸 건너뛰기 (이전 rowspan에 의해) - 행 안에서 한 방향으로만 전진
+            while col_idx < max_cols and owner[base + col_idx] >= 0:
                 col_idx += 1
             
             if col_idx >= max_cols:
                 break
             
-            rowspan = int(cell.get("rowspan", 1))
-            colspan = int(cell.get("colspan", 1))
-            text = _norm(cell.get_text(" ", strip=True))
+            rowspan = max(1, int(cell.get("rowspan", 1)))
+            colspan = max(1, int(cell.get("colspan", 1)))
             
-            # rowspan x colspan 영역 채우기
-            for r in range(rowspan):
-                for c in range(colspan):
-                    target_row = row_idx + r
-                    target_col = col_idx + c
-                    if target_row < len(rows) and target_col < max_cols:
-                        logical_table[target_row][target_col] = {
-                            "text": text,
-                            "element": cell if (r == 0 and c == 0) else None,
-                            "is_origin": (r == 0 and c == 0),
-                        }
+            text = _cell_text(cell)
+            cell_no = len(origins)
+            origins.append({
+                "text": text,
+                "element": cell,
+                "guide_url": _find_guide_url(cell),
+                "row": row_idx,
+                "col": col_idx,
+                "rowspan": rowspan,
+                "colspan": colspan,
+                "physical_row": physical_row,
+                "physical_col": physical_col,
+                "is_api": text not in _EMPTY_SENTINELS,
+            })
+            # rowspan x colspan 영역을 원본 셀 번호로 채움 (표 범위 밖은 잘라냄)
+            col_end = min(col_idx + colspan, max_cols)
+            span = array("i", [cell_no]) * (col_end - col_idx)
+            for r in range(row_idx, min(row_idx + rowspan, n_rows)):
+                owner[r * max_cols + col_idx:r * max_cols + col_end] = span
             
             col_idx += colspan
     
-    # None을 빈 셀로 변환
-    for r in range(len(logical_table)):
-        for c in range(len(logical_table[r])):
-            if logical_table[r][c] is None:
-                logical_table[r][c] = {"text": "", "element": None, "is_origin": False}
-    
-    return logical_table
+    return LogicalTable(n_rows, max_cols, origins, owner)
+
+
+def _extract_guide_url(script: Optional[str]) -> Optional[str]:
+    """
+    onclick/href 값에서 guideResult 상세 페이지 주소 추출.
+    - guideResult.do?... 주소가 직접 들어 있으면 그대로 사용
+    - fn_xxx('lawSearch') 같은 스크립트 호출이면 첫 인자를 htmlName으로 사용
+    """
+    if not script:
+        return None
+    m = _GUIDE_RESULT_RE.search(script)
+    if m:
+        return urljoin(GUIDE_LIST_URL, m.group(0))
+    m = _JS_CALL_ARG_RE.search(script)
+    if m:
+        return f"{GUIDE_RESULT_URL}?htmlName={m.group(1)}"
+    return None
 
 
-@dataclass
+def _cell_text(cell) -> str:
+    """lxml 셀 텍스트 - BeautifulSoup get_text(" ", strip=True)와 같은 방식으로 조각을 공백 연결"""
+    return _norm(" ".join(t.strip() for t in cell.itertext() if t.strip()))
+
+
+def _find_guide_url(cell) -> Optional[str]:
+    """셀 자신 또는 하위 a/onclick 요소에서 guideResult 주소 찾기"""
+    candidates = [cell.get("onclick")]
+    for el in cell.iterdescendants("a", "span", "div"):
+        candidates.append(el.get("onclick"))
+        candidates.append(el.get("href"))
+    for script in candidates:
+        url = _extract_guide_url(script)
+        if url:
+            return url
+    return None
+
+
+@dataclass(slots=True)
 class Parameter:
     name: str
     type: str
     description: str
 
+    def to_dict(self) -> dict:
+        return {"name": self.name, "type": self.type, "description": self.description}
 
-@dataclass
+
+@dataclass(slots=True)
 class SampleUrl:
     format: str
     url: str
 
+    def to_dict(self) -> dict:
+        return {"format": self.format, "url": self.url}
+
 
-@dataclass
+@dataclass(slots=True)
 class ApiItem:
     id: str
     title: str
@@ -315,30 +463,50 @@ class ApiItem:
     parameters: List[Parameter]
     sample_urls: List[SampleUrl]
 
+    def to_dict(self) -> dict:
+        """JSON 저장용 dict (dataclasses.asdict의 재귀 deepcopy 없이 얕게 변환)"""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "request_url": self.request_url,
+            "target": self.target,
+            "api_type": self.api_type,
+            "sub_category": self.sub_category,
+            "parameters": [p.to_dict() for p in self.parameters],
+            "sample_urls": [s.to_dict() for s in self.sample_urls],
+        }
+
 
 def _today() -> str:
     return datetime.now().strftime("%Y-%m-%d")
 
 
 def _norm(s: str) -> str:
-    return re.sub(r"\s+", " ", s).strip()
+    return _WS_RE.sub(" ", s).strip()
+
+
+# 공백/줄바꿈을 정규화한 구분명 -> 설정 (줄바꿈 변형 키도 같은 항목으로 모임)
+CATEGORY_CONFIG_NORM: Dict[str, Dict[str, str]] = {_norm(k): v for k, v in CATEGORY_CONFIG.items()}
 
 
 def _extract_request_url(text: str) -> Optional[str]:
-    m = re.search(r"요청\s*URL\s*:\s*(https?://[^\s]+)", text)
+    m = _REQ_URL_RE.search(text)
     return m.group(1).strip() if m else None
 
 
+@lru_cache(maxsize=4096)
+def _url_query_param(url: str, name: str) -> str:
+    """URL 쿼리스트링의 name 파라미터 첫 값 (없으면 빈 문자열) - 같은 샘플 URL이 여러 번 파싱되므로 캐시"""
+    return parse_qs(urlparse(url).query).get(name, [""])[0]
+
+
 def _extract_target_from_url(url: Optional[str]) -> Optional[str]:
     if not url:
         return None
     try:
-        q = parse_qs(urlparse(url).query)
-        if "target" in q and q["target"]:
-            return q["target"][0]
+        return _url_query_param(url, "target") or None
     except Exception:
         return None
-    return None
 
 
 def _parse_api_type(title: str) -> Optional[str]:
@@ -376,7 +544,7 @@ def _parse_request_params(soup: BeautifulSoup) -> List[Parameter]:
     return []
 
 
-def _parse_sample_urls(soup: BeautifulSoup) -> List[SampleUrl]:
+def _parse_sample_urls(soup: BeautifulSoup, text: Optional[str] = None) -> List[SampleUrl]:
     out: List[SampleUrl] = []
 
     # a[href] 기반으로 HTML/XML/JSON 추출
@@ -394,8 +562,7 @@ def _parse_sample_urls(soup: BeautifulSoup) -> List[SampleUrl]:
         elif "JSON" in label:
             fmt = "JSON"
         else:
-            q = parse_qs(urlparse(href).query)
-            t = (q.get("type", [""])[0] or "").upper()
+            t = _url_query_param(href, "type").upper()
             if t:
                 fmt = t
 
@@ -404,25 +571,35 @@ def _parse_sample_urls(soup: BeautifulSoup) -> List[SampleUrl]:
 
     # 텍스트만 있는 경우 대비
     if not out:
-        text = soup.get_text("\n", strip=True)
-        for m in re.finditer(r"(https?://[^\s]+)", text):
+        if text is None:
+            text = soup.get_text("\n", strip=True)
+        for m in _ABS_URL_RE.finditer(text):
             url = m.group(1)
-            q = parse_qs(urlparse(url).query)
-            t = (q.get("type", [""])[0] or "").upper()
+            t = _url_query_param(url, "type").upper()
             if t:
                 out.append(SampleUrl(format=t, url=url))
 
-    uniq = {(s.format, s.url): s for s in out}
-    return list(uniq.values())
+    # 중간 dict 없이 한 번의 순회로 (형식, URL) 중복 제거 - 첫 등장 순서 유지
+    seen = set()
+    uniq: List[SampleUrl] = []
+    for s in out:
+        key = (s.format, s.url)
+        if key not in seen:
+            seen.add(key)
+            uniq.append(s)
+    return uniq
 
 
-def parse_guide_result(html: str) -> Tuple[Optional[str], Optional[str], List[Parameter], List[SampleUrl]]:
-    soup = BeautifulSoup(html, "lxml")
+def parse_guide_result(soup: BeautifulSoup) -> Tuple[Optional[str], Optional[str], List[Parameter], List[SampleUrl]]:
+    """
+    guideResult 페이지 파싱. 호출자가 HTML을 한 번만 파싱해 soup을 넘기고,
+    전체 텍스트도 한 번만 추출하여 요청 URL/샘플 URL 추출에 함께 사용.
+    """
     text = soup.get_text("\n", strip=True)
     request_url = _extract_request_url(text)
     target = _extract_target_from_url(request_url)
     params = _parse_request_params(soup)
-    samples = _parse_sample_urls(soup)
+    samples = _parse_sample_urls(soup, text)
     return request_url, target, params, samples
 
 
@@ -430,6 +607,20 @@ def ensure_output_dir() -> None:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _dump_json(payload: dict) -> bytes:
+    """JSON 직렬화 (UTF-8, 2칸 들여쓰기) - orjson이 있으면 C 구현 사용"""
+    if HAS_ORJSON:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _write_json_atomic(path: Path, payload: dict) -> None:
+    """임시 파일에 쓴 뒤 교체 - 중단되어도 기존 파일이 잘린 JSON으로 남지 않음"""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(_dump_json(payload))
+    os.replace(tmp_path, path)
+
+
 def write_category_file(category_ko: str, category_en: str, filename: str, items: List[ApiItem]) -> Path:
     ensure_output_dir()
     payload = {
@@ -437,218 +628,435 @@ def write_category_file(category_ko: str, category_en: str, filename: str, items
         "category_en": category_en,
         "updated_at": _today(),
         "api_count": len(items),
-        "apis": [asdict(x) for x in items],
+        "apis": [x.to_dict() for x in items],
     }
     path = OUTPUT_DIR / filename
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    _write_json_atomic(path, payload)
     return path
 
 
-def run(headless: bool = True) -> None:
+async def _fetch_guide_html(page, detail_page, cell_selector: str) -> Optional[str]:
     """
-    guideList 표를 순회하며:
-    - 구분(category) / 분류(sub_category) / 제공API(title)
-    - 제공API 셀 클릭 -> guideResult 방문 -> request_url/params/samples/target 추출
-    - 구분별 JSON(18개) 생성
-    - 모바일 구분은 전체 제외
-    - rowspan 처리: 논리적 테이블로 변환 후 처리
+    목록 페이지에서 API 셀을 클릭하여 guideResult HTML 확보 (popup 우선, navigation 폴백).
+    navigation은 목록 페이지에서 차단(_block_guide_navigation)하고, 발생한 요청을
+    detail_page에서 대신 열어 목록 페이지가 다시 로드되지 않도록 함.
     """
-    ensure_output_dir()
+    html = None
+    cell = page.locator(cell_selector).first
+
+    # popup 우선
+    try:
+        async with page.expect_popup(timeout=800) as pop:
+            await cell.click(timeout=2500)
+        pop_page = await pop.value
+        # 하위 리소스 로딩은 기다리지 않고 필요한 표가 나타나면 바로 읽음
+        await pop_page.wait_for_selector("table", timeout=DETAIL_SELECTOR_TIMEOUT_MS)
+        html = await pop_page.content()
+        await pop_page.close()
+    except PwTimeoutError:
+        pass
+    except Exception:
+        pass
+
+    # navigation fallback - 목록 페이지의 guideResult 요청을 가로채 detail_page에서 로드
+    if html is None:
+        try:
+            async with page.expect_request(lambda req: "guideResult.do" in req.url, timeout=7000) as req_info:
+                await cell.click(timeout=2500)
+            html = await _load_guide_request(detail_page, await req_info.value)
+        except PwTimeoutError:
+            pass
+        except Exception:
+            pass
+
+    # 차단을 벗어나 목록 페이지가 이동한 경우에만 복귀 (go_back 대신 URL로 직접 이동)
+    # 논리적 테이블은 이미 메모리에 있으므로 commit 시점까지만 대기 - 이후 클릭은 locator가 자동 대기
+    if "guideResult.do" in page.url:
+        try:
+            await page.goto(GUIDE_LIST_URL, wait_until="commit")
+        except Exception:
+            pass
+    return html
+
+
+async def _block_static_resources(route) -> None:
+    """이미지/CSS/폰트/미디어 요청 차단 - 표와 링크의 HTML만 필요"""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _block_guide_navigation(route) -> None:
+    """목록 페이지의 guideResult 이동 차단 (요청 정보는 expect_request로 확보)"""
+    await route.abort()
+
+
+async def _load_guide_request(detail_page, request) -> Optional[str]:
+    """가로챈 guideResult 요청을 전용 상세 페이지에서 실행하여 HTML 반환"""
+    if request.method == "GET":
+        # 응답 헤더 수신(commit)까지만 대기한 뒤 필요한 표가 나타나면 바로 읽음
+        await detail_page.goto(request.url, wait_until="commit", timeout=DETAIL_NAV_TIMEOUT_MS)
+        await detail_page.wait_for_selector("table", timeout=DETAIL_SELECTOR_TIMEOUT_MS)
+        return await detail_page.content()
+    # form POST 이동은 같은 본문으로 직접 요청
+    response = await detail_page.request.fetch(
+        request.url, method=request.method, headers=request.headers,
+        data=request.post_data_buffer, timeout=DETAIL_NAV_TIMEOUT_MS + DETAIL_SELECTOR_TIMEOUT_MS,
+    )
+    return await response.text() if response.ok else None
+
+
+def _create_guide_session(cookies: List[dict]) -> requests.Session:
+    """
+    guideResult 직접 요청용 세션 생성 (브라우저 쿠키 복사 + 커넥션 풀 + 재시도).
+    403/429는 차단/속도 제한으로 보고 지수 백오프로 재시도.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=DETAIL_HTTP_CONCURRENCY,
+        max_retries=Retry(total=3, backoff_factor=0.5,
+                          status_forcelist=[403, 429, 502, 503, 504],
+                          respect_retry_after_header=True),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive", "Referer": GUIDE_LIST_URL})
+    for c in cookies:
+        session.cookies.set(c["name"], c["value"], domain=c.get("domain", ""), path=c.get("path", "/"))
+    return session
+
+
+def _get_guide_html(session: requests.Session, url: str) -> Optional[str]:
+    """
+    guideResult 페이지를 렌더링 없이 HTTP로 직접 요청.
+    요청변수 표가 없는 응답은 None을 반환하여 클릭 방식으로 폴백.
+    """
+    try:
+        response = session.get(url, timeout=DETAIL_HTTP_TIMEOUT)
+        if not response.ok:
+            return None
+        # charset 헤더가 없으면 requests가 ISO-8859-1로 디코딩하므로 본문 기준으로 추정
+        if "charset" not in response.headers.get("Content-Type", "").lower():
+            response.encoding = response.apparent_encoding
+        html = response.text
+    except requests.RequestException:
+        return None
+    return html if "요청변수" in html else None
+
+
+async def _fetch_guide_urls(jobs: List[tuple], cookies: List[dict],
+                            on_html: Optional[Callable[[int, str], None]] = None) -> Dict[int, str]:
+    """
+    onclick/href에서 주소를 얻은 작업을 브라우저 없이 한꺼번에 동시 요청.
+    on_html이 주어지면 각 HTML이 도착하는 즉시 (작업 인덱스, HTML)로 호출.
+
+    Returns:
+        작업 인덱스 -> HTML (실패한 작업은 제외되어 클릭 폴백 대상이 됨)
+    """
+    session = _create_guide_session(cookies)
+    semaphore = asyncio.Semaphore(DETAIL_HTTP_CONCURRENCY)
+
+    async def fetch(job_idx: int, url: str) -> Tuple[int, Optional[str]]:
+        async with semaphore:
+            html = await asyncio.to_thread(_get_guide_html, session, url)
+        if html is not None and on_html is not None:
+            on_html(job_idx, html)
+        return job_idx, html
+
+    try:
+        pairs = await asyncio.gather(*(
+            fetch(job_idx, job[6]) for job_idx, job in enumerate(jobs) if job[6]
+        ))
+    finally:
+        session.close()
+    return {job_idx: html for job_idx, html in pairs if html is not None}
+
+
+def _supplement_category(category_en: str, items: List[ApiItem]) -> int:
+    """
+    SUPPLEMENT_APIS 중 크롤링 결과에 없는 API를 items에 추가하고 추가한 개수를 반환.
+    파라미터는 같은 구분의 다른 API에서 템플릿으로 복사.
+    """
+    supplement_list = SUPPLEMENT_APIS.get(category_en, [])
+    if not supplement_list:
+        return 0
+
+    # 이미 추출된 title 목록
+    existing_titles = {api.title for api in items}
+
+    def find_param_template(target_api_type: str) -> Tuple[List[Parameter], List[SampleUrl]]:
+        """동일 카테고리의 다른 API에서 파라미터 템플릿 복사 (같은 api_type 우선)"""
+        for existing_api in items:
+            if existing_api.parameters and existing_api.api_type == target_api_type:
+                return existing_api.parameters, existing_api.sample_urls
+        # api_type 무관하게 파라미터 있는 것 찾기
+        for existing_api in items:
+            if existing_api.parameters:
+                return existing_api.parameters, existing_api.sample_urls
+        return [], []
+
+    added = 0
+    for sup in supplement_list:
+        if sup["title"] in existing_titles:
+            continue
+        # 파라미터 템플릿 찾기
+        template_params, template_samples = find_param_template(sup["api_type"])
+
+        # target 값에 맞게 샘플 URL 생성
+        generated_samples = []
+        if sup["target"]:
+            base_url = sup["request_url"].split("?")[0] if sup["request_url"] else ""
+            if base_url:
+                for fmt in ["JSON", "XML", "HTML"]:
+                    sample_url = f"{base_url}?OC=test&target={sup['target']}&type={fmt}"
+                    generated_samples.append(SampleUrl(format=fmt, url=sample_url))
+
+        items.append(ApiItem(
+            id="__TEMP__",
+            title=sup["title"],
+            request_url=sup["request_url"],
+            target=sup["target"],
+            api_type=sup["api_type"],
+            sub_category=sup["sub_category"],
+            parameters=template_params if template_params else [],
+            sample_urls=generated_samples if generated_samples else template_samples,
+        ))
+        added += 1
+        param_status = f"params={len(template_params)}" if template_params else "params=0"
+        sample_status = f"samples={len(generated_samples)}" if generated_samples else "samples=0"
+        print(f"[SUPPLEMENT] {category_en}: {sup['title']} ({param_status}, {sample_status})")
+    return added
+
+
+class _CategoryPipeline:
+    """
+    구분별 남은 작업 수를 추적하여, 구분의 마지막 API가 끝나는 즉시
+    보완/id 부여 후 파일 저장을 백그라운드 스레드에 맡김 (남은 크롤링과 디스크 I/O를 겹침).
+    파일 안 API 순서는 완료 순서와 무관하게 원래 표 순서를 유지.
+    """
+
+    def __init__(self, jobs: List[tuple]):
+        self.jobs = jobs
+        self.job_indices: Dict[str, List[int]] = {}
+        for job_idx, job in enumerate(jobs):
+            self.job_indices.setdefault(job[3], []).append(job_idx)
+        self.pending: Dict[str, int] = {k: len(v) for k, v in self.job_indices.items()}
+        self.items: Dict[int, ApiItem] = {}
+        self.failed_clicks: List[str] = []
+        self.buckets: Dict[str, List[ApiItem]] = {}
+        self.supplemented_count = 0
+        self._writes: List[asyncio.Task] = []
+
+    def complete(self, job_idx: int, html: Optional[str], record_failure: bool = True) -> None:
+        """
+        작업 하나의 결과 반영. html이 None이면 실패로 기록
+        (record_failure=False는 셀 찾기 자체가 실패한 경우 - 실패 목록에서도 제외).
+        """
+        row_idx, col_idx, title, category_en, category_text, sub_category_text = self.jobs[job_idx][:6]
+        if html is not None:
+            request_url, target, params, samples = parse_guide_result(
+                BeautifulSoup(html, "lxml", parse_only=_BODY_STRAINER)
+            )
+            self.items[job_idx] = ApiItem(
+                id="__TEMP__",
+                title=title if title.endswith("API") else f"{title} API",
+                request_url=request_url,
+                target=target,
+                api_type=_parse_api_type(title),
+                sub_category=sub_category_text,
+                parameters=params,
+                sample_urls=samples,
+            )
+            print(f"[OK] {category_text}/{sub_category_text}: {title}")
+        elif record_failure:
+            self.failed_clicks.append(f"row={row_idx}, col={col_idx}, title='{title}', category='{category_text}'")
+            print(f"[WARN] HTML 확보 실패: row={row_idx}, col={col_idx}, title={title}")
+
+        self.pending[category_en] -= 1
+        if self.pending[category_en] == 0:
+            self._flush(category_en)
+
+    def _flush(self, category_en: str) -> None:
+        """구분 결과 확정 - 표 순서대로 모아 보완 후 파일 저장을 예약"""
+        items = [self.items[i] for i in self.job_indices.get(category_en, []) if i in self.items]
+        self.supplemented_count += _supplement_category(category_en, items)
+        self.buckets[category_en] = items
+
+        if category_en not in CATEGORY_FILES:
+            return
+        category_ko, filename = CATEGORY_FILES[category_en]
+
+        # 빈 파일 생성하지 않음
+        if not items:
+            print(f"[SKIP] {category_ko}({category_en}): 0개 - 빈 파일 생성 안함")
+            return
+
+        for idx, it in enumerate(items, 1):
+            it.id = str(idx)
+        self._writes.append(asyncio.create_task(self._write(category_ko, category_en, filename, items)))
+
+    async def _write(self, category_ko: str, category_en: str, filename: str, items: List[ApiItem]) -> None:
+        # JSON 직렬화 + 디스크 쓰기는 이벤트 루프를 막지 않도록 스레드에서 수행
+        out = await asyncio.to_thread(write_category_file, category_ko, category_en, filename, items)
+        print(f"[OK] {category_ko}({category_en}): {len(items)} -> {out}")
 
-    # category_en -> ApiItem list
-    buckets: Dict[str, List[ApiItem]] = {}
+    async def finish(self) -> None:
+        """작업이 없던 구분(보완 전용 포함)까지 확정하고 예약된 파일 저장 완료 대기"""
+        for category_en in list(CATEGORY_FILES) + list(SUPPLEMENT_APIS):
+            if category_en not in self.buckets and not self.pending.get(category_en):
+                self._flush(category_en)
+        await asyncio.gather(*self._writes)
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=headless)
-        page = browser.new_page()
-        page.goto(GUIDE_LIST_URL, wait_until="domcontentloaded")
-        page.wait_for_timeout(1000)
+
+async def _crawl_guide_pages(headless: bool, concurrency: int) -> Tuple[LogicalTable, List[tuple], _CategoryPipeline]:
+    """
+    guideList를 파싱하여 작업 목록을 만들고, 주소를 아는 guideResult는 HTTP로
+    일괄 수집한 뒤 나머지만 하나의 브라우저 컨텍스트에서 concurrency개의 페이지로 클릭 수집.
+    컨텍스트는 CRAWL_USER_DATA_DIR에 유지되어 쿠키/HTTP 캐시를 실행 간 재사용.
+    각 결과는 도착 즉시 파싱되고, 구분별 파일은 해당 구분이 끝나는 대로 저장됨.
+
+    Returns:
+        (논리적 테이블, 작업 목록, 결과를 반영한 구분별 파이프라인)
+    """
+    CRAWL_USER_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    async with async_playwright() as p:
+        context = await p.chromium.launch_persistent_context(
+            str(CRAWL_USER_DATA_DIR), headless=headless,
+            args=["--blink-settings=imagesEnabled=false"],
+        )
+        # 컨텍스트 단위로 한 번만 등록 (페이지별 route 재등록으로 인한 누적 방지)
+        await context.route("**/*", _block_static_resources)
+        page = context.pages[0] if context.pages else await context.new_page()
+        await page.route("**/guideResult.do*", _block_guide_navigation)
+        await page.goto(GUIDE_LIST_URL, wait_until="domcontentloaded")
+        await page.wait_for_timeout(1000)
 
         # 1단계: HTML에서 논리적 테이블 구조 파싱 (rowspan 처리)
-        html_content = page.content()
-        logical_table = parse_table_with_rowspan(html_content)
-        
-        if len(logical_table) < 2:
+        logical_table = parse_table_with_rowspan(await page.content())
+        if logical_table.n_rows < 2:
             raise RuntimeError("guideList.do에서 API 목록 행을 찾지 못했습니다.")
-
-        print(f"[DEBUG] 논리적 테이블: {len(logical_table)}행 x {len(logical_table[0]) if logical_table else 0}열")
-        
-        # 디버그 추적
-        failed_clicks = []
-        total_cells_found = 0
-        skipped_mobile = 0
-
-        # 2단계: 논리적 테이블 순회 (헤더 제외, row 1부터)
-        for row_idx in range(1, len(logical_table)):
-            row = logical_table[row_idx]
-            if len(row) < 3:
-                continue
-            
-            # 컬럼 구조: [구분, 분류, 제공API1, 제공API2, ...]
-            category_text = row[0]["text"]
-            sub_category_text = row[1]["text"] or None
-            
-            # 구분 확인
-            cfg = CATEGORY_CONFIG.get(category_text)
-            if not cfg:
-                # 줄바꿈 변형 체크
-                for k, v in CATEGORY_CONFIG.items():
-                    if _norm(k) == _norm(category_text):
-                        cfg = v
-                        break
-            
-            if not cfg:
-                continue
-            
-            category_en = cfg["en"]
-            filename = cfg["file"]
-            
-            # 모바일 스킵
-            if category_en in SKIP_CATEGORY_EN:
-                skipped_mobile += 1
-                continue
-            
-            buckets.setdefault(category_en, [])
-            
-            # 제공API 셀들 (col 2부터)
-            for col_idx in range(2, len(row)):
-                cell_info = row[col_idx]
-                title = cell_info["text"]
-                
-                if not title or title in {"-", "—", ""}:
-                    continue
-                
-                # 중복 클릭 방지: is_origin이 True인 셀만 클릭 (rowspan 원본)
-                if not cell_info["is_origin"]:
-                    continue
-                
-                total_cells_found += 1
-                
-                # Playwright로 해당 셀 찾아서 클릭
-                # 물리적 행/열 인덱스로 셀 찾기
-                html = None
+        jobs = _build_jobs(logical_table)
+        pipeline = _CategoryPipeline(jobs)
+
+        # 2단계: 주소를 아는 셀은 브라우저 없이 HTTP로 일괄 수집
+        results = await _fetch_guide_urls(jobs, await context.cookies(), on_html=pipeline.complete)
+
+        # 3단계: 남은 작업만 작업 큐에 넣어 여러 페이지(워커)가 클릭 방식으로 처리
+        queue: asyncio.Queue = asyncio.Queue()
+        for job_idx in range(len(jobs)):
+            if job_idx not in results:
+                queue.put_nowait(job_idx)
+
+        async def worker(worker_page) -> None:
+            # 목록 페이지와 상세 페이지는 클릭 폴백이 처음 필요할 때만 준비
+            list_loaded = worker_page is page
+            detail_page = None
+            while True:
                 try:
-                    # CSS selector로 정확한 셀 위치 찾기
-                    cell_selector = f"table tr:nth-child({row_idx + 1}) td:has-text('{title[:20]}')"
-                    cell = page.locator(cell_selector).first
-                    
-                    if not cell.is_visible():
-                        # 대안: 텍스트로 찾기
-                        cell = page.locator(f"td:has-text('{title}')").first
-                    
-                    # popup 우선
-                    try:
-                        with page.expect_popup(timeout=800) as pop:
-                            cell.click(timeout=2500)
-                        pop_page = pop.value
-                        pop_page.wait_for_load_state("domcontentloaded", timeout=7000)
-                        html = pop_page.content()
-                        pop_page.close()
-                    except PwTimeoutError:
-                        pass
-                    except Exception:
-                        pass
-
-                    # navigation fallback
-                    if html is None:
-                        try:
-                            with page.expect_navigation(wait_until="domcontentloaded", timeout=7000):
-                                cell.click(timeout=2500)
-                            html = page.content()
-                        except PwTimeoutError:
-                            page.wait_for_timeout(800)
-                            if "guideResult.do" in page.url:
-                                html = page.content()
-                        except Exception:
-                            pass
-                    
+                    job_idx = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                row_idx, col_idx, title = jobs[job_idx][:3]
+                cell_selector = jobs[job_idx][7]
+                try:
+                    if not list_loaded:
+                        await worker_page.route("**/guideResult.do*", _block_guide_navigation)
+                        await worker_page.goto(GUIDE_LIST_URL, wait_until="domcontentloaded")
+                        list_loaded = True
+                    if detail_page is None:
+                        detail_page = await context.new_page()
+                    html = await _fetch_guide_html(worker_page, detail_page, cell_selector)
                 except Exception as e:
+                    # 셀 찾기 자체가 실패한 경우는 실패 목록에서도 제외
                     print(f"[WARN] 셀 찾기 실패: row={row_idx}, col={col_idx}, title='{title}', error={e}")
+                    pipeline.complete(job_idx, None, record_failure=False)
                     continue
+                pipeline.complete(job_idx, html)
 
-                if html is None:
-                    failed_clicks.append(f"row={row_idx}, col={col_idx}, title='{title}', category='{category_text}'")
-                    print(f"[WARN] HTML 확보 실패: row={row_idx}, col={col_idx}, title={title}")
-                    if "guideResult.do" in page.url:
-                        try:
-                            page.go_back(wait_until="domcontentloaded")
-                            page.wait_for_timeout(300)
-                        except Exception:
-                            pass
-                    continue
+        # 남은 작업 수보다 많은 페이지는 열지 않음
+        n_pages = max(1, min(concurrency, queue.qsize()))
+        pages = [page] + [await context.new_page() for _ in range(n_pages - 1)]
+        await asyncio.gather(*(worker(pg) for pg in pages))
 
-                request_url, target, params, samples = parse_guide_result(html)
-
-                api_item = ApiItem(
-                    id="__TEMP__",
-                    title=title if title.endswith("API") else f"{title} API",
-                    request_url=request_url,
-                    target=target,
-                    api_type=_parse_api_type(title),
-                    sub_category=sub_category_text,
-                    parameters=params,
-                    sample_urls=samples,
-                )
-                buckets[category_en].append(api_item)
-                print(f"[OK] {category_text}/{sub_category_text}: {title}")
+        await context.close()
 
-                # 목록으로 복귀
-                if "guideResult.do" in page.url:
-                    page.go_back(wait_until="domcontentloaded")
-                    page.wait_for_timeout(400)
+    await pipeline.finish()
+    return logical_table, jobs, pipeline
 
-        browser.close()
 
-    # 실패한 API 자동 보완
-    supplemented_count = 0
-    for category_en, supplement_list in SUPPLEMENT_APIS.items():
-        if category_en not in buckets:
-            buckets[category_en] = []
-        
-        # 이미 추출된 title 목록
-        existing_titles = {api.title for api in buckets[category_en]}
-        
-        # 동일 카테고리에서 파라미터 템플릿 찾기 (같은 api_type 우선)
-        def find_param_template(target_api_type: str) -> Tuple[List[Parameter], List[SampleUrl]]:
-            """동일 카테고리의 다른 API에서 파라미터 템플릿 복사"""
-            for existing_api in buckets[category_en]:
-                if existing_api.parameters and existing_api.api_type == target_api_type:
-                    return existing_api.parameters, existing_api.sample_urls
-            # api_type 무관하게 파라미터 있는 것 찾기
-            for existing_api in buckets[category_en]:
-                if existing_api.parameters:
-                    return existing_api.parameters, existing_api.sample_urls
-            return [], []
-        
-        for sup in supplement_list:
-            if sup["title"] not in existing_titles:
-                # 파라미터 템플릿 찾기
-                template_params, template_samples = find_param_template(sup["api_type"])
-                
-                # target 값에 맞게 샘플 URL 생성
-                generated_samples = []
-                if sup["target"]:
-                    base_url = sup["request_url"].split("?")[0] if sup["request_url"] else ""
-                    if base_url:
-                        for fmt in ["JSON", "XML", "HTML"]:
-                            sample_url = f"{base_url}?OC=test&target={sup['target']}&type={fmt}"
-                            generated_samples.append(SampleUrl(format=fmt, url=sample_url))
-                
-                api_item = ApiItem(
-                    id="__TEMP__",
-                    title=sup["title"],
-                    request_url=sup["request_url"],
-                    target=sup["target"],
-                    api_type=sup["api_type"],
-                    sub_category=sup["sub_category"],
-                    parameters=template_params if template_params else [],
-                    sample_urls=generated_samples if generated_samples else template_samples,
-                )
-                buckets[category_en].append(api_item)
-                supplemented_count += 1
-                param_status = f"params={len(template_params)}" if template_params else "params=0"
-                sample_status = f"samples={len(generated_samples)}" if generated_samples else "samples=0"
-                print(f"[SUPPLEMENT] {category_en}: {sup['title']} ({param_status}, {sample_status})")
+def _build_jobs(logical_table: LogicalTable) -> List[tuple]:
+    """
+    논리적 테이블(헤더 제외)에서 크롤링 대상 API 셀 목록 생성.
+    각 작업: (row_idx, col_idx, title, category_en, category_text, sub_category_text, guide_url, cell_selector)
+    cell_selector는 원본 셀의 물리적 위치로 만든 CSS selector (텍스트 매칭 없음).
+    모바일 구분 행은 제외.
+    """
+    jobs: List[tuple] = []
+    if logical_table.n_cols < 3:
+        return jobs
+    for row_idx in range(1, logical_table.n_rows):
+        # 컬럼 구조: [구분, 분류, 제공API1, 제공API2, ...]
+        category_text = logical_table.text(row_idx, 0)
+        sub_category_text = logical_table.text(row_idx, 1) or None
+
+        # 구분 확인 (줄바꿈 변형 포함)
+        cfg = CATEGORY_CONFIG_NORM.get(_norm(category_text))
+        if not cfg or cfg["en"] in SKIP_CATEGORY_EN:
+            continue
+
+        # 제공API 셀들 (col 2부터)
+        for col_idx in range(2, logical_table.n_cols):
+            # 중복 클릭 방지: 병합 영역의 시작 칸(원본 셀)만 클릭, 빈 칸 표기는 제외
+            cell_info = logical_table.origin(row_idx, col_idx)
+            if cell_info is None or not cell_info["is_api"]:
+                continue
+
+            title = cell_info["text"]
+
+            cell_selector = (f"table tr:nth-child({cell_info['physical_row'] + 1})"
+                             f" > td:nth-child({cell_info['physical_col'] + 1})")
+            jobs.append((row_idx, col_idx, title, cfg["en"], category_text, sub_category_text,
+                         cell_info["guide_url"], cell_selector))
+    return jobs
+
+
+def _count_mobile_rows(logical_table: LogicalTable) -> int:
+    """모바일 구분 행 수 (요약 출력용)"""
+    count = 0
+    if logical_table.n_cols < 3:
+        return count
+    for row_idx in range(1, logical_table.n_rows):
+        cfg = CATEGORY_CONFIG_NORM.get(_norm(logical_table.text(row_idx, 0)))
+        if cfg and cfg["en"] in SKIP_CATEGORY_EN:
+            count += 1
+    return count
+
+
+def run(headless: bool = True, concurrency: int = CRAWL_CONCURRENCY) -> None:
+    """
+    guideList 표를 순회하며:
+    - 구분(category) / 분류(sub_category) / 제공API(title)
+    - 제공API 셀의 onclick/href로 guideResult 직접 요청 (실패 시 셀 클릭)
+      -> request_url/params/samples/target 추출
+      (하나의 브라우저 컨텍스트에서 concurrency개 페이지로 동시 처리)
+    - 구분별 JSON(18개) 생성 - 구분의 마지막 API가 끝나는 즉시 저장
+    - 모바일 구분은 전체 제외
+    - rowspan 처리: 논리적 테이블로 변환 후 처리
+    """
+    ensure_output_dir()
+
+    logical_table, jobs, pipeline = asyncio.run(_crawl_guide_pages(headless, concurrency))
+
+    print(f"[DEBUG] 논리적 테이블: {logical_table.n_rows}행 x {logical_table.n_cols}열")
+
+    # category_en -> ApiItem list (보완 포함, 파일 저장 완료 상태)
+    buckets = pipeline.buckets
+    failed_clicks = pipeline.failed_clicks
+    supplemented_count = pipeline.supplemented_count
+    total_cells_found = len(jobs)
+    skipped_mobile = _count_mobile_rows(logical_table)
 
     # 디버그 요약 출력
     total_extracted = sum(len(v) for v in buckets.values())
@@ -656,7 +1064,7 @@ def run(headless: bool = True) -> None:
     print("\n" + "="*70)
     print("[CRAWL SUMMARY]")
     print("="*70)
-    print(f"  논리적 테이블 행 수: {len(logical_table)}")
+    print(f"  논리적 테이블 행 수: {logical_table.n_rows}")
     print(f"  발견된 API 셀 수  : {total_cells_found}")
     print(f"  크롤링 성공       : {crawled_count}")
     print(f"  자동 보완         : {supplemented_count}")
@@ -699,7 +1107,7 @@ def run(headless: bool = True) -> None:
     summary = {
         "crawl_date": _today(),
         "source_url": GUIDE_LIST_URL,
-        "table_rows": len(logical_table),
+        "table_rows": logical_table.n_rows,
         "api_cells_found": total_cells_found,
         "crawled_success": crawled_count,
         "auto_supplemented": supplemented_count,
@@ -713,38 +1121,10 @@ def run(headless: bool = True) -> None:
         "category_counts": {k: len(v) for k, v in buckets.items()},
     }
     summary_path = OUTPUT_DIR / "_crawl_summary.json"
-    summary_path.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8")
+    _write_json_atomic(summary_path, summary)
     print(f"[OK] 크롤링 요약 저장: {summary_path}\n")
 
-    # 파일 저장(18개) + id 재부여
-    # 중복 없이 각 category_en별로 한 번만 저장
-    saved_categories = set()
-    for category_ko, cfg in CATEGORY_CONFIG.items():
-        category_en = cfg["en"]
-        filename = cfg["file"]
-
-        if category_en in SKIP_CATEGORY_EN:
-            continue
-
-        if category_en in saved_categories:
-            continue
-
-        items = buckets.get(category_en, [])
-        
-        # 빈 파일 생성하지 않음
-        if not items:
-            print(f"[SKIP] {category_ko.replace(chr(10), ' ')}({category_en}): 0개 - 빈 파일 생성 안함")
-            saved_categories.add(category_en)
-            continue
-        
-        for idx, it in enumerate(items, 1):
-            it.id = str(idx)
-
-        out = write_category_file(category_ko.replace("\n", " "), category_en, filename, items)
-        saved_categories.add(category_en)
-        print(f"[OK] {category_ko.replace(chr(10), ' ')}({category_en}): {len(items)} -> {out}")
-
 
 if __name__ == "__main__":
     headless = os.environ.get("HEADLESS", "1") != "0"
-    run(headless=headless)
+    run(headless=headless, concurrency=CRAWL_CONCURRENCY)
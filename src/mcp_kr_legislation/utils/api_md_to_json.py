@@ -10,16 +10,28 @@ extracted_apis.md를 구분별 JSON 파일로 변환
     
     기본 입력: skills/api-integration/extracted_apis.md
     출력: src/mcp_kr_legislation/utils/api_layout/*.json
+    
+    orjson이 설치되어 있으면 JSON 저장에 사용 (선택: uv pip install orjson)
 """
 
 from __future__ import annotations
 
 import json
+import mmap
+from bisect import bisect_right
+import os
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
+
+try:
+    import orjson  # type: ignore
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore
+    HAS_ORJSON = False
 
 
 # 출력 디렉토리
@@ -51,8 +63,41 @@ CATEGORY_FILE_MAP = {
     "특별행정심판": "special_tribunal",
 }
 
+# 역매핑: 영문명 -> 한글명
+CATEGORY_NAME_MAP = {v: k for k, v in CATEGORY_FILE_MAP.items()}
 
-@dataclass
+# 제목 그대로("법령", "법령 API")의 구분명 -> 영문명 (정규화 없이 한 번에 조회)
+_NORMALIZED_CATEGORY_MAP = {
+    **CATEGORY_FILE_MAP,
+    **{f"{k} API": v for k, v in CATEGORY_FILE_MAP.items()},
+}
+
+# 파싱 정규식 (모듈 로드 시 1회 컴파일)
+# 제목 패턴은 mmap 버퍼를 직접 훑는 bytes 패턴 (캡처한 제목만 디코딩)
+_CATEGORY_RE = re.compile(rb"^## (\d+)\. (.+)$", re.MULTILINE)
+_API_RE = re.compile(rb"^### (\d+\.\d+) (.+)$", re.MULTILINE)
+_TARGET_URL_RE = re.compile(r"target=([a-zA-Z0-9]+)")
+# 파라미터 표의 행 (| 이름 | 값 | 설명 |) - 헤더 행(파라미터/요청변수)은 정규식에서 제외
+# 구분선(|---)은 첫 칸이 \w가 아니므로 자연히 매치되지 않음
+_TABLE_ROW_RE = re.compile(
+    r"^[ \t]*\|\s*(?!(?:파라미터|요청변수)\s*\|)(\w+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|",
+    re.MULTILINE
+)
+# 샘플 URL 섹션: 표지 문구부터 다음 제목("\n##", "\n###" 포함) 또는 끝까지
+_SAMPLE_MARKER = "**샘플 URL**"
+_SAMPLE_LIST_RE = re.compile(r"-\s*(\w+)[:\s]*`([^`]+)`")
+# parse_api_section용 통합 패턴 - 요청 URL/target/표 행/샘플 항목을 한 번의 스캔으로 수집
+# (각 대안은 위 개별 패턴과 동일, 시작 문자가 서로 달라 같은 위치에서 겹치지 않음)
+_API_SECTION_RE = re.compile(
+    r"(?P<url>\*\*요청 URL\*\*[:\s]*`(?P<url_value>[^`]+)`)"
+    r"|(?P<target>\*\*target\*\*[:\s]*`(?P<target_value>[^`]+)`)"
+    r"|(?P<row>^[ \t]*\|\s*(?!(?:파라미터|요청변수)\s*\|)(?P<name>\w+)\s*\|\s*(?P<type>[^|]+)\s*\|\s*(?P<desc>[^|]+)\s*\|)"
+    r"|(?P<sample>-\s*(?P<fmt>\w+)[:\s]*`(?P<sample_url>[^`]+)`)",
+    re.MULTILINE
+)
+
+
+@dataclass(slots=True, frozen=True)
 class Parameter:
     """요청 파라미터"""
     name: str
@@ -60,14 +105,14 @@ class Parameter:
     description: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SampleUrl:
     """샘플 URL"""
     format: str
     url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiInfo:
     """API 정보"""
     id: str
@@ -83,75 +128,132 @@ def parse_markdown_file(filepath: Path) -> Dict[str, List[ApiInfo]]:
     """
     Markdown 파일 파싱
     
+    파일 전체를 str로 읽지 않고 mmap으로 매핑하여 제목 정규식이 버퍼를 직접 훑고,
+    API 섹션 단위로만 잘라 디코딩합니다.
+    
     Returns:
         Dict[카테고리 영문명, List[ApiInfo]]
     """
-    with open(filepath, "r", encoding="utf-8") as f:
-        content = f.read()
+    with open(filepath, "rb") as f:
+        # 빈 파일은 mmap할 수 없음
+        if os.fstat(f.fileno()).st_size == 0:
+            return {}
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            # 매치 객체가 버퍼를 참조하므로 mmap을 닫기 전에 파싱 함수의 지역 변수가 모두 해제되어야 함
+            return _parse_markdown_content(content)
+
+
+def _parse_markdown_content(content: mmap.mmap) -> Dict[str, List[ApiInfo]]:
+    """
+    mmap 버퍼에서 카테고리/API 섹션 분리 후 파싱
     
+    카테고리 제목과 API 제목을 각각 문서 전체에 대해 한 번씩만 훑고,
+    API는 시작 위치로 소속 카테고리를 이진 탐색하여 배정합니다.
+    """
     results: Dict[str, List[ApiInfo]] = {}
     
     # 카테고리 섹션 분리 (## N. 카테고리명)
-    category_pattern = re.compile(r"^## (\d+)\. (.+)$", re.MULTILINE)
-    category_matches = list(category_pattern.finditer(content))
+    # 카테고리 시작 위치와 (끝 위치, 영문명 - 제외 카테고리는 None)
+    category_starts: List[int] = []
+    category_bounds: List[tuple] = []
+    category_matches = list(_CATEGORY_RE.finditer(content))
     
     for i, match in enumerate(category_matches):
-        cat_num = match.group(1)
-        cat_name = match.group(2).strip()
+        cat_num = match.group(1).decode("utf-8")
+        cat_name = match.group(2).decode("utf-8").strip()
+        
+        # 카테고리 섹션 범위 결정 (복사 없이 위치만 사용)
+        start = match.end()
+        end = category_matches[i + 1].start() if i + 1 < len(category_matches) else len(content)
+        category_starts.append(start)
         
         # 모바일 제외
         if any(exc in cat_name for exc in EXCLUDED_CATEGORIES):
             print(f"  제외: {cat_num}. {cat_name}")
+            category_bounds.append((end, None))
             continue
         
-        # 카테고리 섹션 범위 결정
-        start = match.end()
-        end = category_matches[i + 1].start() if i + 1 < len(category_matches) else len(content)
-        section = content[start:end]
-        
         # 카테고리 영문명 결정
-        # 이름에서 "API" 제거하고 매핑
-        cat_name_clean = cat_name.replace(" API", "").strip()
-        category_en = CATEGORY_FILE_MAP.get(cat_name_clean, 
-                                            cat_name_clean.lower().replace(" ", "_"))
+        category_en = _NORMALIZED_CATEGORY_MAP.get(cat_name)
+        if category_en is None:
+            # 매핑에 없는 이름: "API" 제거 후 매핑, 없으면 소문자/밑줄 변환
+            cat_name_clean = cat_name.replace(" API", "").strip()
+            category_en = CATEGORY_FILE_MAP.get(cat_name_clean, 
+                                                cat_name_clean.lower().replace(" ", "_"))
         
         if category_en not in results:
             results[category_en] = []
+        category_bounds.append((end, category_en))
+    
+    # API 섹션 파싱 (### N.M API명) - 문서 전체 1회 스캔
+    api_matches = list(_API_RE.finditer(content))
+    
+    for j, api_match in enumerate(api_matches):
+        # 소속 카테고리 (첫 카테고리 이전이거나 제외 카테고리면 건너뜀)
+        cat_idx = bisect_right(category_starts, api_match.start()) - 1
+        if cat_idx < 0:
+            continue
+        cat_end, category_en = category_bounds[cat_idx]
+        if category_en is None:
+            continue
         
-        # API 섹션 파싱 (### N.M API명)
-        api_pattern = re.compile(r"^### (\d+\.\d+) (.+)$", re.MULTILINE)
-        api_matches = list(api_pattern.finditer(section))
+        api_id = api_match.group(1).decode("utf-8")
+        api_title = api_match.group(2).decode("utf-8").strip()
         
-        for j, api_match in enumerate(api_matches):
-            api_id = api_match.group(1)
-            api_title = api_match.group(2).strip()
-            
-            # API 섹션 범위
-            api_start = api_match.end()
-            api_end = api_matches[j + 1].start() if j + 1 < len(api_matches) else len(section)
-            api_section = section[api_start:api_end]
-            
-            # API 정보 추출
-            api_info = parse_api_section(api_id, api_title, api_section)
-            if api_info:
-                results[category_en].append(api_info)
+        # API 섹션 범위 (다음 API 또는 카테고리 끝까지)
+        api_start = api_match.end()
+        api_end = min(api_matches[j + 1].start(), cat_end) if j + 1 < len(api_matches) else cat_end
+        api_section = content[api_start:api_end].decode("utf-8")
+        
+        # API 정보 추출
+        api_info = parse_api_section(api_id, api_title, api_section)
+        if api_info:
+            results[category_en].append(api_info)
     
     return results
 
 
 def parse_api_section(api_id: str, title: str, section: str) -> Optional[ApiInfo]:
-    """API 섹션 파싱"""
-    # 요청 URL 추출
-    url_match = re.search(r"\*\*요청 URL\*\*[:\s]*`([^`]+)`", section)
-    request_url = url_match.group(1) if url_match else ""
+    """
+    API 섹션 파싱
+    
+    요청 URL, target, 파라미터 표, 샘플 URL을 _API_SECTION_RE 한 번의 스캔으로 수집합니다.
+    (URL/target은 첫 매치, 표 행은 "|---" 이후, 샘플은 샘플 URL 섹션 안의 매치만 사용)
+    """
+    request_url = None
+    target = None
+    parameters = []
+    sample_urls = []
     
-    # target 추출
-    target_match = re.search(r"\*\*target\*\*[:\s]*`([^`]+)`", section)
-    target = target_match.group(1) if target_match else ""
+    table_start = section.find("|---")
+    sample_bounds = _sample_bounds(section)
+    
+    for m in _API_SECTION_RE.finditer(section):
+        kind = m.lastgroup
+        if kind == "url":
+            if request_url is None:
+                request_url = m.group("url_value")
+        elif kind == "target":
+            if target is None:
+                target = m.group("target_value")
+        elif kind == "row":
+            if table_start != -1 and m.start() >= table_start:
+                parameters.append(Parameter(
+                    name=m.group("name"),
+                    type=m.group("type").strip(),
+                    description=m.group("desc").strip()
+                ))
+        elif sample_bounds and sample_bounds[0] <= m.start() and m.end() <= sample_bounds[1]:
+            sample_urls.append(SampleUrl(
+                format=_sample_format(m.group("fmt")), url=m.group("sample_url")
+            ))
+    
+    request_url = request_url or ""
+    target = target or ""
     
     # target이 없으면 URL에서 추출
     if not target and request_url:
-        target_from_url = re.search(r"target=([a-zA-Z0-9]+)", request_url)
+        target_from_url = _TARGET_URL_RE.search(request_url)
         target = target_from_url.group(1) if target_from_url else ""
     
     # API 타입 결정
@@ -160,12 +262,6 @@ def parse_api_section(api_id: str, title: str, section: str) -> Optional[ApiInfo
     else:
         api_type = "목록조회"
     
-    # 파라미터 테이블 파싱
-    parameters = parse_parameter_table(section)
-    
-    # 샘플 URL 파싱
-    sample_urls = parse_sample_urls(section)
-    
     return ApiInfo(
         id=api_id,
         title=title,
@@ -179,119 +275,120 @@ def parse_api_section(api_id: str, title: str, section: str) -> Optional[ApiInfo
 
 def parse_parameter_table(section: str) -> List[Parameter]:
     """파라미터 테이블 파싱"""
-    parameters = []
-    
-    # 테이블 형식: | 파라미터 | 값 | 설명 |
-    table_pattern = re.compile(
-        r"\|\s*(\w+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|",
-        re.MULTILINE
-    )
-    
     # 헤더 라인 스킵을 위해 "---" 이후만 파싱
     table_start = section.find("|---")
     if table_start == -1:
-        return parameters
+        return []
     
-    table_section = section[table_start:]
-    
-    for match in table_pattern.finditer(table_section):
-        name = match.group(1).strip()
-        param_type = match.group(2).strip()
-        desc = match.group(3).strip()
-        
-        # 헤더 행 스킵
-        if name in ("파라미터", "---", "요청변수"):
-            continue
-        
-        # 구분선 스킵
-        if "-" * 3 in name:
-            continue
-        
-        parameters.append(Parameter(
-            name=name,
-            type=param_type,
-            description=desc
-        ))
-    
-    return parameters
+    return [
+        Parameter(name=m.group(1), type=m.group(2).strip(), description=m.group(3).strip())
+        for m in _TABLE_ROW_RE.finditer(section, table_start)
+    ]
+
+
+def _sample_bounds(section: str) -> Optional[Tuple[int, int]]:
+    """샘플 URL 섹션의 (시작, 끝) 위치 - 섹션이 없으면 None"""
+    # 정규식 대신 위치만 구해 그 범위에서 바로 리스트를 훑음
+    anchor = section.find(_SAMPLE_MARKER)
+    if anchor == -1:
+        return None
+    # 표지 뒤의 콜론/공백은 섹션 본문에서 제외 (다음 제목 탐색도 그 뒤부터)
+    start = anchor + len(_SAMPLE_MARKER)
+    size = len(section)
+    while start < size and (section[start] == ":" or section[start].isspace()):
+        start += 1
+    end = section.find("\n##", start)
+    if end == -1:
+        end = size
+    return start, end
+
+
+def _sample_format(fmt: str) -> str:
+    """샘플 URL 포맷 정규화 (XML/JSON/HTML, 그 외 "기타")"""
+    fmt = fmt.upper()
+    if fmt not in ("XML", "JSON", "HTML"):
+        if "XML" in fmt:
+            fmt = "XML"
+        elif "JSON" in fmt:
+            fmt = "JSON"
+        elif "HTML" in fmt:
+            fmt = "HTML"
+        else:
+            fmt = "기타"
+    return fmt
 
 
 def parse_sample_urls(section: str) -> List[SampleUrl]:
     """샘플 URL 파싱"""
-    samples = []
-    
-    # 샘플 URL 섹션 찾기
-    sample_section_match = re.search(r"\*\*샘플 URL\*\*[:\s]*([\s\S]*?)(?=\n###|\n##|\Z)", section)
-    if not sample_section_match:
-        return samples
-    
-    sample_section = sample_section_match.group(1)
+    bounds = _sample_bounds(section)
+    if bounds is None:
+        return []
     
     # 리스트 형식: - XML: `http://...`
-    list_pattern = re.compile(r"-\s*(\w+)[:\s]*`([^`]+)`")
-    
-    for match in list_pattern.finditer(sample_section):
-        fmt = match.group(1).upper()
-        url = match.group(2)
-        
-        # 포맷 정규화
-        if fmt not in ("XML", "JSON", "HTML"):
-            if "XML" in fmt.upper():
-                fmt = "XML"
-            elif "JSON" in fmt.upper():
-                fmt = "JSON"
-            elif "HTML" in fmt.upper():
-                fmt = "HTML"
-            else:
-                fmt = "기타"
-        
-        samples.append(SampleUrl(format=fmt, url=url))
-    
-    return samples
+    return [
+        SampleUrl(format=_sample_format(match.group(1)), url=match.group(2))
+        for match in _SAMPLE_LIST_RE.finditer(section, *bounds)
+    ]
+
+
+def _dumps(obj: Any) -> bytes:
+    """JSON 직렬화 (UTF-8, 2칸 들여쓰기) - orjson이 있으면 C 구현 사용"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _api_to_dict(api: ApiInfo) -> Dict[str, Any]:
+    """ApiInfo -> JSON 직렬화용 dict"""
+    return {
+        "id": api.id,
+        "title": api.title,
+        "request_url": api.request_url,
+        "target": api.target,
+        "api_type": api.api_type,
+        "parameters": [
+            {"name": p.name, "type": p.type, "description": p.description}
+            for p in api.parameters
+        ],
+        "sample_urls": [
+            {"format": s.format, "url": s.url}
+            for s in api.sample_urls
+        ]
+    }
 
 
 def save_category_json(category_en: str, apis: List[ApiInfo], 
                        category_name: str, output_dir: Path) -> Path:
-    """JSON 파일 저장"""
+    """
+    JSON 파일 저장
+    
+    전체 dict를 만들지 않고 헤더를 쓴 뒤 API를 하나씩 직렬화하여 기록합니다.
+    (json.dump(indent=2)로 한 번에 쓴 것과 같은 형식)
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
     
     filepath = output_dir / f"{category_en}.json"
     
-    data = {
+    header = {
         "category": category_name,
         "category_en": category_en,
         "updated_at": datetime.now().strftime("%Y-%m-%d"),
         "api_count": len(apis),
-        "apis": [
-            {
-                "id": api.id,
-                "title": api.title,
-                "request_url": api.request_url,
-                "target": api.target,
-                "api_type": api.api_type,
-                "parameters": [
-                    {"name": p.name, "type": p.type, "description": p.description}
-                    for p in api.parameters
-                ],
-                "sample_urls": [
-                    {"format": s.format, "url": s.url}
-                    for s in api.sample_urls
-                ]
-            }
-            for api in apis
-        ]
     }
     
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(filepath, "wb") as f:
+        # 닫는 "\n}"를 떼고 apis 배열을 이어 씀
+        f.write(_dumps(header)[:-2])
+        f.write(b',\n  "apis": [')
+        for i, api in enumerate(apis):
+            f.write(b",\n    " if i else b"\n    ")
+            # 배열 원소 깊이(4칸)에 맞춰 들여쓰기 - 문자열 안 줄바꿈은 \n으로 이스케이프되어 영향 없음
+            f.write(_dumps(_api_to_dict(api)).replace(b"\n", b"\n    "))
+        f.write(b"\n  ]\n}" if apis else b"]\n}")
     
     return filepath
 
 
-# 역매핑: 영문명 -> 한글명
-CATEGORY_NAME_MAP = {v: k for k, v in CATEGORY_FILE_MAP.items()}
-
-
 def main(input_file: Optional[str] = None) -> int:
     """메인 함수"""
     # 입력 파일 결정
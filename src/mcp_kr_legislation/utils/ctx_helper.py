@@ -3,10 +3,15 @@ MCP 컨텍스트 헬퍼 유틸리티
 """
 
 import logging
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Tuple
 
 logger = logging.getLogger("mcp-kr-legislation")
 
+# 마지막으로 정규화한 lifespan_context의 (원본, 결과)
+# FastMCP는 요청마다 Context를 새로 만들고(pydantic 모델이라 해시 불가) lifespan_context는 세션 내내 같은 객체이므로
+# ctx가 아니라 lifespan_context 객체의 동일성으로 정규화 결과를 재사용
+_last_lifespan: Optional[Tuple[Any, Any]] = None
+
 def _normalize_lifespan_context(lifespan_context: Any) -> Any:
     """
     lifespan_context를 정규화합니다.
@@ -30,6 +35,16 @@ def _normalize_lifespan_context(lifespan_context: Any) -> Any:
     
     return lifespan_context
 
+def _normalize_lifespan_context_cached(lifespan_context: Any) -> Any:
+    """직전과 같은 lifespan_context 객체면 정규화 결과를 재사용합니다."""
+    global _last_lifespan
+    cached = _last_lifespan
+    if cached is not None and cached[0] is lifespan_context:
+        return cached[1]
+    normalized = _normalize_lifespan_context(lifespan_context)
+    _last_lifespan = (lifespan_context, normalized)
+    return normalized
+
 def _get_context_from_ctx(ctx: Any) -> Optional[Any]:
     """
     MCPContext에서 LegislationContext를 추출합니다.
@@ -44,17 +59,18 @@ def _get_context_from_ctx(ctx: Any) -> Optional[Any]:
         return None
     
     try:
-        # ctx.request_context.lifespan_context 접근 시도
-        if hasattr(ctx, 'request_context'):
-            request_ctx = ctx.request_context
-            if hasattr(request_ctx, 'lifespan_context'):
-                lifespan_ctx = request_ctx.lifespan_context
-                return _normalize_lifespan_context(lifespan_ctx)
+        # ctx.request_context.lifespan_context 접근 시도 (속성당 조회 1회)
+        request_ctx = getattr(ctx, 'request_context', None)
+        if request_ctx is None:
+            return None
+        lifespan_ctx = getattr(request_ctx, 'lifespan_context', None)
+        if lifespan_ctx is None:
+            return None
+        return _normalize_lifespan_context_cached(lifespan_ctx)
     except Exception as e:
+        # 요청 밖에서 request_context 프로퍼티가 ValueError를 던지는 경우 등
         logger.debug(f"Context 추출 실패: {e}")
         return None
-    
-    return None
 
 def with_context(
     ctx: Optional[Any],
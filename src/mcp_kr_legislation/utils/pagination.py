@@ -0,0 +1,57 @@
+"""
+검색 API 다중 페이지 조회 유틸리티
+
+1페이지로 전체 건수를 확인한 뒤, 필요한 나머지 페이지를 동시에 요청합니다.
+"""
+
+import asyncio
+import math
+from typing import AsyncIterator, Awaitable, Callable, List, Tuple
+
+# fetch_page(page) -> (해당 페이지 항목 목록, 전체 건수)
+FetchPage = Callable[[int], Awaitable[Tuple[List[dict], int]]]
+
+
+async def paginate(fetch_page: FetchPage, max_items: int, page_size: int,
+                   concurrency: int = 4) -> AsyncIterator[List[dict]]:
+    """페이지 순서대로 항목 목록을 yield 하는 비동기 제너레이터
+
+    Args:
+        fetch_page: 페이지 번호를 받아 (항목 목록, 전체 건수)를 반환하는 코루틴 함수
+        max_items: 최대 수집 항목 수
+        page_size: 페이지당 항목 수 (display)
+        concurrency: 동시 요청 수 상한
+    """
+    if max_items <= 0 or page_size <= 0:
+        return
+
+    items, total_count = await fetch_page(1)
+    yield items[:max_items]
+    if len(items) < page_size:
+        return
+
+    # 전체 건수와 요청 상한 중 작은 쪽 기준으로 필요한 페이지 수 계산
+    wanted = min(max_items, total_count) if total_count else max_items
+    last_page = math.ceil(wanted / page_size)
+    if last_page <= 1:
+        return
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _fetch(page: int) -> List[dict]:
+        async with semaphore:
+            page_items, _ = await fetch_page(page)
+        return page_items
+
+    pages = await asyncio.gather(*(_fetch(page) for page in range(2, last_page + 1)))
+
+    collected = len(items)
+    for page_items in pages:
+        remaining = max_items - collected
+        if remaining <= 0:
+            return
+        yield page_items[:remaining]
+        collected += len(page_items)
+        # 마지막 페이지(항목 수 부족) 이후는 무시
+        if len(page_items) < page_size:
+            return
@@ -0,0 +1,181 @@
+"""
+법제처 API 요청 결과 메모리 캐시 (TTL + LRU)
+
+동일한 target/params 조합의 반복 요청을 HTTP 왕복 없이 처리합니다.
+상세조회(ID/MST) 결과는 변하지 않으므로 검색보다 긴 TTL을 사용합니다.
+선고/결정이 끝난 판례·결정례 본문은 DiskCache로 디스크에 저장해 프로세스 재시작 후에도 재사용합니다.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기본 TTL (초)
+SEARCH_TTL = 300      # 검색 결과: 5분
+DETAIL_TTL = 3600     # 상세조회 결과: 1시간
+DEFAULT_MAXSIZE = 512
+DISK_SIZE_LIMIT = 500 * 2 ** 20  # 디스크 캐시 용량 상한: 500MB
+EVICT_CHECK_INTERVAL = 64
+
+
+class TTLCache:
+    """스레드 안전 TTL + LRU 캐시"""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """(적중 여부, 값) 반환 - 만료된 항목은 삭제"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return False, None
+            self._data.move_to_end(key)
+            return True, value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """값 저장 - 용량 초과 시 가장 오래 사용되지 않은 항목부터 제거"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def cached_request(ttl: float = SEARCH_TTL, detail_ttl: float = DETAIL_TTL,
+                   maxsize: int = DEFAULT_MAXSIZE) -> Callable:
+    """`(target, params, is_detail)` 시그니처의 요청 함수를 캐시하는 데코레이터
+
+    - 키: (target, 정렬된 params 항목, is_detail)
+    - 오류 응답({"error": ...})이나 빈 응답, 예외는 캐시하지 않음
+    - 호출자가 결과 dict를 수정해도 캐시가 오염되지 않도록 복사본을 저장/반환
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = TTLCache(maxsize)
+
+        @wraps(func)
+        def wrapper(target: str, params: dict, is_detail: bool = False, *args, **kwargs):
+            try:
+                key = (target, tuple(sorted(params.items())), is_detail)
+                hash(key)
+            except TypeError:
+                # 해시 불가능한 파라미터는 캐시하지 않음
+                return func(target, params, is_detail, *args, **kwargs)
+
+            hit, value = cache.get(key)
+            if hit:
+                return copy.deepcopy(value)
+
+            result = func(target, params, is_detail, *args, **kwargs)
+            if result and isinstance(result, dict) and "error" not in result:
+                cache.set(key, copy.deepcopy(result), detail_ttl if is_detail else ttl)
+            return result
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+class DiskCache:
+    """키별 JSON 파일로 저장하는 디스크 캐시
+
+    - ttl이 None이면 만료 없음 (확정된 판례·결정례 본문용)
+    - 용량이 size_limit를 넘으면 가장 오래된 파일부터 삭제
+    - 디스크 오류는 경고만 남기고 캐시 미스로 처리
+    """
+
+    def __init__(self, directory: Path, ttl: Optional[float] = None,
+                 size_limit: int = DISK_SIZE_LIMIT):
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.size_limit = size_limit
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.md5(key.encode()).hexdigest()}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """저장된 값 반환 - 없거나 만료되었으면 None"""
+        path = self._path(key)
+        try:
+            if self.ttl is not None and path.stat().st_mtime + self.ttl < time.time():
+                path.unlink()
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"디스크 캐시 로드 실패 (API 호출로 대체됨): {e}")
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """값 저장 - 임시 파일에 쓴 뒤 교체하여 다른 프로세스/스레드가 반쯤 쓴 파일을 읽지 않도록 함
+        
+        임시 파일은 쓰기마다 고유한 이름으로 만들어, 같은 프로세스의 여러 스레드가
+        같은 키를 동시에 저장해도 서로의 임시 파일을 덮어쓰지 않습니다.
+        """
+        path = self._path(key)
+        tmp_path = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.directory,
+                                             prefix=f"{path.stem}.", suffix=".tmp",
+                                             delete=False) as f:
+                tmp_path = f.name
+                json.dump(value, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+            tmp_path = None
+            # 디렉토리 전체 스캔 비용을 줄이기 위해 일정 횟수마다 용량 확인
+            self._writes += 1
+            if self._writes % EVICT_CHECK_INTERVAL == 0:
+                self._evict()
+        except Exception as e:
+            logger.warning(f"디스크 캐시 저장 실패 (서비스는 계속됨): {e}")
+        finally:
+            # 교체 전에 실패했으면 남은 임시 파일 정리
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def _evict(self) -> None:
+        """용량 상한 초과 시 수정 시각이 오래된 파일부터 삭제"""
+        with self._lock:
+            entries = [(p.stat(), p) for p in self.directory.glob("*.json")]
+            total = sum(st.st_size for st, _ in entries)
+            if total <= self.size_limit:
+                return
+            for st, p in sorted(entries, key=lambda e: e[0].st_mtime):
+                p.unlink(missing_ok=True)
+                total -= st.st_size
+                if total <= self.size_limit:
+                    break
@@ -6,7 +6,54 @@ HTML 태그 제거 및 LLM 친화적 응답 생성을 위한 함수들
 
 import re
 import html
-from typing import Any, Dict, List, Optional, Union
+import io
+from typing import Any, Collection, Dict, List, Optional, Union
+
+# 태그와 공백을 한 번에 처리: 공백이 하나라도 섞인 (태그|공백) 연속 구간은 ' ', 태그만 있는 구간은 ''
+# (태그 제거 후 공백 정리를 따로 하는 것과 같은 결과)
+_CLEAN_RE = re.compile(r'(?P<ws>(?:<[^>]+>)*\s(?:<[^>]+>|\s)*)|(?:<[^>]+>)+')
+_WS_RE = re.compile(r'\s+')
+
+# 법제처 API 응답에 실제로 나오는 단순 엔티티 (그 외 엔티티는 html.unescape로 처리)
+_ENTITY_MAP = {
+    '&amp;': '&', '&lt;': '<', '&gt;': '>', '&quot;': '"',
+    '&#39;': "'", '&apos;': "'", '&nbsp;': '\xa0',
+}
+_ENTITY_RE = re.compile('|'.join(map(re.escape, _ENTITY_MAP)))
+
+# 카테고리별 핵심 필드 (extract_key_info)
+_KEY_FIELDS: Dict[str, tuple] = {
+    "law": ("법령명", "법령명한글", "법령일련번호", "시행일자", "공포일자", "소관부처명"),
+    "prec": ("사건명", "사건번호", "판례일련번호", "선고일자", "법원명"),
+    "detc": ("사건명", "사건번호", "헌재결정례일련번호", "종국일자"),
+    "committee": ("안건명", "결정문명", "의결일", "결정문일련번호"),
+    "admrul": ("행정규칙명", "행정규칙일련번호", "시행일자", "소관부처명"),
+    "ordin": ("자치법규명", "자치법규일련번호", "시행일자", "지자체기관명"),
+}
+_MISSING = object()
+
+# 마지막 문장 끝('.', '。', 줄바꿈) - 뒤에 더 이상 문장 끝이 없는 위치
+_LAST_SENTENCE_END_RE = re.compile(r'[.。\n][^.。\n]*\Z')
+
+# 검색 결과에서 정제가 필요한 필드들 (법령명, 사건명 등 <strong> 강조 태그가 붙는 필드)
+_SEARCH_RESULT_FIELDS = frozenset([
+    "법령명", "법령명한글", "법령명_한글", "법령명_영문",
+    "사건명", "안건명", "결정문명", "행정규칙명", "자치법규명",
+    "조약명", "용어명", "해석명", "조문내용", "조문제목",
+    "판결요지", "결정요지", "이유", "참조조문", "참조판례",
+])
+
+
+def _clean_repl(match: "re.Match[str]") -> str:
+    return ' ' if match.group('ws') is not None else ''
+
+
+def _unescape(text: str) -> str:
+    """HTML 엔티티 디코딩 - 모든 '&'가 단순 엔티티면 치환 표로, 아니면 html.unescape로 처리"""
+    decoded, count = _ENTITY_RE.subn(lambda m: _ENTITY_MAP[m.group(0)], text)
+    if count == text.count('&'):
+        return decoded
+    return html.unescape(text)
 
 
 def clean_html_tags(text: str) -> str:
@@ -27,26 +74,93 @@ def clean_html_tags(text: str) -> str:
     """
     if not text or not isinstance(text, str):
         return text or ""
+    return _clean_html_tags_str(text)
+
+
+def _clean_html_tags_str(text: str) -> str:
+    """clean_html_tags 본체 - 호출자가 str임을 보장하는 내부 경로용 (검사 생략)"""
+    # 태그/엔티티가 없는 값(날짜, 번호, 일반 이름 등)은 정규식 없이 공백만 정리
+    if '<' not in text and '&' not in text:
+        return ' '.join(text.split())
     
-    # HTML 태그 제거
-    text = re.sub(r'<[^>]+>', '', text)
-    
-    # HTML 엔티티 디코딩
-    text = html.unescape(text)
+    # HTML 태그 제거 + 연속 공백 정리 (한 번의 순회)
+    text = _CLEAN_RE.sub(_clean_repl, text)
     
-    # 연속 공백 정리
-    text = re.sub(r'\s+', ' ', text)
+    # HTML 엔티티 디코딩 - 엔티티가 있을 때만 (&nbsp; 등이 공백이 될 수 있어 다시 정리)
+    if '&' in text:
+        text = _WS_RE.sub(' ', _unescape(text))
     
     return text.strip()
 
 
-def clean_dict_values(data: Dict[str, Any], fields_to_clean: Optional[List[str]] = None) -> Dict[str, Any]:
+def _field_set(fields_to_clean: Optional[Collection[str]]) -> Optional[frozenset]:
+    """필드 목록을 O(1) 조회용 frozenset으로 변환 (비어 있으면 None = 모든 필드)"""
+    if not fields_to_clean:
+        return None
+    if isinstance(fields_to_clean, frozenset):
+        return fields_to_clean
+    return frozenset(fields_to_clean)
+
+
+def _walk_and_clean(root: Union[Dict[str, Any], List[Any]],
+                    fields: Optional[frozenset],
+                    cache: Optional[Dict[str, str]] = None) -> Union[Dict[str, Any], List[Any]]:
+    """
+    중첩 dict/list를 명시적 스택으로 순회하며 문자열 값의 HTML 태그를 제거합니다.
+    
+    하위 컨테이너는 빈 결과 컨테이너를 먼저 제자리에 넣어 두고 나중에 채우므로
+    키/항목 순서가 그대로 유지되고, 재귀 호출 없이 한 프레임 안에서 처리됩니다.
+    fields가 주어지면 dict에서 해당 키만 정제하고 나머지 키의 값은 그대로 둡니다.
+    값은 JSON에서 온 것이므로 isinstance 대신 type 동일성으로 분기합니다 (하위 클래스 값은 그대로 유지).
+    cache가 주어지면 원문 -> 정제 결과를 기록해 같은 문자열은 한 번만 정제합니다.
+    """
+    if cache is None:
+        clean = _clean_html_tags_str
+    else:
+        def clean(text: str) -> str:
+            cleaned = cache.get(text)
+            if cleaned is None:
+                cleaned = cache[text] = _clean_html_tags_str(text)
+            return cleaned
+    
+    result: Union[Dict[str, Any], List[Any]] = {} if isinstance(root, dict) else []
+    stack = [(root, result)]
+    while stack:
+        source, target = stack.pop()
+        if isinstance(source, dict):
+            for key, value in source.items():
+                if fields is not None and key not in fields:
+                    target[key] = value
+                elif (value_type := type(value)) is str:
+                    target[key] = clean(value)
+                elif value_type is dict or value_type is list:
+                    child = {} if value_type is dict else []
+                    target[key] = child
+                    if value:
+                        stack.append((value, child))
+                else:
+                    target[key] = value
+        else:
+            for item in source:
+                if (item_type := type(item)) is str:
+                    target.append(clean(item))
+                elif item_type is dict or item_type is list:
+                    child = {} if item_type is dict else []
+                    target.append(child)
+                    if item:
+                        stack.append((item, child))
+                else:
+                    target.append(item)
+    return result
+
+
+def clean_dict_values(data: Dict[str, Any], fields_to_clean: Optional[Collection[str]] = None) -> Dict[str, Any]:
     """
     딕셔너리의 문자열 값에서 HTML 태그를 제거합니다.
     
     Args:
         data: 정제할 딕셔너리
-        fields_to_clean: 정제할 필드 목록 (None이면 모든 문자열 필드)
+        fields_to_clean: 정제할 필드 목록 또는 집합 (None이면 모든 문자열 필드)
         
     Returns:
         정제된 딕셔너리
@@ -54,29 +168,16 @@ def clean_dict_values(data: Dict[str, Any], fields_to_clean: Optional[List[str]]
     if not data or not isinstance(data, dict):
         return data or {}
     
-    result = {}
-    for key, value in data.items():
-        if fields_to_clean and key not in fields_to_clean:
-            result[key] = value
-        elif isinstance(value, str):
-            result[key] = clean_html_tags(value)
-        elif isinstance(value, dict):
-            result[key] = clean_dict_values(value, fields_to_clean)
-        elif isinstance(value, list):
-            result[key] = clean_list_values(value, fields_to_clean)
-        else:
-            result[key] = value
-    
-    return result
+    return _walk_and_clean(data, _field_set(fields_to_clean))
 
 
-def clean_list_values(data: List[Any], fields_to_clean: Optional[List[str]] = None) -> List[Any]:
+def clean_list_values(data: List[Any], fields_to_clean: Optional[Collection[str]] = None) -> List[Any]:
     """
     리스트 내 딕셔너리의 문자열 값에서 HTML 태그를 제거합니다.
     
     Args:
         data: 정제할 리스트
-        fields_to_clean: 정제할 필드 목록
+        fields_to_clean: 정제할 필드 목록 또는 집합
         
     Returns:
         정제된 리스트
@@ -84,21 +185,11 @@ def clean_list_values(data: List[Any], fields_to_clean: Optional[List[str]] = No
     if not data or not isinstance(data, list):
         return data or []
     
-    result = []
-    for item in data:
-        if isinstance(item, dict):
-            result.append(clean_dict_values(item, fields_to_clean))
-        elif isinstance(item, str):
-            result.append(clean_html_tags(item))
-        elif isinstance(item, list):
-            result.append(clean_list_values(item, fields_to_clean))
-        else:
-            result.append(item)
-    
-    return result
+    return _walk_and_clean(data, _field_set(fields_to_clean))
 
 
-def clean_search_result(result: Dict[str, Any]) -> Dict[str, Any]:
+def clean_search_result(result: Dict[str, Any], *,
+                        cache: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
     """
     검색 결과에서 HTML 태그를 제거합니다.
     
@@ -106,19 +197,15 @@ def clean_search_result(result: Dict[str, Any]) -> Dict[str, Any]:
     
     Args:
         result: API 검색 결과 딕셔너리
+        cache: 여러 항목에 걸쳐 공유할 정제 결과 캐시 (같은 기관명/구분명 등을 한 번만 정제)
         
     Returns:
         정제된 검색 결과
     """
-    # 정제가 필요한 필드들
-    fields_to_clean = [
-        "법령명", "법령명한글", "법령명_한글", "법령명_영문",
-        "사건명", "안건명", "결정문명", "행정규칙명", "자치법규명",
-        "조약명", "용어명", "해석명", "조문내용", "조문제목",
-        "판결요지", "결정요지", "이유", "참조조문", "참조판례",
-    ]
+    if not result or not isinstance(result, dict):
+        return result or {}
     
-    return clean_dict_values(result, fields_to_clean)
+    return _walk_and_clean(result, _SEARCH_RESULT_FIELDS, cache)
 
 
 def truncate_for_llm(text: str, max_chars: int = 2000, suffix: str = "...") -> str:
@@ -139,15 +226,10 @@ def truncate_for_llm(text: str, max_chars: int = 2000, suffix: str = "...") -> s
     # 문장 단위로 자르기 시도
     truncated = text[:max_chars]
     
-    # 마지막 문장 끝 찾기
-    last_period = max(
-        truncated.rfind('.'),
-        truncated.rfind('。'),
-        truncated.rfind('\n')
-    )
-    
-    if last_period > max_chars * 0.7:  # 70% 이상 위치에 문장 끝이 있으면
-        truncated = truncated[:last_period + 1]
+    # 70% 이상 위치에 문장 끝이 있으면 그 뒤를 잘라냄 (해당 구간만 한 번 탐색)
+    match = _LAST_SENTENCE_END_RE.search(truncated, int(max_chars * 0.7) + 1)
+    if match:
+        truncated = truncated[:match.start() + 1]
     
     return truncated + suffix
 
@@ -175,13 +257,13 @@ def format_for_llm(data: Union[Dict, List, str], max_items: int = 10) -> str:
                 key_fields = ["법령명", "법령명한글", "사건명", "안건명", "법령일련번호", 
                              "판례일련번호", "결정문일련번호", "선고일자", "의결일"]
                 item_str = ", ".join(
-                    f"{k}: {clean_html_tags(str(v)[:100])}" 
+                    f"{k}: {_clean_html_tags_str(str(v)[:100])}" 
                     for k, v in item.items() 
                     if k in key_fields and v
                 )
                 result_parts.append(f"{i}. {item_str}")
             else:
-                result_parts.append(f"{i}. {clean_html_tags(str(item)[:200])}")
+                result_parts.append(f"{i}. {_clean_html_tags_str(str(item)[:200])}")
         
         if len(data) > max_items:
             result_parts.append(f"... 외 {len(data) - max_items}건")
@@ -189,14 +271,12 @@ def format_for_llm(data: Union[Dict, List, str], max_items: int = 10) -> str:
         return "\n".join(result_parts)
     
     if isinstance(data, dict):
-        # 딕셔너리를 읽기 좋은 형태로
-        lines = []
-        for k, v in data.items():
-            if isinstance(v, (dict, list)):
-                continue  # 중첩 데이터는 생략
-            v_str = clean_html_tags(str(v))[:200]
-            lines.append(f"- {k}: {v_str}")
-        return "\n".join(lines)
+        # 딕셔너리를 읽기 좋은 형태로 (중첩 데이터는 생략)
+        return "\n".join(
+            f"- {k}: {_clean_html_tags_str(str(v))[:200]}"
+            for k, v in data.items()
+            if not isinstance(v, (dict, list))
+        )
     
     return str(data)
 
@@ -212,27 +292,12 @@ def extract_key_info(result: Dict[str, Any], category: str = "law") -> Dict[str,
     Returns:
         핵심 정보만 담긴 딕셔너리
     """
-    # 카테고리별 핵심 필드
-    key_fields = {
-        "law": ["법령명", "법령명한글", "법령일련번호", "시행일자", "공포일자", "소관부처명"],
-        "prec": ["사건명", "사건번호", "판례일련번호", "선고일자", "법원명"],
-        "detc": ["사건명", "사건번호", "헌재결정례일련번호", "종국일자"],
-        "committee": ["안건명", "결정문명", "의결일", "결정문일련번호"],
-        "admrul": ["행정규칙명", "행정규칙일련번호", "시행일자", "소관부처명"],
-        "ordin": ["자치법규명", "자치법규일련번호", "시행일자", "지자체기관명"],
+    fields = _KEY_FIELDS.get(category, _KEY_FIELDS["law"])
+    return {
+        field: _clean_html_tags_str(value) if type(value) is str else value
+        for field in fields
+        if (value := result.get(field, _MISSING)) is not _MISSING
     }
-    
-    fields = key_fields.get(category, list(key_fields["law"]))
-    
-    extracted = {}
-    for field in fields:
-        if field in result:
-            value = result[field]
-            if isinstance(value, str):
-                value = clean_html_tags(value)
-            extracted[field] = value
-    
-    return extracted
 
 
 def summarize_search_results(
@@ -254,8 +319,8 @@ def summarize_search_results(
     if not items:
         return "검색 결과가 없습니다."
     
-    lines = [f"총 {len(items)}건 검색됨 (상위 {min(len(items), max_items)}건 표시)"]
-    lines.append("")
+    buf = io.StringIO()
+    buf.write(f"총 {len(items)}건 검색됨 (상위 {min(len(items), max_items)}건 표시)\n")
     
     for i, item in enumerate(items[:max_items], 1):
         info = extract_key_info(item, category)
@@ -264,26 +329,26 @@ def summarize_search_results(
         if category == "law":
             name = info.get("법령명한글") or info.get("법령명", "N/A")
             date = info.get("시행일자", "N/A")
-            lines.append(f"{i}. {name} (시행: {date})")
+            buf.write(f"\n{i}. {name} (시행: {date})")
         elif category == "prec":
             name = info.get("사건명", "N/A")
             date = info.get("선고일자", "N/A")
             court = info.get("법원명", "")
-            lines.append(f"{i}. {name} ({court}, {date})")
+            buf.write(f"\n{i}. {name} ({court}, {date})")
         elif category == "detc":
             name = info.get("사건명", "N/A")
             date = info.get("종국일자", "N/A")
-            lines.append(f"{i}. {name} ({date})")
+            buf.write(f"\n{i}. {name} ({date})")
         elif category == "committee":
             name = info.get("안건명") or info.get("결정문명", "N/A")
             date = info.get("의결일", "N/A")
-            lines.append(f"{i}. {name} ({date})")
+            buf.write(f"\n{i}. {name} ({date})")
         else:
             # 기본 포맷
             first_value = next((v for v in info.values() if v), "N/A")
-            lines.append(f"{i}. {first_value}")
+            buf.write(f"\n{i}. {first_value}")
     
     if len(items) > max_items:
-        lines.append(f"\n... 외 {len(items) - max_items}건")
+        buf.write(f"\n\n... 외 {len(items) - max_items}건")
     
-    return "\n".join(lines)
+    return buf.getvalue()
@@ -6,13 +6,55 @@ API 응답 구조 정규화 파서
 
 import re
 import logging
-from typing import Any, Dict, List, Optional, Tuple
-from bs4 import BeautifulSoup
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
 
 from .response_cleaner import clean_html_tags, clean_search_result
 
+# lxml은 선택 의존성 (설치되어 있으면 C 구현 파서 사용, 대용량 판례 HTML 파싱 비용 절감)
+try:
+    import lxml.etree  # type: ignore
+    import lxml.html  # type: ignore
+    HAS_LXML = True
+except ImportError:
+    lxml = None  # type: ignore
+    HAS_LXML = False
+
 logger = logging.getLogger(__name__)
 
+_HTML_PARSER = "lxml" if HAS_LXML else "html.parser"
+
+# 일반 HTML은 제목/본문만 사용하므로 해당 태그만 트리로 만듦 (head/meta/link 등은 생성하지 않음)
+# (판례·결정례·해석례 파서는 문서 전체의 문자열/형제 관계를 훑으므로 제한하지 않음)
+_GENERIC_STRAINER = SoupStrainer(['h1', 'h2', 'h3', 'body'])
+_FULL_TREE_TYPES = frozenset({"precedent", "detc", "expc"})
+
+# 일반 HTML 본문 최대 길이와, 긴 본문에서 먼저 정제해 볼 앞부분 길이
+_GENERIC_TEXT_LIMIT = 5000
+_GENERIC_CLEAN_WINDOW = 20000
+# 잘린 경계에서 생기는 차이(공백/엔티티 조각)가 결과에 섞이지 않도록 남겨 두는 여유분
+_CLEAN_WINDOW_MARGIN = 64
+
+# 상세 HTML 본문 섹션 이름 (결과 키 순서) 및 한 번의 트리 순회용 통합 패턴
+_PREC_SECTIONS = ('판결요지', '이유', '주문', '판시사항')
+_DETC_SECTIONS = ('결정요지', '이유', '주문', '결정내용')
+_EXPC_SECTIONS = ('질의요지', '회신내용', '이유', '해석내용')
+_PREC_RE = re.compile('|'.join(_PREC_SECTIONS))
+_DETC_RE = re.compile('|'.join(_DETC_SECTIONS))
+_EXPC_RE = re.compile('|'.join(_EXPC_SECTIONS))
+
+# 결정례 HTML이 "<tr><th>키</th><td>값</td></tr>" 행만 있는 단순 표일 때 BeautifulSoup 없이 추출
+_ATTRS = r"""(?:\s(?:[^>"']|"[^"]*"|'[^']*')*)?"""
+_TR_PAIR_RE = re.compile(
+    rf'<tr{_ATTRS}>\s*<th{_ATTRS}>(.*?)</th>\s*<td{_ATTRS}>(.*?)</td>\s*</tr>',
+    re.DOTALL | re.IGNORECASE
+)
+# 칸 내용이 이 패턴에 걸리면 파서 결과와 달라질 수 있으므로 빠른 경로를 쓰지 않음
+# (엔티티, 따옴표가 든 속성, 태그가 아닌 '<', 중첩 표/칸 태그)
+_UNSAFE_CELL_RE = re.compile(r"""[&"']|<(?![A-Za-z/])|</?(?:t[dhr]|table)\b""", re.IGNORECASE)
+# 제목/본문 섹션이 있거나 get_text()가 제외하는 노드가 있을 수 있는 문서 (소문자 기준)
+_DETC_FAST_BLOCKERS = ('<h2', '<h3', '<!--', '<![cdata', '<script', '<style', '<template') + _DETC_SECTIONS
+
 
 # API별 응답 구조 매핑
 RESPONSE_STRUCTURE_MAP = {
@@ -70,6 +112,32 @@ RESPONSE_STRUCTURE_MAP = {
     "kmstSpecialDecc": ("DeccSearch", "Decc"),
 }
 
+# 바깥 키 -> 중복 없는 안쪽 키 목록 (target 없이 구조를 추정할 때 같은 조합을 반복 확인하지 않도록)
+_OUTER_TO_INNERS: Dict[str, Tuple[str, ...]] = {}
+for _outer_key, _inner_key in dict.fromkeys(RESPONSE_STRUCTURE_MAP.values()):
+    _OUTER_TO_INNERS[_outer_key] = _OUTER_TO_INNERS.get(_outer_key, ()) + (_inner_key,)
+del _outer_key, _inner_key
+
+# 구조 매핑에 없을 때 데이터가 직접 들어있는 키
+_DIRECT_KEYS = ("법령", "Law", "items", "data", "result")
+
+# target -> 카테고리 (알려진 target은 모두 포함, 그 밖의 CgmExpc/SpecialDecc 계열은 부분 문자열로 판별)
+_COMMITTEE_TARGETS = frozenset({
+    "ppc", "fsc", "ftc", "acr", "nlrc", "ecc", "sfc", "nhrck", "kcc", "iaciac", "oclt", "eiac"
+})
+_TARGET_TO_CATEGORY = {
+    "law": "law", "elaw": "law", "eflaw": "law",
+    "prec": "prec",
+    "detc": "detc",
+    "expc": "expc",
+    "decc": "decc",
+    **{t: "committee" for t in _COMMITTEE_TARGETS},
+    "admrul": "admrul",
+    "ordin": "ordin", "ordinfd": "ordin",
+    **{t: "interpretation" for t in RESPONSE_STRUCTURE_MAP if "CgmExpc" in t},
+    **{t: "tribunal" for t in RESPONSE_STRUCTURE_MAP if "SpecialDecc" in t},
+}
+
 
 def extract_items_from_response(
     result: Dict[str, Any], 
@@ -88,40 +156,43 @@ def extract_items_from_response(
     if not result:
         return [], 0, "응답 없음"
     
+    # 응답은 JSON 파싱 결과이므로 isinstance 대신 type 동일성으로 분기
     # 에러 응답 확인
-    if "Law" in result and isinstance(result["Law"], str):
-        return [], 0, result["Law"]
+    error_message = result.get("Law")
+    if type(error_message) is str:
+        return [], 0, error_message
     
     # target이 주어진 경우 해당 구조로 먼저 시도
-    if target and target in RESPONSE_STRUCTURE_MAP:
-        outer_key, inner_key = RESPONSE_STRUCTURE_MAP[target]
-        if outer_key in result:
-            inner = result[outer_key]
-            if isinstance(inner, dict):
-                items = inner.get(inner_key, [])
-                if isinstance(items, dict):
-                    items = [items]
-                if isinstance(items, list):
-                    return items, len(items), None
-    
-    # 알려진 모든 구조 시도
-    for outer_key, inner_key in RESPONSE_STRUCTURE_MAP.values():
-        if outer_key in result:
-            inner = result[outer_key]
-            if isinstance(inner, dict):
-                items = inner.get(inner_key, [])
-                if isinstance(items, dict):
-                    items = [items]
-                if isinstance(items, list) and items:
+    # (구조 매핑과 응답 모두 in 확인 후 다시 꺼내지 않고 get 한 번으로 조회)
+    structure = RESPONSE_STRUCTURE_MAP.get(target) if target else None
+    if structure is not None:
+        outer_key, inner_key = structure
+        inner = result.get(outer_key)
+        if type(inner) is dict:
+            items = inner.get(inner_key, [])
+            if type(items) is dict:
+                return [items], 1, None
+            if type(items) is list:
+                return items, len(items), None
+    
+    # 알려진 모든 구조 시도 - 응답의 최상위 키(보통 1~2개)로 구조를 바로 조회
+    for outer_key, inner in result.items():
+        inner_keys = _OUTER_TO_INNERS.get(outer_key)
+        if inner_keys is not None and type(inner) is dict:
+            for inner_key in inner_keys:
+                items = inner.get(inner_key)
+                if type(items) is dict:
+                    return [items], 1, None
+                if type(items) is list and items:
                     return items, len(items), None
     
     # 직접 데이터가 있는 경우
-    for key in ["법령", "Law", "items", "data", "result"]:
+    for key in _DIRECT_KEYS:
         if key in result:
             value = result[key]
-            if isinstance(value, list):
+            if (value_type := type(value)) is list:
                 return value, len(value), None
-            elif isinstance(value, dict):
+            elif value_type is dict:
                 return [value], 1, None
     
     return [], 0, "데이터 구조 파싱 실패"
@@ -130,7 +201,8 @@ def extract_items_from_response(
 def normalize_response(
     result: Dict[str, Any], 
     target: Optional[str] = None,
-    clean_html: bool = True
+    clean_html: bool = True,
+    debug: bool = False
 ) -> Dict[str, Any]:
     """
     API 응답을 정규화된 형태로 변환합니다.
@@ -139,6 +211,7 @@ def normalize_response(
         result: 원본 API 응답
         target: API target 값
         clean_html: HTML 태그 제거 여부
+        debug: True이면 원본 응답의 최상위 키 목록(raw_keys)을 채움
         
     Returns:
         정규화된 응답:
@@ -147,20 +220,22 @@ def normalize_response(
             "items": List[Dict],
             "total_count": int,
             "error": Optional[str],
-            "raw_keys": List[str]  # 디버깅용
+            "raw_keys": List[str]  # 디버깅용 (debug=True일 때만, 아니면 빈 목록)
         }
     """
     items, count, error = extract_items_from_response(result, target)
     
     if clean_html and items:
-        items = [clean_search_result(item) for item in items]
+        # 항목 간에 반복되는 문자열(기관명, 구분명 등)은 응답 단위 캐시로 한 번만 정제
+        cache: Dict[str, str] = {}
+        items = [clean_search_result(item, cache=cache) for item in items]
     
     return {
         "success": count > 0,
         "items": items,
         "total_count": count,
         "error": error,
-        "raw_keys": list(result.keys()) if result else []
+        "raw_keys": list(result.keys()) if (debug and result) else []
     }
 
 
@@ -180,8 +255,21 @@ def parse_html_detail(html_content: str, detail_type: str = "precedent") -> Dict
     if not html_content:
         return {"error": "HTML 내용 없음"}
     
+    # 단순 표 형태의 결정례는 정규식으로 바로 추출
+    if detail_type == "detc":
+        result = _parse_detc_table_only(html_content)
+        if result is not None:
+            return result
+    
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # 일반 HTML은 제목/본문 텍스트만 필요하므로 lxml이 있으면 BeautifulSoup 없이 처리
+        if HAS_LXML and detail_type not in _FULL_TREE_TYPES:
+            result = _parse_generic_lxml(html_content)
+            if result is not None:
+                return result
+        
+        parse_only = None if detail_type in _FULL_TREE_TYPES else _GENERIC_STRAINER
+        soup = BeautifulSoup(html_content, _HTML_PARSER, parse_only=parse_only)
         
         result = {}
         
@@ -205,30 +293,99 @@ def parse_html_detail(html_content: str, detail_type: str = "precedent") -> Dict
         return {"error": str(e)}
 
 
+def _parse_detc_table_only(html_content: str) -> Optional[Dict[str, Any]]:
+    """
+    제목/본문 섹션 없이 표 하나(th-td 행)만 있는 결정례 HTML을 정규식으로 파싱합니다.
+    
+    _parse_detc_html과 결과가 같다고 확인할 수 있는 경우에만 결과를 반환하고,
+    그 밖의 문서는 None을 반환해 BeautifulSoup 파싱으로 넘깁니다.
+    """
+    lowered = html_content.lower()
+    if lowered.count('<table') != 1 or any(b in lowered for b in _DETC_FAST_BLOCKERS):
+        return None
+    
+    pairs = _TR_PAIR_RE.findall(html_content)
+    # 모든 행이 th-td 두 칸 형태여야 함
+    if not pairs or len(pairs) != lowered.count('<tr'):
+        return None
+    
+    result = {}
+    for key_html, value_html in pairs:
+        if _UNSAFE_CELL_RE.search(key_html) or _UNSAFE_CELL_RE.search(value_html):
+            return None
+        key = clean_html_tags(key_html)
+        if key:
+            result[key] = clean_html_tags(value_html)
+    return result
+
+
+def _find_section_strings(soup: BeautifulSoup, pattern: re.Pattern,
+                          section_names: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    섹션 이름별로 그 이름을 포함하는 첫 문자열 노드를 찾음 (트리 1회 순회)
+    
+    find_all은 끝까지 훑은 뒤 목록을 만들므로, descendants를 직접 순회해
+    모든 섹션을 찾는 즉시 멈춥니다.
+    """
+    found = {}
+    for node in soup.descendants:
+        if not isinstance(node, NavigableString) or not pattern.search(node):
+            continue
+        # 한 문자열에 여러 섹션 이름이 있을 수 있으므로 남은 이름을 모두 확인
+        for name in section_names:
+            if name not in found and name in node:
+                found[name] = node
+        if len(found) == len(section_names):
+            break
+    return found
+
+
+def _table_pairs(table) -> Iterator[Tuple[str, str]]:
+    """표의 각 행에서 앞의 두 칸(th/td)을 (키, 값)으로 반환 - 두 칸 미만인 행은 건너뜀"""
+    for row in table.find_all('tr'):
+        # 앞의 두 칸만 필요하므로 나머지 칸은 찾지 않음
+        cells = row.find_all(['th', 'td'], limit=2)
+        if len(cells) == 2:
+            yield clean_html_tags(cells[0].get_text()), clean_html_tags(cells[1].get_text())
+
+
 def _parse_precedent_html(soup: BeautifulSoup) -> Dict[str, Any]:
-    """판례 HTML 파싱"""
+    """
+    판례 HTML 파싱
+    
+    제목 후보(h2/h3/title), 테이블, 섹션 이름 문자열을 문서 1회 순회로 모은 뒤
+    기존과 같은 순서(제목 -> 테이블 -> 본문 섹션)로 결과를 구성합니다.
+    """
     result = {}
     
-    # 제목 추출
-    title = soup.find('h2') or soup.find('h3') or soup.find('title')
+    first_tags: Dict[str, Any] = {}
+    tables = []
+    sections: Dict[str, Any] = {}
+    for el in soup.descendants:
+        if isinstance(el, NavigableString):
+            if len(sections) < len(_PREC_SECTIONS) and _PREC_RE.search(el):
+                for name in _PREC_SECTIONS:
+                    if name not in sections and name in el:
+                        sections[name] = el
+        elif el.name == 'table':
+            tables.append(el)
+        elif el.name in ('h2', 'h3', 'title') and el.name not in first_tags:
+            first_tags[el.name] = el
+    
+    # 제목 추출 (h2 > h3 > title 우선순위)
+    title = first_tags.get('h2') or first_tags.get('h3') or first_tags.get('title')
     if title:
         result['사건명'] = clean_html_tags(title.get_text())
     
     # 테이블에서 정보 추출
-    tables = soup.find_all('table')
     for table in tables:
-        rows = table.find_all('tr')
-        for row in rows:
-            cells = row.find_all(['th', 'td'])
-            if len(cells) >= 2:
-                key = clean_html_tags(cells[0].get_text())
-                value = clean_html_tags(cells[1].get_text())
-                if key and value:
-                    result[key] = value
+        for key, value in _table_pairs(table):
+            if key and value:
+                result[key] = value
     
     # 본문 내용 추출 (판결요지, 이유 등)
-    for section_name in ['판결요지', '이유', '주문', '판시사항']:
-        section = soup.find(string=re.compile(section_name))
+    for section_name in _PREC_SECTIONS:
+        section = sections.get(section_name)
         if section:
             parent = section.find_parent(['div', 'p', 'td'])
             if parent:
@@ -252,18 +409,14 @@ def _parse_detc_html(soup: BeautifulSoup) -> Dict[str, Any]:
     # 메타 정보 테이블
     meta_table = soup.find('table')
     if meta_table:
-        rows = meta_table.find_all('tr')
-        for row in rows:
-            cells = row.find_all(['th', 'td'])
-            if len(cells) >= 2:
-                key = clean_html_tags(cells[0].get_text())
-                value = clean_html_tags(cells[1].get_text())
-                if key:
-                    result[key] = value
+        for key, value in _table_pairs(meta_table):
+            if key:
+                result[key] = value
     
     # 결정요지
-    for section_name in ['결정요지', '이유', '주문', '결정내용']:
-        section = soup.find(string=re.compile(section_name))
+    sections = _find_section_strings(soup, _DETC_RE, _DETC_SECTIONS)
+    for section_name in _DETC_SECTIONS:
+        section = sections.get(section_name)
         if section:
             parent = section.find_parent()
             if parent:
@@ -284,8 +437,9 @@ def _parse_expc_html(soup: BeautifulSoup) -> Dict[str, Any]:
         result['안건명'] = clean_html_tags(title.get_text())
     
     # 질의/회신 내용
-    for section_name in ['질의요지', '회신내용', '이유', '해석내용']:
-        section = soup.find(string=re.compile(section_name))
+    sections = _find_section_strings(soup, _EXPC_RE, _EXPC_SECTIONS)
+    for section_name in _EXPC_SECTIONS:
+        section = sections.get(section_name)
         if section:
             parent = section.find_parent()
             if parent:
@@ -296,6 +450,23 @@ def _parse_expc_html(soup: BeautifulSoup) -> Dict[str, Any]:
     return result
 
 
+def _clean_text_head(text: str, limit: int) -> str:
+    """
+    clean_html_tags(text)와 앞 limit자가 같은 정제 결과를 반환합니다.
+    
+    긴 본문은 앞부분(_GENERIC_CLEAN_WINDOW)만 정제해 보고, 결과가 limit보다 충분히 길면 그대로 씁니다.
+    경계에 걸친 태그 모양 문자열("<...>")이 있거나 정제 후 길이가 모자라면 전체를 정제합니다.
+    """
+    if len(text) > _GENERIC_CLEAN_WINDOW:
+        cut = _GENERIC_CLEAN_WINDOW
+        # 마지막 '<' 뒤에 '>'가 있으면 경계를 넘는 태그 매치가 없음
+        if text.rfind('<', 0, cut) <= text.rfind('>', 0, cut):
+            head = clean_html_tags(text[:cut])
+            if len(head) > limit + _CLEAN_WINDOW_MARGIN:
+                return head
+    return clean_html_tags(text)
+
+
 def _parse_generic_html(soup: BeautifulSoup) -> Dict[str, Any]:
     """일반 HTML 파싱"""
     result = {}
@@ -308,13 +479,43 @@ def _parse_generic_html(soup: BeautifulSoup) -> Dict[str, Any]:
     # 본문 텍스트 추출
     body = soup.find('body')
     if body:
-        # 스크립트, 스타일 제거
-        for script in body.find_all(['script', 'style']):
-            script.decompose()
-        
-        text = clean_html_tags(body.get_text())
+        # 스크립트/스타일 내용은 get_text()가 제외하므로 (bs4 4.10+) 트리를 수정하지 않음
+        # 5000자만 쓰므로 긴 본문은 앞부분만 정제
+        text = _clean_text_head(body.get_text(), _GENERIC_TEXT_LIMIT)
+        if len(text) > 100:
+            result['내용'] = text[:_GENERIC_TEXT_LIMIT]  # 최대 5000자
+    
+    return result
+
+
+def _parse_generic_lxml(html_content: str) -> Optional[Dict[str, Any]]:
+    """
+    일반 HTML 파싱 (lxml.html 직접 사용) - _parse_generic_html과 같은 항목(제목, 내용) 추출
+    
+    lxml이 거부하는 문서(빈 문서, 인코딩 선언이 있는 str 등)는 None을 반환해
+    BeautifulSoup 경로로 넘깁니다.
+    """
+    try:
+        doc = lxml.html.document_fromstring(html_content)
+    except (ValueError, lxml.etree.LxmlError):
+        return None
+    
+    result = {}
+    
+    # 제목 (h1 > h2 > h3 우선순위) - lxml 요소는 자식이 없으면 거짓이므로 None과 비교
+    for tag in ('h1', 'h2', 'h3'):
+        title = next(doc.iter(tag), None)
+        if title is not None:
+            result['제목'] = clean_html_tags(title.text_content())
+            break
+    
+    # 본문 텍스트 추출 - get_text()처럼 스크립트/스타일/템플릿 내용은 제외 (뒤따르는 텍스트는 유지)
+    body = doc.find('body')
+    if body is not None:
+        lxml.etree.strip_elements(body, 'script', 'style', 'template', with_tail=False)
+        text = _clean_text_head(body.text_content(), _GENERIC_TEXT_LIMIT)
         if len(text) > 100:
-            result['내용'] = text[:5000]  # 최대 5000자
+            result['내용'] = text[:_GENERIC_TEXT_LIMIT]  # 최대 5000자
     
     return result
 
@@ -329,22 +530,9 @@ def get_category_from_target(target: str) -> str:
     Returns:
         카테고리 문자열 (law, prec, committee 등)
     """
-    if target in ["law", "elaw", "eflaw"]:
-        return "law"
-    elif target in ["prec"]:
-        return "prec"
-    elif target in ["detc"]:
-        return "detc"
-    elif target in ["expc"]:
-        return "expc"
-    elif target in ["decc"]:
-        return "decc"
-    elif target in ["ppc", "fsc", "ftc", "acr", "nlrc", "ecc", "sfc", "nhrck", "kcc", "iaciac", "oclt", "eiac"]:
-        return "committee"
-    elif target in ["admrul"]:
-        return "admrul"
-    elif target in ["ordin", "ordinfd"]:
-        return "ordin"
+    category = _TARGET_TO_CATEGORY.get(target)
+    if category is not None:
+        return category
     elif "CgmExpc" in target:
         return "interpretation"
     elif "SpecialDecc" in target: